@@ -0,0 +1,21 @@
+"""
+Hooks of the unit tests of the framework (see pytest_unittests.ini)
+"""
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Skip the benchmarks unless requested by the OCSCI_BENCHMARK environment
+    variable, they only log the measured numbers
+    """
+    if os.getenv('OCSCI_BENCHMARK'):
+        return
+    skip_benchmark = pytest.mark.skip(
+        reason="Benchmark, set OCSCI_BENCHMARK=1 to run it"
+    )
+    for item in items:
+        if item.get_closest_marker('benchmark'):
+            item.add_marker(skip_benchmark)
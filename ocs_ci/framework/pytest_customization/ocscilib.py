@@ -8,13 +8,17 @@ pytest which proccess config and passes all params to pytest.
 """
 import logging
 import os
+import re
 from getpass import getuser
 
 import pytest
 
 from ocs_ci.framework import config as ocsci_config
 from ocs_ci.framework.exceptions import ClusterPathNotProvidedError
+from ocs_ci.ocs import pod_exec, resource_cache
 from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility import command_stats
+from ocs_ci.utility.executor import Executor
 from ocs_ci.utility.utils import (
     dump_config_to_file,
     get_cluster_version,
@@ -134,20 +138,26 @@ def pytest_configure(config):
         config._metadata['Test Run Name'] = get_testrun_name()
 
         try:
+            # the versions are independent, collect them concurrently
+            with Executor(name='version collection') as executor:
+                for func in (
+                    get_cluster_version, get_ceph_version, get_rook_version,
+                    get_csi_versions,
+                ):
+                    executor.submit(func)
+            clusterversion, ceph_version, rook_version, csi_versions = (
+                executor.results()
+            )
             # add cluster version
-            clusterversion = get_cluster_version()
             config._metadata['Cluster Version'] = clusterversion
 
             # add ceph version
-            ceph_version = get_ceph_version()
             config._metadata['Ceph Version'] = ceph_version
 
             # add rook version
-            rook_version = get_rook_version()
             config._metadata['Rook Version'] = rook_version
 
             # add csi versions
-            csi_versions = get_csi_versions()
             config._metadata['csi-provisioner'] = csi_versions.get('csi-provisioner')
             config._metadata['cephfsplugin'] = csi_versions.get('csi-cephfsplugin')
             config._metadata['rbdplugin'] = csi_versions.get('csi-rbdplugin')
@@ -240,3 +250,49 @@ def pytest_runtest_makereport(item, call):
     ):
         test_case_name = item.name
         collect_ocs_logs(test_case_name)
+
+
+def get_command_stats_path(name):
+    """
+    Get the path of the JSON file with the command statistics
+
+    Args:
+        name (str): Name of the statistics scope (test node id or 'session')
+
+    Returns:
+        str: The path of the file
+    """
+    file_name = re.sub(r'[^\w.-]+', '_', name).strip('_')
+    return os.path.join(
+        os.path.expanduser(ocsci_config.RUN['log_dir']),
+        f"command_stats_{ocsci_config.RUN['run_id']}",
+        f"{file_name}.json",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Collect the latency statistics of the commands run by the test
+    """
+    command_stats.start_test(item.nodeid)
+    yield
+    stats = command_stats.finish_test()
+    if ocsci_config.RUN.get('command_stats') and stats.commands:
+        stats.dump(get_command_stats_path(item.nodeid))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Stop the watches of the session scoped resource cache, close the exec
+    sessions and dump the command statistics of the session
+    """
+    resource_cache.stop_all()
+    pod_exec.close_sessions()
+    stats = command_stats.session_stats
+    if ocsci_config.RUN.get('command_stats') and stats.commands:
+        stats.dump(get_command_stats_path('session'))
+        for slow in stats.report()['top_slowest']:
+            log.info(
+                f"Slow command: {slow['duration']:.2f}s {slow['command']}"
+            )
@@ -0,0 +1,272 @@
+"""
+asyncio variant of the OCP class
+
+AsyncOCP mirrors get/create/delete and the wait methods of OCP as coroutines
+running 'oc' by run_cmd_async(), so many operations can overlap on one event
+loop without a thread per call. The number of 'oc' processes running at once
+is limited by config.RUN['async_max_concurrency'].
+
+Example:
+    pvc_ocp = AsyncOCP(kind=constants.PVC, namespace=namespace)
+    run_coroutines(
+        pvc_ocp.create(yaml_file=pvc_yaml) for pvc_yaml in pvc_yamls
+    )
+"""
+import asyncio
+import logging
+import time
+
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP, get_manifest_input, get_status_from_data
+from ocs_ci.utility.utils import run_cmd_async
+
+log = logging.getLogger(__name__)
+
+
+def run_coroutines(coroutines, return_exceptions=False):
+    """
+    Run the coroutines concurrently on a new event loop and wait for all of
+    them, meant to be used from the synchronous test code
+
+    Args:
+        coroutines (iterable): The coroutines to run
+        return_exceptions (bool): True for returning the exceptions raised by
+            the coroutines as results, otherwise the first exception is
+            raised
+
+    Returns:
+        list: Results of the coroutines in the same order
+
+    """
+    async def gather():
+        return await asyncio.gather(
+            *coroutines, return_exceptions=return_exceptions
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(gather())
+    finally:
+        loop.close()
+
+
+class AsyncOCP(object):
+    """
+    An OCP object running the 'oc' commands asynchronously
+    """
+
+    def __init__(
+        self, api_version='v1', kind='Service', namespace=None,
+        resource_name=''
+    ):
+        """
+        Initializer function
+
+        Args:
+            api_version (str): The API version of the resource
+            kind (str): The kind of the resource
+            namespace (str): The name of the namespace to use
+            resource_name (str): Resource name
+        """
+        self.ocp = OCP(
+            api_version=api_version, kind=kind, namespace=namespace,
+            resource_name=resource_name
+        )
+
+    @property
+    def api_version(self):
+        return self.ocp.api_version
+
+    @property
+    def kind(self):
+        return self.ocp.kind
+
+    @property
+    def namespace(self):
+        return self.ocp.namespace
+
+    @property
+    def resource_name(self):
+        return self.ocp.resource_name
+
+    async def exec_oc_cmd(
+        self, command, out_yaml_format=True, secrets=None, timeout=None,
+        **kwargs
+    ):
+        """
+        Executing 'oc' command
+
+        Args:
+            command (str): The command to execute (e.g. create -f file.yaml)
+                without the initial 'oc' at the beginning
+            out_yaml_format (bool): whether to return the parsed (JSON or
+                YAML) python object or raw output
+            secrets (list): A list of secrets to be masked with asterisks
+            timeout (int): Time in seconds to wait for the command
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        out = await run_cmd_async(
+            self.ocp.get_oc_cmd(command), secrets=secrets, timeout=timeout,
+            **kwargs
+        )
+        return self.ocp.parse_oc_output(out, out_yaml_format)
+
+    async def get(
+        self, resource_name='', out_yaml_format=True, selector=None,
+        all_namespaces=False
+    ):
+        """
+        Get command - 'oc get <resource>'
+
+        Args:
+            resource_name (str): The resource name to fetch
+            out_yaml_format (bool): Adding '-o json' to oc command and
+                returning the parsed output
+            selector (str): The label selector to look for
+            all_namespaces (bool): Equal to oc get <resource> -A
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        return await self.exec_oc_cmd(self.ocp.get_command(
+            resource_name, out_yaml_format, selector, all_namespaces
+        ), out_yaml_format=out_yaml_format)
+
+    async def create(
+        self, yaml_file=None, resource_name='', out_yaml_format=True,
+        data=None
+    ):
+        """
+        Creates a new resource
+
+        Args:
+            yaml_file (str): Path to a yaml file to use in 'oc create -f
+                file.yaml
+            resource_name (str): Name of the resource you want to create
+            out_yaml_format (bool): Determines if the output should be
+                requested in JSON ('-o json') and parsed
+            data (dict or list): The resource(s) to create, piped to 'oc
+                create -f -' without writing any file
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        if data:
+            return await self.exec_oc_cmd(
+                self.ocp.create_command('-', out_yaml_format=out_yaml_format),
+                input=get_manifest_input(data),
+            )
+        return await self.exec_oc_cmd(
+            self.ocp.create_command(yaml_file, resource_name, out_yaml_format)
+        )
+
+    async def delete(self, yaml_file=None, resource_name='', wait=True, force=False):
+        """
+        Deletes a resource
+
+        Args:
+            yaml_file (str): Path to a yaml file to use in 'oc delete -f
+                file.yaml
+            resource_name (str): Name of the resource you want to delete
+            wait (bool): Determines if the delete command should wait to
+                completion
+            force (bool): True for force deletion with --grace-period=0,
+                False otherwise
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        return await self.exec_oc_cmd(
+            self.ocp.delete_command(yaml_file, resource_name, wait, force)
+        )
+
+    async def wait_for_resource(
+        self, condition, resource_name='', selector=None, resource_count=0,
+        timeout=60, sleep=3
+    ):
+        """
+        Wait for a resource to reach to a desired condition
+
+        Args:
+            condition (str): The desired state the resource that is sampled
+                from 'oc get <kind> <resource_name>' command
+            resource_name (str): The name of the resource to wait
+                for (e.g.my-pv1)
+            selector (str): The resource selector to search with.
+                Example: 'app=rook-ceph-mds'
+            resource_count (int): How many resources expected to be
+            timeout (int): Time in seconds to wait
+            sleep (int): Sampling time in seconds
+
+        Returns:
+            bool: True in case all resources reached desired condition
+
+        Raises:
+            TimeoutExpiredError: In case the condition wasn't met in time
+
+        """
+        resource_name = resource_name if resource_name else self.resource_name
+        deadline = time.time() + timeout
+        actual_status = None
+        while True:
+            try:
+                sample = await self.get(resource_name, selector=selector)
+            except CommandFailed as ex:
+                log.info(f"Failed to get {self.kind} {resource_name}: {ex}")
+                sample = None
+            if sample and resource_name:
+                actual_status = get_status_from_data(sample)
+                if actual_status == condition:
+                    return True
+            elif sample and sample.get('kind') == 'List':
+                items = sample['items']
+                actual_status = [get_status_from_data(item) for item in items]
+                in_condition = actual_status.count(condition)
+                if items and in_condition == len(items) and (
+                    not resource_count or in_condition == resource_count
+                ):
+                    return True
+            if time.time() + sleep > deadline:
+                log.error((
+                    f"Wait for {self.kind} resource {resource_name}"
+                    f" to reach desired condition {condition} failed,"
+                    f" last actual status was {actual_status}"))
+                raise TimeoutExpiredError(timeout)
+            await asyncio.sleep(sleep)
+
+    async def wait_for_delete(self, resource_name='', timeout=60, sleep=3):
+        """
+        Wait for a resource to be deleted
+
+        Args:
+            resource_name (str): The name of the resource to wait
+                for (e.g.my-pv1)
+            timeout (int): Time in seconds to wait
+            sleep (int): Sampling time in seconds
+
+        Raises:
+            CommandFailed: If failed to verify the resource deletion
+            TimeoutError: If resource is not deleted within specified timeout
+
+        Returns:
+            bool: True in case resource deletion is successful
+
+        """
+        deadline = time.time() + timeout
+        while True:
+            try:
+                await self.get(resource_name=resource_name)
+            except CommandFailed as ex:
+                if "NotFound" in str(ex):
+                    log.info(
+                        f"{self.kind} {resource_name} got deleted successfully"
+                    )
+                    return True
+                raise ex
+            if time.time() + sleep > deadline:
+                raise TimeoutError(
+                    f"Timeout when waiting for {resource_name} to delete"
+                )
+            await asyncio.sleep(sleep)
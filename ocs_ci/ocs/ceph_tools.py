@@ -0,0 +1,197 @@
+"""
+Client running ceph, rbd and rados commands in the Ceph tools pod
+
+When enabled by config.RUN['exec_sessions'], the commands run in a persistent
+exec session of the toolbox pod (see ocs_ci.ocs.pod_exec.ExecSessionPool)
+instead of forking 'oc rsh' for each of them. Their compact JSON output is
+parsed by the fastest available parser and more commands can be batched into
+one round trip. When the toolbox pod is
+respun, the new one is looked up and the command is retried.
+"""
+import logging
+import shlex
+import uuid
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources import pod
+from ocs_ci.utility import memoization
+from ocs_ci.utility.serialization import json_loads, yaml_load
+
+logger = logging.getLogger(__name__)
+
+# Errors of the commands run in the toolbox pod which doesn't exist anymore
+TOOLBOX_GONE_ERRORS = ('NotFound', 'Not Found')
+
+
+def parse_output(out):
+    """
+    Parse the output of the Ceph command, JSON is expected but some commands
+    ignore the --format option and print plain text
+
+    Args:
+        out (str): The output of the command
+
+    Returns:
+        object: The parsed output, None for empty output
+    """
+    if not out.strip():
+        return None
+    try:
+        return json_loads(out)
+    except ValueError:
+        return yaml_load(out)
+
+
+class CephToolsClient(object):
+    """
+    Runs ceph, rbd and rados commands in the Ceph tools pod
+    """
+
+    def __init__(self, pod_obj=None, timeout=600):
+        """
+        Initializer function
+
+        Args:
+            pod_obj (Pod): The Ceph tools pod, looked up by
+                get_ceph_tools_pod() if not provided or when it's gone
+            timeout (int): Default time in seconds to wait for a command
+        """
+        self._pod = pod_obj
+        self.timeout = timeout
+
+    @property
+    def pod(self):
+        """
+        Returns:
+            Pod: The Ceph tools pod the commands run in
+        """
+        if self._pod is None:
+            self._pod = pod.get_ceph_tools_pod()
+        return self._pod
+
+    @staticmethod
+    def format_cmd(ceph_cmd, format='json'):
+        """
+        Add the output format to the command and quote its arguments for
+        the shell, so the command is run the same way as by 'oc rsh'
+
+        Args:
+            ceph_cmd (str): The command, e.g. 'ceph osd df'
+            format (str): The output format, None for no format option
+
+        Returns:
+            str: The shell command
+        """
+        args = shlex.split(ceph_cmd)
+        if format:
+            args += ['--format', format]
+        return ' '.join(shlex.quote(arg) for arg in args)
+
+    def _exec_on_pod(self, pod_obj, command, timeout):
+        """
+        Run the shell command in the toolbox pod, in its exec session when
+        enabled by config.RUN['exec_sessions'], see Pod.exec_cmd_on_pod()
+
+        Returns:
+            str: stdout of the command
+        """
+        return pod_obj.exec_cmd_on_pod(
+            command, out_yaml_format=False, timeout=timeout
+        )
+
+    def exec_cmd(self, command, timeout=None):
+        """
+        Run the shell command in the toolbox pod, the command is retried on
+        the current toolbox pod when the pod was respun
+
+        Args:
+            command (str): The shell command
+            timeout (int): Time in seconds to wait for the command
+
+        Returns:
+            str: stdout of the command
+
+        Raises:
+            CommandFailed: In case the command fails
+        """
+        timeout = timeout or self.timeout
+        try:
+            return self._exec_on_pod(self.pod, command, timeout)
+        except CommandFailed as ex:
+            if not any(error in str(ex) for error in TOOLBOX_GONE_ERRORS):
+                raise
+            logger.warning(
+                f"Ceph tools pod {self.pod.name} not found, retrying on the "
+                f"current Ceph tools pod"
+            )
+        memoization.invalidate(memoization.TOOLBOX)
+        self._pod = None
+        return self._exec_on_pod(self.pod, command, timeout)
+
+    def run(self, ceph_cmd, format='json', timeout=None):
+        """
+        Run the Ceph command and parse its output
+
+        Args:
+            ceph_cmd (str): The command, e.g. 'ceph osd df'
+            format (str): The output format of the command
+            timeout (int): Time in seconds to wait for the command
+
+        Returns:
+            object: The parsed output, None for empty output
+
+        Raises:
+            CommandFailed: In case the command fails
+        """
+        return parse_output(
+            self.exec_cmd(self.format_cmd(ceph_cmd, format), timeout)
+        )
+
+    def run_batch(self, ceph_cmds, format='json', timeout=None):
+        """
+        Run more Ceph commands in one round trip to the toolbox pod, every
+        command runs even when the previous ones failed
+
+        Args:
+            ceph_cmds (list): The commands, e.g. ['ceph df', 'ceph osd df']
+            format (str): The output format of the commands
+            timeout (int): Time in seconds to wait for all the commands
+
+        Returns:
+            list: The parsed outputs of the commands
+
+        Raises:
+            CommandFailed: In case any of the commands fails
+        """
+        marker = f"ocs-ci-{uuid.uuid4().hex}"
+        lines = ['err=$(mktemp)']
+        for ceph_cmd in ceph_cmds:
+            lines.append(
+                f"{self.format_cmd(ceph_cmd, format)} 2>\"$err\" </dev/null; "
+                f"printf '\\n{marker} %d\\n' $?; cat \"$err\"; "
+                f"printf '\\n{marker}\\n'"
+            )
+        lines.append('rm -f "$err"')
+        script = '\n'.join(lines)
+        out = self.exec_cmd(f"sh -c {shlex.quote(script)}", timeout)
+        results = []
+        errors = []
+        position = 0
+        for ceph_cmd in ceph_cmds:
+            rc_start = out.index(f"\n{marker} ", position)
+            rc_end = out.index('\n', rc_start + 1)
+            err_end = out.index(f"\n{marker}\n", rc_end)
+            stdout = out[position:rc_start]
+            returncode = int(out[rc_start + len(marker) + 2:rc_end])
+            if returncode:
+                errors.append(
+                    f"Error during execution of command: {ceph_cmd}."
+                    f"\nError is {out[rc_end + 1:err_end]}"
+                )
+                results.append(None)
+            else:
+                results.append(parse_output(stdout))
+            position = err_end + len(marker) + 2
+        if errors:
+            raise CommandFailed('\n'.join(errors))
+        return results
@@ -12,6 +12,7 @@ import random
 import re
 
 import ocs_ci.ocs.resources.pod as pod
+from ocs_ci.ocs.ceph_tools import CephToolsClient
 from ocs_ci.ocs.exceptions import UnexpectedBehaviour
 from ocs_ci.ocs.resources import ocs
 import ocs_ci.ocs.constants as constant
@@ -32,7 +33,7 @@ class CephCluster(object):
     pod objects which represents ceph cluster entities.
 
     Attributes:
-        pods (list) : A list of  ceph cluster related pods
+        pods (list) : A list of  ceph cluster related pods (PodRecord)
         cluster_name (str): Name of ceph cluster
         namespace (str): openshift Namespace where this cluster lives
     """
@@ -94,6 +95,7 @@ class CephCluster(object):
         self.mgrs = []
         self.osds = []
         self.toolbox = None
+        self.ceph_tools = None
         self.mds_count = 0
         self.mon_count = 0
         self.mgr_count = 0
@@ -121,7 +123,7 @@ class CephCluster(object):
         """
         Get accurate info on current state of pods
         """
-        self._ceph_pods = pod.get_all_pods(self._namespace)
+        self._ceph_pods = pod.list_pod_records(self._namespace)
         # TODO: Workaround for BZ1748325:
         mons = pod.get_mon_pods(self.mon_selector, self.namespace)
         for mon in mons:
@@ -132,6 +134,7 @@ class CephCluster(object):
         self.mgrs = pod.get_mgr_pods(self.mgr_selector, self.namespace)
         self.osds = pod.get_osd_pods(self.osd_selector, self.namespace)
         self.toolbox = pod.get_ceph_tools_pod()
+        self.ceph_tools = CephToolsClient(self.toolbox)
 
         # set port attrib on mon pods
         self.mons = list(map(self.set_port, self.mons))
@@ -343,11 +346,12 @@ class CephCluster(object):
         Returns:
             key (str): base64 encoded user key
         """
-        out = self.toolbox.exec_cmd_on_pod(
-            f"ceph auth get-key {user} --format json"
-        )
-        if 'ENOENT' in out:
-            return False
+        try:
+            out = self.ceph_tools.run(f"ceph auth get-key {user}")
+        except exceptions.CommandFailed as ex:
+            if 'ENOENT' in str(ex):
+                return False
+            raise
         key_base64 = base64.b64encode(out['key'].encode()).decode()
         return key_base64
 
@@ -365,8 +369,7 @@ class CephCluster(object):
         cmd = f"ceph auth add {username} {caps}"
         # As of now ceph auth command gives output to stderr
         # To be handled
-        out = self.toolbox.exec_cmd_on_pod(cmd)
-        logging.info(type(out))
+        self.ceph_tools.run(cmd, format=None)
         return self.get_user_key(username)
 
     def get_mons_from_cluster(self):
@@ -413,8 +416,7 @@ class CephCluster(object):
          Raises:
             UnexpectedBehaviour: If used size keeps varying in Ceph status
         """
-        ct_pod = pod.get_ceph_tools_pod()
-        rados_status = ct_pod.exec_ceph_cmd(ceph_cmd=f"rados df -p {cbp_name}")
+        rados_status = CephToolsClient().run(f"rados df -p {cbp_name}")
         assert rados_status is not None
         used = rados_status['pools'][0]['size_bytes']
         used_in_gb = format(used / constants.GB, '.4f')
@@ -58,6 +58,9 @@ STATUS_TERMINATING = 'Terminating'
 STATUS_BOUND = 'Bound'
 STATUS_RELEASED = 'Released'
 STATUS_COMPLETED = 'Completed'
+STATUS_ERROR = 'Error'
+STATUS_FAILED = 'Failed'
+STATUS_LOST = 'Lost'
 
 # Resources / Kinds
 CEPHFILESYSTEM = "CephFileSystem"
@@ -32,6 +32,10 @@ class TimeoutExpiredError(Exception):
         return f"{self.message}: {self.value}"
 
 
+class TaskTimeoutError(TimeoutExpiredError):
+    message = 'Task timed out'
+
+
 class TimeoutException(Exception):
     pass
 
@@ -66,6 +70,28 @@ class ResourceWrongStatusException(Exception):
         return f"Resource {self.resource_name} describe output: {self.describe_out}"
 
 
+class ResourcesWrongStatusException(ResourceWrongStatusException):
+
+    def __init__(self, kind, condition, laggards, reached=0, total=0):
+        self.kind = kind
+        self.condition = condition
+        self.laggards = laggards
+        self.reached = reached
+        self.total = total
+        super().__init__(', '.join(laggards), None)
+
+    def __str__(self):
+        laggards = [
+            f"{name} ({status})" for name, status in self.laggards.items()
+        ]
+        if len(laggards) > 50:
+            laggards = laggards[:50] + [f"and {len(laggards) - 50} more"]
+        return (
+            f"{self.reached}/{self.total} {self.kind} reached "
+            f"{self.condition}, laggards: {', '.join(laggards)}"
+        )
+
+
 class UnavailableResourceException(Exception):
     pass
 
@@ -92,3 +118,11 @@ class SameNamePrefixClusterAlreadyExistsException(Exception):
 
 class MissingRequiredConfigKeyError(Exception):
     pass
+
+
+class UnsupportedBackendOperation(Exception):
+    pass
+
+
+class ExecSessionError(Exception):
+    pass
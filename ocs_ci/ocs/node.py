@@ -3,26 +3,31 @@ import copy
 from ocs_ci.ocs.exceptions import TimeoutExpiredError
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources.ocs import OCS
-from ocs_ci.ocs import constants, exceptions
+from ocs_ci.ocs import constants, exceptions, resource_cache
 from ocs_ci.utility.utils import TimeoutSampler
 
 log = logging.getLogger(__name__)
 
 
-def get_node_objs(node_names=None):
+def get_node_objs(node_names=None, max_staleness=None, force_refresh=False):
     """
     Get node objects by node names
 
     Args:
         node_names (list): The node names to get their objects for.
             If None, will return all cluster nodes
+        max_staleness (float): Max age in seconds of the nodes data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached nodes
 
     Returns:
         list: Cluster node OCP objects
 
     """
-    nodes_obj = OCP(kind='node')
-    node_dicts = nodes_obj.get()['items']
+    node_dicts = resource_cache.get_items(
+        constants.NODE, max_staleness=max_staleness,
+        force_refresh=force_refresh,
+    )
     if not node_names:
         return [OCS(**node_obj) for node_obj in node_dicts]
     else:
@@ -7,18 +7,59 @@ import time
 import yaml
 import shlex
 import re
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
+from ocs_ci.framework import config
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
     ResourceNameNotSpecifiedException,
+    ResourcesWrongStatusException,
     TimeoutExpiredError,
+    UnsupportedBackendOperation,
 )
 from ocs_ci.utility.utils import TimeoutSampler
-from ocs_ci.utility.utils import run_cmd
-from ocs_ci.ocs import defaults
+from ocs_ci.utility.utils import exec_cmd, run_cmd
+from ocs_ci.utility.serialization import (
+    json_dumps, load_oc_output, yaml_load, yaml_load_all,
+)
+from ocs_ci.ocs import constants, defaults
+from ocs_ci.ocs.ocp_backend import get_backend
 
 log = logging.getLogger(__name__)
 
+# Outcome of one resource created by OCP.bulk_create(), data is the created
+# resource returned by the API server, error the message when it failed
+BulkCreateResult = namedtuple('BulkCreateResult', ['item', 'data', 'error'])
+# Annotation with a unique value set by bulk_create() on the resources with
+# generated names, the created resources are matched to the items by it
+BULK_CREATE_NONCE_ANNOTATION = 'ocs-ci/bulk-create-nonce'
+# Max number of resource names passed to one 'oc delete' by delete_many()
+DELETE_NAMES_PER_COMMAND = 200
+# Statuses the resources don't get out of to the desired condition, the wait
+# of wait_for_many() fails right away when any of the resources reaches them
+FAILED_STATUSES = (
+    constants.STATUS_ERROR, constants.STATUS_FAILED, constants.STATUS_LOST,
+    constants.STATUS_TERMINATING,
+)
+
+
+def get_manifest_input(data):
+    """
+    Serialize the resource(s) to the manifest piped to 'oc create -f -' or
+    'oc apply -f -'
+
+    Args:
+        data (dict or list): The resource or list of the resources
+
+    Returns:
+        bytes: The JSON manifest, more resources are wrapped to the v1 List
+    """
+    if isinstance(data, list):
+        data = {'apiVersion': 'v1', 'kind': 'List', 'items': data}
+    return json_dumps(data)
+
 
 class OCP(object):
     """
@@ -56,6 +97,10 @@ class OCP(object):
     def namespace(self):
         return self._namespace
 
+    @namespace.setter
+    def namespace(self, namespace):
+        self._namespace = namespace
+
     @property
     def resource_name(self):
         return self._resource_name
@@ -67,23 +112,47 @@ class OCP(object):
         self._data = self.get()
         return self._data
 
-    def exec_oc_cmd(self, command, out_yaml_format=True, secrets=None, **kwargs):
+    @property
+    def backend(self):
         """
-        Executing 'oc' command
+        The in-process backend configured by config.RUN['ocp_backend']
+
+        Returns:
+            OCPBackend: backend instance or None if 'oc' cli should be used
+        """
+        return get_backend()
+
+    def _call_backend(self, method, *args, **kwargs):
+        """
+        Call the method of the configured backend
 
         Args:
-            command (str): The command to execute (e.g. create -f file.yaml)
-                without the initial 'oc' at the beginning
+            method (str): Name of the backend method to call
+
+        Returns:
+            tuple: (bool, output) - the bool is False in case the call has
+                to be done via 'oc' cli (no backend configured or the
+                operation is not supported by the backend)
+        """
+        backend = self.backend
+        if not backend:
+            return False, None
+        try:
+            return True, getattr(backend, method)(*args, **kwargs)
+        except UnsupportedBackendOperation as ex:
+            log.debug(f"Falling back to oc cli: {ex}")
+            return False, None
 
-            out_yaml_format (bool): whether to return  yaml loaded python
-                object or raw output
+    def get_oc_cmd(self, command):
+        """
+        Get the full 'oc' command with the namespace and kubeconfig options
 
-            secrets (list): A list of secrets to be masked with asterisks
-                This kwarg is popped in order to not interfere with
-                subprocess.run(**kwargs)
+        Args:
+            command (str): The command (e.g. create -f file.yaml) without
+                the initial 'oc' at the beginning
 
         Returns:
-            dict: Dictionary represents a returned yaml file
+            str: The full 'oc' command
         """
         oc_cmd = "oc "
         kubeconfig = os.getenv('KUBECONFIG')
@@ -93,9 +162,21 @@ class OCP(object):
         if kubeconfig:
             oc_cmd += f"--kubeconfig {kubeconfig} "
 
-        oc_cmd += command
-        out = run_cmd(cmd=oc_cmd, secrets=secrets, **kwargs)
+        return oc_cmd + command
+
+    @staticmethod
+    def parse_oc_output(out, out_yaml_format=True):
+        """
+        Parse the output of the 'oc' command
+
+        Args:
+            out (str): The output of the 'oc' command
+            out_yaml_format (bool): whether to return the parsed (JSON or
+                YAML) python object or raw output
 
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
         try:
             if out.startswith('hints = '):
                 out = out[out.index('{'):]
@@ -103,9 +184,106 @@ class OCP(object):
             pass
 
         if out_yaml_format:
-            return yaml.safe_load(out)
+            return load_oc_output(out)
         return out
 
+    def exec_oc_cmd(self, command, out_yaml_format=True, secrets=None, **kwargs):
+        """
+        Executing 'oc' command
+
+        Args:
+            command (str): The command to execute (e.g. create -f file.yaml)
+                without the initial 'oc' at the beginning
+
+            out_yaml_format (bool): whether to return the parsed (JSON or
+                YAML) python object or raw output
+
+            secrets (list): A list of secrets to be masked with asterisks
+                This kwarg is popped in order to not interfere with
+                subprocess.run(**kwargs)
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        out = run_cmd(cmd=self.get_oc_cmd(command), secrets=secrets, **kwargs)
+        return self.parse_oc_output(out, out_yaml_format)
+
+    def get_command(
+        self, resource_name='', out_yaml_format=True, selector=None,
+        all_namespaces=False
+    ):
+        """
+        Build the 'oc get' command (without the initial 'oc'), see get()
+
+        Returns:
+            str: The get command
+        """
+        resource_name = resource_name if resource_name else self.resource_name
+        command = f"get {self.kind} {resource_name}"
+        if all_namespaces and not self.namespace:
+            command += " -A"
+        elif self.namespace:
+            command += f" -n {self.namespace}"
+        if selector is not None:
+            command += f" --selector={selector}"
+        if out_yaml_format:
+            command += " -o json"
+        return command
+
+    def create_command(self, yaml_file=None, resource_name='', out_yaml_format=True):
+        """
+        Build the 'oc create' command (without the initial 'oc'), see
+        create()
+
+        Returns:
+            str: The create command
+
+        Raises:
+            CommandFailed: In case yaml_file and resource_name wasn't provided
+        """
+        if not (yaml_file or resource_name):
+            raise CommandFailed(
+                "At least one of resource_name or yaml_file have to "
+                "be provided"
+            )
+        command = "create "
+        if yaml_file:
+            command += f"-f {yaml_file}"
+        elif resource_name:
+            # e.g "oc namespace my-project"
+            command += f"{self.kind} {resource_name}"
+        if out_yaml_format:
+            command += " -o json"
+        return command
+
+    def delete_command(self, yaml_file=None, resource_name='', wait=True, force=False):
+        """
+        Build the 'oc delete' command (without the initial 'oc'), see
+        delete()
+
+        Returns:
+            str: The delete command
+
+        Raises:
+            CommandFailed: In case yaml_file and resource_name wasn't provided
+        """
+        if not (yaml_file or resource_name):
+            raise CommandFailed(
+                "At least one of resource_name or yaml_file have to "
+                "be provided"
+            )
+        command = "delete "
+        if resource_name:
+            command += f"{self.kind} {resource_name}"
+        else:
+            command += f"-f {yaml_file}"
+        if force:
+            command += " --grace-period=0 --force"
+        # oc default for wait is True
+        if not wait:
+            command += " --wait=false"
+        return command
+
     def get(
         self, resource_name='', out_yaml_format=True, selector=None,
         all_namespaces=False
@@ -115,7 +293,8 @@ class OCP(object):
 
         Args:
             resource_name (str): The resource name to fetch
-            out_yaml_format (bool): Adding '-o yaml' to oc command
+            out_yaml_format (bool): Adding '-o json' to oc command and
+                returning the parsed output
             selector (str): The label selector to look for
             all_namespaces (bool): Equal to oc get <resource> -A
 
@@ -126,16 +305,17 @@ class OCP(object):
             dict: Dictionary represents a returned yaml file
         """
         resource_name = resource_name if resource_name else self.resource_name
-        command = f"get {self.kind} {resource_name}"
-        if all_namespaces and not self.namespace:
-            command += " -A"
-        elif self.namespace:
-            command += f" -n {self.namespace}"
-        if selector is not None:
-            command += f" --selector={selector}"
         if out_yaml_format:
-            command += " -o yaml"
-        return self.exec_oc_cmd(command)
+            done, output = self._call_backend(
+                'get', self.kind, api_version=self.api_version,
+                namespace=self.namespace, resource_name=resource_name,
+                selector=selector, all_namespaces=all_namespaces
+            )
+            if done:
+                return output
+        return self.exec_oc_cmd(self.get_command(
+            resource_name, out_yaml_format, selector, all_namespaces
+        ))
 
     def describe(self, resource_name='', selector=None, all_namespaces=False):
         """
@@ -159,7 +339,10 @@ class OCP(object):
             command += f" --selector={selector}"
         return self.exec_oc_cmd(command, out_yaml_format=False)
 
-    def create(self, yaml_file=None, resource_name='', out_yaml_format=True):
+    def create(
+        self, yaml_file=None, resource_name='', out_yaml_format=True,
+        data=None
+    ):
         """
         Creates a new resource
 
@@ -168,28 +351,171 @@ class OCP(object):
                 file.yaml
             resource_name (str): Name of the resource you want to create
             out_yaml_format (bool): Determines if the output should be
-                formatted to a yaml like string
+                requested in JSON ('-o json') and parsed
+            data (dict or list): The resource(s) to create, piped to 'oc
+                create -f -' without writing any file
 
         Returns:
             dict: Dictionary represents a returned yaml file
         """
-        if not (yaml_file or resource_name):
+        if not (yaml_file or resource_name or data):
             raise CommandFailed(
-                "At least one of resource_name or yaml_file have to "
+                "At least one of resource_name, yaml_file or data have to "
                 "be provided"
             )
-        command = "create "
-        if yaml_file:
-            command += f"-f {yaml_file}"
-        elif resource_name:
-            # e.g "oc namespace my-project"
-            command += f"{self.kind} {resource_name}"
-        if out_yaml_format:
-            command += " -o yaml"
-        output = self.exec_oc_cmd(command)
+        if (yaml_file or data) and out_yaml_format and self.backend:
+            if data:
+                documents = data if isinstance(data, list) else [data]
+            else:
+                with open(yaml_file) as fd:
+                    documents = [doc for doc in yaml_load_all(fd) if doc]
+            if len(documents) == 1:
+                done, output = self._call_backend(
+                    'create', documents[0], namespace=self.namespace
+                )
+                if done:
+                    log.debug(f"{yaml.dump(output)}")
+                    return output
+        if data:
+            output = self.exec_oc_cmd(
+                self.create_command('-', out_yaml_format=out_yaml_format),
+                input=get_manifest_input(data),
+            )
+        else:
+            output = self.exec_oc_cmd(
+                self.create_command(yaml_file, resource_name, out_yaml_format)
+            )
         log.debug(f"{yaml.dump(output)}")
         return output
 
+    def bulk_create(self, items, chunk_size=None, generate_name=None):
+        """
+        Create many resources in a few round trips, the resources are piped
+        to 'oc create -f -' in chunks wrapped to v1 List manifests or posted
+        concurrently over the pooled connections of the REST backend. The
+        failure of one resource doesn't stop the creation of the others.
+
+        Args:
+            items (list): The resources (dicts) to create
+            chunk_size (int): Max number of the resources in one manifest
+                (default: config.RUN['bulk_create_chunk_size'])
+            generate_name (str): Prefix of the names generated by the API
+                server (metadata.generateName), the names of the items are
+                dropped when provided. The resources with generated names
+                get the BULK_CREATE_NONCE_ANNOTATION for matching them to
+                the items.
+
+        Returns:
+            list: BulkCreateResult for every item, in the order of items
+        """
+        if generate_name:
+            items = [dict(item) for item in items]
+            for item in items:
+                metadata = dict(item.get('metadata', {}))
+                metadata.pop('name', None)
+                metadata['generateName'] = generate_name
+                item['metadata'] = metadata
+        if not items:
+            return []
+        if self.backend:
+            max_workers = min(
+                len(items), config.RUN.get('rest_pool_maxsize', 32)
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(self._bulk_create_item, items)
+                )
+            if results[0] is not None:
+                return results
+        chunk_size = chunk_size or config.RUN.get('bulk_create_chunk_size', 200)
+        results = []
+        for start in range(0, len(items), chunk_size):
+            results += self._bulk_create_chunk(
+                items[start:start + chunk_size]
+            )
+        return results
+
+    def _bulk_create_item(self, item):
+        """
+        Create one resource by the REST backend, see bulk_create()
+
+        Returns:
+            BulkCreateResult: The outcome, None if the backend doesn't
+                support the creation
+        """
+        try:
+            done, output = self._call_backend(
+                'create', item, namespace=self.namespace
+            )
+        except CommandFailed as ex:
+            return BulkCreateResult(item, None, str(ex))
+        return BulkCreateResult(item, output, None) if done else None
+
+    def _bulk_create_chunk(self, items):
+        """
+        Create the resources by one 'oc create -f -' command, see
+        bulk_create()
+
+        Returns:
+            list: BulkCreateResult for every item
+        """
+        # The resources with generated names can't be matched by the name,
+        # every one of them is marked by a unique annotation
+        chunk_id = uuid.uuid4().hex
+        nonces = dict()
+        manifests = []
+        for index, item in enumerate(items):
+            metadata = item.get('metadata', {})
+            if not metadata.get('name'):
+                nonce = f"{chunk_id}-{index}"
+                nonces[index] = nonce
+                metadata = dict(metadata)
+                metadata['annotations'] = dict(
+                    metadata.get('annotations') or {},
+                    **{BULK_CREATE_NONCE_ANNOTATION: nonce}
+                )
+                item = dict(item, metadata=metadata)
+            manifests.append(item)
+        result = exec_cmd(
+            self.get_oc_cmd(self.create_command('-')),
+            input=get_manifest_input(manifests), ignore_error=True,
+        )
+        created = []
+        if result.stdout.strip():
+            output = self.parse_oc_output(result.stdout)
+            created = (
+                output.get('items', []) if output.get('kind') == 'List'
+                else [output]
+            )
+        by_name = dict()
+        by_nonce = dict()
+        for data in created:
+            metadata = data.get('metadata', {})
+            nonce = (metadata.get('annotations') or {}).get(
+                BULK_CREATE_NONCE_ANNOTATION
+            )
+            if nonce:
+                by_nonce[nonce] = data
+            else:
+                by_name[(data.get('kind'), metadata.get('name'))] = data
+        errors = result.stderr.splitlines()
+        results = []
+        for index, item in enumerate(items):
+            name = item.get('metadata', {}).get('name')
+            if index in nonces:
+                data = by_nonce.get(nonces[index])
+            else:
+                data = by_name.get((item.get('kind'), name))
+            if data is not None:
+                results.append(BulkCreateResult(item, data, None))
+                continue
+            error = [line for line in errors if name and f'"{name}"' in line]
+            results.append(BulkCreateResult(
+                item, None,
+                '\n'.join(error) or result.stderr or 'Resource not created'
+            ))
+        return results
+
     def delete(self, yaml_file=None, resource_name='', wait=True, force=False):
         """
         Deletes a resource
@@ -215,29 +541,152 @@ class OCP(object):
                 "be provided"
             )
 
-        command = f"delete "
         if resource_name:
-            command += f"{self.kind} {resource_name}"
-        else:
-            command += f"-f {yaml_file}"
-        if force:
-            command += " --grace-period=0 --force"
-        # oc default for wait is True
-        if not wait:
-            command += " --wait=false"
-        return self.exec_oc_cmd(command)
+            done, output = self._call_backend(
+                'delete', self.kind, resource_name,
+                api_version=self.api_version, namespace=self.namespace,
+                wait=wait, force=force
+            )
+            if done:
+                return output
+
+        return self.exec_oc_cmd(
+            self.delete_command(yaml_file, resource_name, wait, force)
+        )
+
+    def delete_many(self, resource_names, wait=True, force=False, timeout=600):
+        """
+        Delete more resources of the kind at once, by one 'oc delete' for
+        (up to DELETE_NAMES_PER_COMMAND) resources or concurrent requests of
+        the REST backend, and wait for all of them by one watch or list
+        instead of waiting for the resources one by one. The resources which
+        don't exist anymore are skipped.
+
+        Args:
+            resource_names (list): Names of the resources to delete
+            wait (bool): Wait for all the resources to be deleted
+            force (bool): True for force deletion with --grace-period=0,
+                False otherwise
+            timeout (int): Time in seconds to wait for the deletion
+
+        Returns:
+            bool: True in case the deletion is successful
+        """
+        resource_names = list(resource_names)
+        if not resource_names:
+            return True
+        log.info(f"Deleting {len(resource_names)} {self.kind} resources")
+        done = False
+        if self.backend:
+            max_workers = min(
+                len(resource_names), config.RUN.get('rest_pool_maxsize', 32)
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                done = all(executor.map(
+                    self._delete_ignore_not_found, resource_names,
+                    [force] * len(resource_names)
+                ))
+        if not done:
+            for start in range(
+                0, len(resource_names), DELETE_NAMES_PER_COMMAND
+            ):
+                names = resource_names[start:start + DELETE_NAMES_PER_COMMAND]
+                command = self.delete_command(
+                    resource_name=' '.join(names), wait=False, force=force
+                )
+                self.exec_oc_cmd(
+                    f"{command} --ignore-not-found", out_yaml_format=False
+                )
+        if wait:
+            return self.wait_for_delete_many(resource_names, timeout=timeout)
+        return True
+
+    def _delete_ignore_not_found(self, resource_name, force):
+        """
+        Delete the resource by the REST backend without waiting, see
+        delete_many()
+
+        Returns:
+            bool: False if the backend doesn't support the deletion
+        """
+        try:
+            done, _ = self._call_backend(
+                'delete', self.kind, resource_name,
+                api_version=self.api_version, namespace=self.namespace,
+                wait=False, force=force
+            )
+        except CommandFailed as ex:
+            if "NotFound" not in str(ex):
+                raise
+            return True
+        return done
+
+    def delete_by_selector(self, selector, wait=True, force=False, timeout=600):
+        """
+        Delete all the resources of the kind matching the label selector by
+        one collection delete and wait for all of them by one watch or list
+
+        Args:
+            selector (str): The label selector of the resources to delete
+            wait (bool): Wait for all the resources to be deleted
+            force (bool): True for force deletion with --grace-period=0,
+                False otherwise
+            timeout (int): Time in seconds to wait for the deletion
+
+        Returns:
+            bool: True in case the deletion is successful
 
-    def apply(self, yaml_file):
+        Raises:
+            CommandFailed: In case the selector wasn't provided
+        """
+        if not selector:
+            raise CommandFailed(
+                "The selector has to be provided, no resources would be "
+                "left otherwise"
+            )
+        log.info(f"Deleting {self.kind} resources matching {selector}")
+        done, _ = self._call_backend(
+            'delete_collection', self.kind, api_version=self.api_version,
+            namespace=self.namespace, selector=selector, force=force
+        )
+        if not done:
+            command = f"delete {self.kind} --selector={selector} --wait=false"
+            if force:
+                command += " --grace-period=0 --force"
+            self.exec_oc_cmd(command, out_yaml_format=False)
+        if wait:
+            return self.wait_for_delete_many(selector=selector, timeout=timeout)
+        return True
+
+    def apply(self, yaml_file=None, data=None):
         """
         Applies configuration changes to a resource
 
         Args:
             yaml_file (str): Path to a yaml file to use in 'oc apply -f
                 file.yaml
+            data (dict or list): The resource(s) to apply, piped to 'oc
+                apply -f -' without writing any file
 
         Returns:
             dict: Dictionary represents a returned yaml file
         """
+        if self.backend:
+            if data:
+                document = data
+            else:
+                with open(yaml_file) as fd:
+                    document = yaml_load(fd)
+            if isinstance(document, dict):
+                done, output = self._call_backend(
+                    'apply', document, namespace=self.namespace
+                )
+                if done:
+                    return output
+        if data:
+            return self.exec_oc_cmd(
+                "apply -f -", input=get_manifest_input(data)
+            )
         command = f"apply -f {yaml_file}"
         return self.exec_oc_cmd(command)
 
@@ -302,6 +751,10 @@ class OCP(object):
         """
         Wait for a resource to reach to a desired condition
 
+        In case the backend supports watching (the 'rest' backend), the
+        resource(s) are watched and the condition is evaluated on every
+        change instead of polling every `sleep` seconds.
+
         Args:
             condition (str): The desired state the resource that is sampled
                 from 'oc get <kind> <resource_name>' command
@@ -324,6 +777,10 @@ class OCP(object):
             f" and selector {selector}"
             f" to reach desired condition {condition}"))
         resource_name = resource_name if resource_name else self.resource_name
+        if hasattr(self.backend, 'iter_snapshots'):
+            return self._wait_for_resource_watch(
+                condition, resource_name, selector, resource_count, timeout
+            )
 
         # actual status of the resource we are waiting for, setting it to None
         # now prevents UnboundLocalError raised when waiting timeouts
@@ -336,7 +793,7 @@ class OCP(object):
 
                 # Only 1 resource expected to be returned
                 if resource_name:
-                    status = self.get_resource_status(resource_name)
+                    status = get_status_from_data(sample)
                     if status == condition:
                         return True
                     log.info((
@@ -345,28 +802,21 @@ class OCP(object):
                     actual_status = status
                 # More than 1 resources returned
                 elif sample.get('kind') == 'List':
-                    in_condition = []
-                    actual_status = []
                     sample = sample['items']
-                    for item in sample:
-                        try:
-                            item_name = item.get('metadata').get('name')
-                            status = self.get_resource_status(item_name)
-                            actual_status.append(status)
-                            if status == condition:
-                                in_condition.append(item)
-                        except CommandFailed as ex:
-                            log.info(
-                                f"Failed to get status of resource: {item_name}, "
-                                f"Error: {ex}"
-                            )
-                        if resource_count:
-                            if len(in_condition) == resource_count and (
-                                len(sample) == len(in_condition)
-                            ):
-                                return True
-                        elif len(sample) == len(in_condition):
+                    actual_status = [
+                        get_status_from_data(item) for item in sample
+                    ]
+                    in_condition = [
+                        status for status in actual_status
+                        if status == condition
+                    ]
+                    if resource_count:
+                        if len(in_condition) == resource_count and (
+                            len(sample) == len(in_condition)
+                        ):
                             return True
+                    elif sample and len(sample) == len(in_condition):
+                        return True
                     # preparing logging message with expected number of
                     # resource items we are waiting for
                     if resource_count > 0:
@@ -387,10 +837,161 @@ class OCP(object):
 
         return False
 
+    def wait_for_many(
+        self, resource_names, condition, timeout=60, sleep=3,
+        fail_statuses=FAILED_STATUSES
+    ):
+        """
+        Wait for more resources of the kind to reach the desired condition,
+        the whole set is tracked by one watch of the resources (the 'rest'
+        backend) or by one list per sample, instead of waiting for every
+        resource separately
+
+        Args:
+            resource_names (list): Names of the resources to wait for
+            condition (str): The desired state of the resources
+            timeout (int): Time in seconds to wait
+            sleep (int): Sampling time in seconds
+            fail_statuses (tuple): Statuses failing the wait right away, the
+                wait also fails when any of the resources gets deleted
+
+        Returns:
+            dict: name -> (seconds, data), the time it took the resource to
+                reach the condition and its data at that time
+
+        Raises:
+            ResourcesWrongStatusException: In case any of the resources
+                didn't reach the condition in time or failed, the laggards
+                are named in the exception
+
+        """
+        names = list(resource_names)
+        fail_statuses = set(fail_statuses or ()) - {condition}
+        start_time = time.time()
+        reached = dict()
+        statuses = dict()
+        seen = set()
+        failed = dict()
+
+        def check(snapshot):
+            progress = len(reached)
+            for name in names:
+                if name in reached:
+                    continue
+                data = snapshot.get(name)
+                if data is None:
+                    if name in seen:
+                        failed[name] = statuses[name] = 'Deleted'
+                    continue
+                seen.add(name)
+                status = statuses[name] = get_status_from_data(data)
+                if status == condition:
+                    reached[name] = (time.time() - start_time, data)
+                elif status in fail_statuses:
+                    failed[name] = status
+            if len(reached) != progress:
+                log.info(
+                    f"{len(reached)}/{len(names)} {self.kind} {condition}"
+                )
+            if failed:
+                raise ResourcesWrongStatusException(
+                    self.kind, condition, failed, len(reached), len(names)
+                )
+            return len(reached) == len(names)
+
+        log.info(
+            f"Waiting for {len(names)} {self.kind} resources to reach "
+            f"condition {condition}"
+        )
+        if not names:
+            return reached
+        done = False
+        if hasattr(self.backend, 'iter_snapshots'):
+            for snapshot in self.backend.iter_snapshots(
+                self.kind, api_version=self.api_version,
+                namespace=self.namespace, timeout=timeout
+            ):
+                done = check(snapshot)
+                if done:
+                    break
+        else:
+            try:
+                for listed in TimeoutSampler(timeout, sleep, self.get):
+                    done = check({
+                        item['metadata']['name']: item
+                        for item in listed['items']
+                    })
+                    if done:
+                        break
+            except TimeoutExpiredError:
+                pass
+        if not done:
+            laggards = {
+                name: statuses.get(name, 'NotFound')
+                for name in names if name not in reached
+            }
+            raise ResourcesWrongStatusException(
+                self.kind, condition, laggards, len(reached), len(names)
+            )
+        return reached
+
+    def _wait_for_resource_watch(
+        self, condition, resource_name, selector, resource_count, timeout
+    ):
+        """
+        Event driven variant of wait_for_resource() which is using the
+        watch API of the backend instead of polling. The condition is
+        evaluated right after every change of the resource(s).
+
+        Args:
+            condition (str): The desired state of the resource(s)
+            resource_name (str): The name of the resource to wait for
+            selector (str): The resource selector to search with
+            resource_count (int): How many resources expected to be
+            timeout (int): Time in seconds to wait
+
+        Returns:
+            bool: True in case all resources reached desired condition
+
+        Raises:
+            TimeoutExpiredError: In case the condition wasn't met in time
+
+        """
+        actual_status = None
+        for snapshot in self.backend.iter_snapshots(
+            self.kind, api_version=self.api_version, namespace=self.namespace,
+            resource_name=resource_name, selector=selector, timeout=timeout
+        ):
+            statuses = {
+                name: get_status_from_data(item)
+                for name, item in snapshot.items()
+            }
+            if resource_name:
+                actual_status = statuses.get(resource_name)
+                if actual_status == condition:
+                    return True
+                continue
+            actual_status = list(statuses.values())
+            in_condition = [
+                status for status in actual_status if status == condition
+            ]
+            if in_condition and len(in_condition) == len(actual_status) and (
+                not resource_count or len(in_condition) == resource_count
+            ):
+                return True
+        log.error((
+            f"Wait for {self._kind} resource {resource_name}"
+            f" to reach desired condition {condition} failed,"
+            f" last actual status was {actual_status}"))
+        raise TimeoutExpiredError(timeout)
+
     def wait_for_delete(self, resource_name='', timeout=60, sleep=3):
         """
         Wait for a resource to be deleted
 
+        The resource is watched instead of polled in case the backend
+        supports watching (the 'rest' backend).
+
         Args:
             resource_name (str): The name of the resource to wait
                 for (e.g.my-pv1)
@@ -405,6 +1006,22 @@ class OCP(object):
             bool: True in case resource deletion is successful
 
         """
+        if hasattr(self.backend, 'iter_snapshots'):
+            for snapshot in self.backend.iter_snapshots(
+                self.kind, api_version=self.api_version,
+                namespace=self.namespace, resource_name=resource_name,
+                timeout=timeout
+            ):
+                if resource_name not in snapshot:
+                    log.info(
+                        f"{self.kind} {resource_name} got deleted successfully"
+                    )
+                    return True
+            describe_out = self.describe(resource_name=resource_name)
+            raise TimeoutError(
+                f"Timeout when waiting for {resource_name} to delete. "
+                f"Describe output: {describe_out}"
+            )
         start_time = time.time()
         while True:
             try:
@@ -427,6 +1044,63 @@ class OCP(object):
                 raise TimeoutError(msg)
             time.sleep(sleep)
 
+    def wait_for_delete_many(
+        self, resource_names=None, selector=None, timeout=600, sleep=3
+    ):
+        """
+        Wait for more resources to be deleted by one watch of the resources
+        (the 'rest' backend) or by listing them all at once, instead of
+        waiting for every resource separately
+
+        Args:
+            resource_names (list): Names of the resources to wait for, all
+                the resources (matching the selector) if not provided
+            selector (str): The label selector of the resources
+            timeout (int): Time in seconds to wait
+            sleep (int): Sampling time in seconds
+
+        Raises:
+            TimeoutError: If the resources are not deleted within specified
+                timeout
+
+        Returns:
+            bool: True in case the deletion of all the resources is successful
+
+        """
+        names = set(resource_names) if resource_names is not None else None
+        if names is not None and not names:
+            return True
+
+        def get_remaining(existing):
+            return set(existing) if names is None else names & set(existing)
+
+        remaining = names
+        if hasattr(self.backend, 'iter_snapshots'):
+            for snapshot in self.backend.iter_snapshots(
+                self.kind, api_version=self.api_version,
+                namespace=self.namespace, selector=selector, timeout=timeout
+            ):
+                remaining = get_remaining(snapshot)
+                if not remaining:
+                    break
+        else:
+            start_time = time.time()
+            while True:
+                listed = self.get(selector=selector)
+                remaining = get_remaining(
+                    item['metadata']['name'] for item in listed['items']
+                )
+                if not remaining or timeout < (time.time() - start_time):
+                    break
+                time.sleep(sleep)
+        if remaining:
+            raise TimeoutError(
+                f"Timeout when waiting for {len(remaining)} {self.kind} "
+                f"resources to delete: {', '.join(sorted(remaining))}"
+            )
+        log.info(f"{self.kind} resources got deleted successfully")
+        return True
+
     def get_resource_status(self, resource_name):
         """
         Get the resource status based on:
@@ -476,6 +1150,132 @@ class OCP(object):
             )
 
 
+# Status extractors per lower case kind, see register_status_extractor()
+STATUS_EXTRACTORS = dict()
+
+
+def register_status_extractor(*kinds):
+    """
+    Decorator registering the function as the status extractor of the kinds
+    used by get_status_from_data(). The function takes the resource data and
+    returns the status string as shown by 'oc get <kind>'.
+
+    Args:
+        *kinds (str): The kinds the extractor is used for
+
+    Returns:
+        function: The decorator
+
+    """
+    def decorator(func):
+        for kind in kinds:
+            STATUS_EXTRACTORS[kind.lower()] = func
+        return func
+    return decorator
+
+
+def get_status_from_data(data):
+    """
+    Get the resource status from the resource data (as returned by 'oc get
+    -o yaml') the same way as it is shown in the STATUS column of the
+    'oc get <kind> <resource_name>' table output.
+
+    The status is evaluated by the extractor registered for the kind by
+    register_status_extractor(), the 'status.phase' is used for kinds
+    without registered extractor.
+
+    Args:
+        data (dict): The resource data
+
+    Returns:
+        str: The status of the resource or None if it cannot be determined
+    """
+    kind = data.get('kind', '').lower()
+    extractor = STATUS_EXTRACTORS.get(kind)
+    if extractor:
+        return extractor(data)
+    if data.get('metadata', {}).get('deletionTimestamp'):
+        return 'Terminating'
+    return (data.get('status') or {}).get('phase')
+
+
+@register_status_extractor('Node')
+def _get_node_status(data):
+    """
+    Status of the node as shown by 'oc get node', e.g. 'Ready' or
+    'NotReady,SchedulingDisabled'
+    """
+    conditions = (data.get('status') or {}).get('conditions') or []
+    ready = [
+        cond.get('status') for cond in conditions
+        if cond.get('type') == 'Ready'
+    ]
+    node_status = 'Unknown'
+    if ready:
+        node_status = 'Ready' if ready[0] == 'True' else 'NotReady'
+    if data.get('spec', {}).get('unschedulable'):
+        node_status += ',SchedulingDisabled'
+    return node_status
+
+
+def _get_container_state_reason(state, prefix=''):
+    """
+    Reason of the container state as shown by 'oc get pod', None for running
+    container
+    """
+    if state.get('waiting', {}).get('reason'):
+        return prefix + state['waiting']['reason']
+    if 'terminated' in state:
+        terminated = state['terminated'] or {}
+        if terminated.get('reason'):
+            return prefix + terminated['reason']
+        if terminated.get('signal'):
+            return f"{prefix}Signal:{terminated['signal']}"
+        return f"{prefix}ExitCode:{terminated.get('exitCode')}"
+    return None
+
+
+@register_status_extractor('Pod')
+def _get_pod_status(data):
+    """
+    Status of the pod as shown by 'oc get pod', e.g. 'Running',
+    'Init:0/2', 'ContainerCreating' or 'Terminating'
+    """
+    status = data.get('status') or {}
+    reason = status.get('reason') or status.get('phase')
+    init_containers = data.get('spec', {}).get('initContainers') or []
+    initializing = False
+    for index, container in enumerate(
+        status.get('initContainerStatuses') or []
+    ):
+        state = container.get('state') or {}
+        if state.get('terminated', {}).get('exitCode') == 0:
+            continue
+        init_reason = _get_container_state_reason(state, prefix='Init:')
+        if init_reason and init_reason != 'Init:PodInitializing':
+            reason = init_reason
+        else:
+            reason = f"Init:{index}/{len(init_containers)}"
+        initializing = True
+        break
+    if not initializing:
+        has_running = False
+        for container in reversed(status.get('containerStatuses') or []):
+            state = container.get('state') or {}
+            container_reason = _get_container_state_reason(state)
+            if container_reason:
+                reason = container_reason
+            elif container.get('ready') and 'running' in state:
+                has_running = True
+        if reason == 'Completed' and has_running:
+            reason = 'Running'
+    if data.get('metadata', {}).get('deletionTimestamp'):
+        if status.get('reason') == 'NodeLost':
+            return 'Unknown'
+        return 'Terminating'
+    return reason
+
+
 def switch_to_project(project_name):
     """
     Switch to another project
@@ -506,3 +1306,26 @@ def switch_to_default_rook_cluster_project():
         bool: True on success, False otherwise
     """
     return switch_to_project(defaults.ROOK_CLUSTER_NAMESPACE)
+
+
+def delete_by_selector(
+    kind, namespace, selector, wait=True, force=False, timeout=600
+):
+    """
+    Delete all the resources of the kind matching the label selector, see
+    OCP.delete_by_selector()
+
+    Args:
+        kind (str): The kind of the resources
+        namespace (str): The namespace of the resources
+        selector (str): The label selector of the resources to delete
+        wait (bool): Wait for all the resources to be deleted
+        force (bool): True for force deletion with --grace-period=0
+        timeout (int): Time in seconds to wait for the deletion
+
+    Returns:
+        bool: True in case the deletion is successful
+    """
+    return OCP(kind=kind, namespace=namespace).delete_by_selector(
+        selector, wait=wait, force=force, timeout=timeout
+    )
@@ -0,0 +1,603 @@
+"""
+Pluggable backends for ocs_ci.ocs.ocp.OCP
+
+By default every OCP call forks a new 'oc' process (see OCP.exec_oc_cmd).
+This module provides an alternative in-process backend which talks to the
+API server over a persistent, pooled HTTP connection by using the
+kubernetes/openshift dynamic client (the same client openshift_ops.py uses).
+
+The backend is selected by config.RUN['ocp_backend']:
+    'cli'  - fork 'oc' for every call (default)
+    'rest' - use the in-process REST backend
+
+Every backend returns the same dict shapes as the 'oc ... -o yaml' output, so
+the callers of OCP don't have to care which backend is in use.
+"""
+import logging
+import os
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+
+import yaml
+
+from ocs_ci.framework import config
+from ocs_ci.utility import command_stats, rate_limiter
+from ocs_ci.ocs.exceptions import (
+    CommandFailed,
+    UnsupportedBackendOperation,
+)
+
+log = logging.getLogger(__name__)
+
+CLI_BACKEND = 'cli'
+REST_BACKEND = 'rest'
+
+# Backends shared across the whole process, keyed by backend name and
+# kubeconfig path so OCP.set_kubeconfig() switching clusters is respected
+_backends = dict()
+_backends_lock = threading.Lock()
+
+
+class OCPBackend(metaclass=ABCMeta):
+    """
+    Abstract base class for all OCP backends
+
+    All the methods return python objects with the same shape as the
+    yaml loaded output of the equivalent 'oc' command.
+    """
+
+    @property
+    @abstractmethod
+    def name(self):
+        """Concrete class will have respective backend name"""
+        pass
+
+    @abstractmethod
+    def get(
+        self, kind, api_version=None, namespace=None, resource_name='',
+        selector=None, all_namespaces=False
+    ):
+        raise NotImplementedError("get method is not implemented")
+
+    @abstractmethod
+    def create(self, body, namespace=None):
+        raise NotImplementedError("create method is not implemented")
+
+    @abstractmethod
+    def delete(
+        self, kind, resource_name, api_version=None, namespace=None,
+        wait=True, force=False
+    ):
+        raise NotImplementedError("delete method is not implemented")
+
+    @abstractmethod
+    def apply(self, body, namespace=None):
+        raise NotImplementedError("apply method is not implemented")
+
+
+class RESTBackend(OCPBackend):
+    """
+    In-process backend using the openshift dynamic client
+
+    One instance (and so one urllib3 connection pool) is shared by all the
+    OCP objects of the process, see get_backend().
+    """
+
+    def __init__(self, kubeconfig=None, pool_maxsize=None):
+        """
+        Initializer function
+
+        Args:
+            kubeconfig (str): Path to the kubeconfig file, the KUBECONFIG
+                environment variable is used if not provided
+            pool_maxsize (int): Max number of pooled HTTP connections to the
+                API server (default: config.RUN['rest_pool_maxsize'])
+        """
+        # importing here to not require the clients for the 'cli' backend
+        from kubernetes import config as kube_config
+        from kubernetes.client import ApiClient, Configuration
+        from openshift.dynamic import DynamicClient
+
+        self.kubeconfig = kubeconfig or os.getenv('KUBECONFIG')
+        client_configuration = Configuration()
+        kube_config.load_kube_config(
+            config_file=self.kubeconfig,
+            client_configuration=client_configuration,
+        )
+        client_configuration.connection_pool_maxsize = (
+            pool_maxsize or config.RUN.get('rest_pool_maxsize', 32)
+        )
+        self.api_client = ApiClient(configuration=client_configuration)
+        self.dyn_client = DynamicClient(self.api_client)
+        _, active_context = kube_config.list_kube_config_contexts(
+            config_file=self.kubeconfig
+        )
+        self.default_namespace = (
+            active_context.get('context', {}).get('namespace') or 'default'
+        )
+        self._resources = dict()
+        self._resources_lock = threading.Lock()
+
+    @property
+    def name(self):
+        return REST_BACKEND
+
+    def resource(self, kind, api_version=None):
+        """
+        Resolve kind (e.g. 'pod', 'Pod', 'pvc', 'PersistentVolumeClaim') to
+        the dynamic client resource the same way 'oc' does
+
+        Args:
+            kind (str): Kind, singular/plural name or short name
+            api_version (str): The preferred api version, used only for
+                choosing between more matching resources
+
+        Returns:
+            openshift.dynamic.Resource: The resolved resource
+
+        Raises:
+            UnsupportedBackendOperation: In case the kind cannot be resolved
+        """
+        key = (kind.lower(), api_version)
+        with self._resources_lock:
+            if key in self._resources:
+                return self._resources[key]
+
+        lowered = kind.lower()
+        # searching for all resources at once, a search by a particular
+        # field which doesn't match invalidates the whole discovery cache
+        candidates = [
+            res for res in self.dyn_client.resources.search()
+            # skip subresources like pods/log and *List kinds
+            if '/' not in getattr(res, 'name', '/')
+            and not res.kind.endswith('List')
+        ]
+        matchers = (
+            lambda res: res.kind == kind,
+            lambda res: res.kind.lower() == lowered,
+            lambda res: res.singular_name == lowered,
+            lambda res: res.name == lowered,
+            lambda res: lowered in (res.short_names or []),
+        )
+        found = []
+        for matcher in matchers:
+            found = [res for res in candidates if matcher(res)]
+            if found:
+                break
+        if not found:
+            raise UnsupportedBackendOperation(
+                f"Unable to resolve kind {kind} by {self.name} backend"
+            )
+        preferred = [
+            res for res in found if res.group_version == api_version
+        ] or [res for res in found if res.preferred]
+        resource = (preferred or found)[0]
+        with self._resources_lock:
+            self._resources[key] = resource
+        return resource
+
+    def _namespace(self, resource, namespace):
+        """
+        Get namespace to use for the request, the active context namespace
+        is used like in the 'oc' case when not provided
+        """
+        if not resource.namespaced:
+            return None
+        return namespace or self.default_namespace
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call the dynamic client and translate the API errors to CommandFailed
+        with the same message format as the 'oc' command has. The call is
+        rate limited by the shared API limiter and retried when throttled.
+
+        Args:
+            func (callable): dynamic client method to call
+
+        Returns:
+            any: Output of func
+
+        Raises:
+            CommandFailed: In case the API call fails
+        """
+        from openshift.dynamic.exceptions import DynamicApiError
+        limiter = rate_limiter.get_limiter()
+        retries = rate_limiter.get_throttle_retries()
+        # resource methods of the dynamic client are partials of the client
+        # methods with the resource as the first argument
+        func_name = getattr(getattr(func, 'func', func), '__name__', str(func))
+        kind = getattr((getattr(func, 'args', None) or [None])[0], 'kind', '')
+        key = f"{self.name} {func_name} {kind}".strip()
+        request = f"{key} {kwargs.get('name') or ''}".strip()
+        for attempt in range(retries + 1):
+            start_time = time.time()
+            returncode = 0
+            try:
+                with limiter.limit():
+                    return func(*args, **kwargs)
+            except DynamicApiError as ex:
+                returncode = ex.status
+                if ex.status == 429 and attempt < retries:
+                    retry_after = (ex.headers or {}).get('Retry-After')
+                    limiter.pause(
+                        float(retry_after) if retry_after else 2 ** attempt
+                    )
+                    continue
+                reason, message = ex.reason, ex.summary()
+                try:
+                    body = yaml.safe_load(ex.body)
+                    reason = body.get('reason') or reason
+                    message = body.get('message') or message
+                except (yaml.YAMLError, AttributeError, TypeError):
+                    pass
+                raise CommandFailed(
+                    f"Error during execution of {self.name} request: "
+                    f"{func_name}."
+                    f"\nError is Error from server ({reason}): {message}"
+                )
+            finally:
+                command_stats.record(
+                    key, request, time.time() - start_time, returncode
+                )
+
+    @staticmethod
+    def _to_dict(resource, instance):
+        """
+        Convert ResourceInstance to the dict in the same shape as 'oc get
+        -o yaml' returns, list kinds are converted to the generic 'List'
+
+        Args:
+            resource (openshift.dynamic.Resource): Resource of the instance
+            instance (ResourceInstance): Instance returned from API
+
+        Returns:
+            dict: The instance data
+        """
+        data = instance.to_dict()
+        if 'items' not in data or not data.get('kind', '').endswith('List'):
+            return data
+        for item in data['items']:
+            item.setdefault('apiVersion', resource.group_version)
+            item.setdefault('kind', resource.kind)
+        return {
+            'apiVersion': 'v1',
+            'kind': 'List',
+            'items': data['items'],
+            'metadata': {
+                'resourceVersion': data.get(
+                    'metadata', {}
+                ).get('resourceVersion', ''),
+                'selfLink': '',
+            },
+        }
+
+    def get(
+        self, kind, api_version=None, namespace=None, resource_name='',
+        selector=None, all_namespaces=False
+    ):
+        """
+        Get command - equivalent of 'oc get <kind> <resource_name> -o yaml'
+
+        Args:
+            kind (str): The kind of the resource
+            api_version (str): The api version of the resource
+            namespace (str): The namespace of the resource
+            resource_name (str): The resource name to fetch
+            selector (str): The label selector to look for
+            all_namespaces (bool): Equal to oc get <resource> -A
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        resource = self.resource(kind, api_version)
+        kwargs = dict()
+        if not (all_namespaces and not namespace):
+            kwargs['namespace'] = self._namespace(resource, namespace)
+        if resource_name:
+            kwargs['name'] = resource_name
+        if selector is not None:
+            kwargs['label_selector'] = selector
+        return self._to_dict(resource, self.call(resource.get, **kwargs))
+
+    def create(self, body, namespace=None):
+        """
+        Create command - equivalent of 'oc create -f file.yaml -o yaml'
+
+        Args:
+            body (dict): The resource data, 'List' kind is supported as well
+            namespace (str): Namespace to use if not provided in body
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        if body.get('kind') == 'List':
+            created = [
+                self.create(item, namespace) for item in body['items']
+            ]
+            return {'apiVersion': 'v1', 'kind': 'List', 'items': created}
+        resource = self.resource(body['kind'], body.get('apiVersion'))
+        namespace = body.get('metadata', {}).get('namespace') or namespace
+        instance = self.call(
+            resource.create, body=body,
+            namespace=self._namespace(resource, namespace)
+        )
+        return self._to_dict(resource, instance)
+
+    def delete(
+        self, kind, resource_name, api_version=None, namespace=None,
+        wait=True, force=False, timeout=600
+    ):
+        """
+        Delete command - equivalent of 'oc delete <kind> <resource_name>'
+
+        Args:
+            kind (str): The kind of the resource
+            resource_name (str): Name of the resource to delete
+            api_version (str): The api version of the resource
+            namespace (str): The namespace of the resource
+            wait (bool): Wait for the resource to be really deleted, like
+                'oc delete' does by default
+            force (bool): True for force deletion with grace period 0
+            timeout (int): Max time in seconds to wait for the deletion
+
+        Returns:
+            str: The same message as 'oc delete' prints out
+        """
+        resource = self.resource(kind, api_version)
+        namespace = self._namespace(resource, namespace)
+        body = None
+        if force:
+            body = {
+                'kind': 'DeleteOptions',
+                'apiVersion': 'v1',
+                'gracePeriodSeconds': 0,
+            }
+        self.call(
+            resource.delete, name=resource_name, namespace=namespace,
+            body=body
+        )
+        if wait:
+            self.wait_for_gone(resource, resource_name, namespace, timeout)
+        return f'{resource.singular_name or kind.lower()} "{resource_name}" deleted'
+
+    def delete_collection(
+        self, kind, api_version=None, namespace=None, selector=None,
+        force=False
+    ):
+        """
+        Collection delete - equivalent of 'oc delete <kind> -l <selector>
+        --wait=false'
+
+        Args:
+            kind (str): The kind of the resources
+            api_version (str): The api version of the resources
+            namespace (str): The namespace of the resources
+            selector (str): The label selector of the resources to delete
+            force (bool): True for force deletion with grace period 0
+
+        Returns:
+            str: The message about the deletion
+        """
+        resource = self.resource(kind, api_version)
+        body = None
+        if force:
+            body = {
+                'kind': 'DeleteOptions',
+                'apiVersion': 'v1',
+                'gracePeriodSeconds': 0,
+            }
+        self.call(
+            resource.delete, namespace=self._namespace(resource, namespace),
+            label_selector=selector, body=body
+        )
+        return f'{resource.name} matching "{selector}" deleted'
+
+    def wait_for_gone(self, resource, resource_name, namespace, timeout):
+        """
+        Wait until the resource doesn't exist anymore (e.g. all finalizers
+        are done)
+
+        Args:
+            resource (openshift.dynamic.Resource): Resource to wait for
+            resource_name (str): Name of the resource
+            namespace (str): Namespace of the resource
+            timeout (int): Time in seconds to wait
+
+        Raises:
+            CommandFailed: In case the resource still exists after timeout
+        """
+        from openshift.dynamic.exceptions import NotFoundError
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            try:
+                resource.get(name=resource_name, namespace=namespace)
+            except NotFoundError:
+                return
+            time.sleep(1)
+        raise CommandFailed(
+            f"Timed out waiting for deletion of {resource.kind} "
+            f"{resource_name}"
+        )
+
+    def iter_snapshots(
+        self, kind, api_version=None, namespace=None, resource_name='',
+        selector=None, timeout=60
+    ):
+        """
+        List the resources and keep the list up to date by watching the
+        changes (list+watch). The watch is resumed from the last seen
+        resourceVersion when the connection drops and the resources are
+        re-listed when the resourceVersion is too old (410 Gone).
+
+        Args:
+            kind (str): The kind of the resource
+            api_version (str): The api version of the resource
+            namespace (str): The namespace of the resource
+            resource_name (str): Watch only the resource with this name
+            selector (str): The label selector to look for
+            timeout (int): Time in seconds after which the iteration stops
+
+        Yields:
+            dict: Snapshot of the current resources: name -> resource data,
+                first right after the initial list and then after every
+                change of the resources
+        """
+        from kubernetes import watch
+        from kubernetes.client.rest import ApiException
+        from urllib3.exceptions import HTTPError
+
+        resource = self.resource(kind, api_version)
+        namespace = self._namespace(resource, namespace)
+        field_selector = (
+            f"metadata.name={resource_name}" if resource_name else None
+        )
+        deadline = time.time() + timeout
+        snapshot = dict()
+        resource_version = None
+        while time.time() < deadline:
+            if resource_version is None:
+                listed = self._to_dict(resource, self.call(
+                    resource.get, namespace=namespace,
+                    label_selector=selector, field_selector=field_selector
+                ))
+                snapshot = {
+                    item['metadata']['name']: item
+                    for item in listed['items']
+                }
+                resource_version = listed['metadata']['resourceVersion']
+                yield dict(snapshot)
+            watcher = watch.Watch()
+            try:
+                for event in watcher.stream(
+                    resource.get, namespace=namespace,
+                    label_selector=selector, field_selector=field_selector,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True, serialize=False,
+                    timeout_seconds=max(1, int(deadline - time.time())),
+                ):
+                    obj = event['raw_object']
+                    if event['type'] == 'ERROR':
+                        if obj.get('code') == 410:
+                            log.debug(
+                                f"resourceVersion {resource_version} of "
+                                f"{kind} is too old, re-listing"
+                            )
+                            resource_version = None
+                            break
+                        raise CommandFailed(
+                            f"Watch of {kind} failed: {obj.get('message')}"
+                        )
+                    resource_version = obj['metadata']['resourceVersion']
+                    if event['type'] == 'BOOKMARK':
+                        continue
+                    obj.setdefault('apiVersion', resource.group_version)
+                    obj.setdefault('kind', resource.kind)
+                    name = obj['metadata']['name']
+                    if event['type'] == 'DELETED':
+                        snapshot.pop(name, None)
+                    else:
+                        snapshot[name] = obj
+                    yield dict(snapshot)
+                    if time.time() >= deadline:
+                        break
+            except ApiException as ex:
+                if ex.status != 410:
+                    raise CommandFailed(f"Watch of {kind} failed: {ex}")
+                resource_version = None
+            except HTTPError as ex:
+                log.debug(
+                    f"Watch of {kind} interrupted ({ex}), resuming from "
+                    f"resourceVersion {resource_version}"
+                )
+            finally:
+                watcher.stop()
+
+    def apply(self, body, namespace=None):
+        """
+        Apply command - equivalent of 'oc apply -f file.yaml -o yaml'
+
+        The existing resource is merge-patched (RFC 7386) or created if it
+        doesn't exist yet. Unlike 'oc apply' there is no three-way merge with
+        the last-applied-configuration annotation, which is neither used nor
+        updated: fields missing in body are kept rather than removed (set
+        them to None for removing them) and lists in body replace the whole
+        lists of the resource. Server-side apply is not used, as it's not
+        available in all the supported cluster versions.
+
+        Args:
+            body (dict): The resource data
+            namespace (str): Namespace to use if not provided in body
+
+        Returns:
+            dict: Dictionary represents a returned yaml file
+        """
+        resource = self.resource(body['kind'], body.get('apiVersion'))
+        metadata = body.get('metadata', {})
+        namespace = self._namespace(
+            resource, metadata.get('namespace') or namespace
+        )
+        try:
+            instance = self.call(
+                resource.patch, body=body, name=metadata.get('name'),
+                namespace=namespace,
+                content_type='application/merge-patch+json',
+            )
+        except CommandFailed as ex:
+            if "(NotFound)" not in str(ex):
+                raise
+            instance = self.call(
+                resource.create, body=body, namespace=namespace
+            )
+        return self._to_dict(resource, instance)
+
+
+_backend_classes = {
+    REST_BACKEND: RESTBackend,
+}
+
+
+def get_backend(name=None):
+    """
+    Get the shared backend instance
+
+    Args:
+        name (str): Name of the backend, config.RUN['ocp_backend'] is used
+            if not provided
+
+    Returns:
+        OCPBackend: The backend instance or None for the 'cli' backend or
+            in case the backend cannot be initialized (the 'oc' path is used
+            as a fallback then)
+
+    Raises:
+        UnsupportedBackendOperation: In case the backend name is unknown
+    """
+    name = name or config.RUN.get('ocp_backend', CLI_BACKEND)
+    if name == CLI_BACKEND:
+        return None
+    kubeconfig = os.getenv('KUBECONFIG')
+    key = (name, kubeconfig)
+    backend_class = _backend_classes.get(name)
+    if backend_class is None:
+        raise UnsupportedBackendOperation(f"Unknown backend {name}")
+    with _backends_lock:
+        if key not in _backends:
+            try:
+                _backends[key] = backend_class(kubeconfig=kubeconfig)
+                log.info(f"Initialized {name} backend for {kubeconfig}")
+            except Exception as ex:
+                log.warning(
+                    f"Failed to initialize {name} backend, falling back to "
+                    f"'oc' cli: {ex}"
+                )
+                _backends[key] = None
+        return _backends[key]
+
+
+def reset_backends():
+    """
+    Drop all the shared backend instances (e.g. after cluster re-deployment)
+    """
+    with _backends_lock:
+        _backends.clear()
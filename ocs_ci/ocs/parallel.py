@@ -1,40 +1,11 @@
 import logging
-import sys
 
-import gevent.pool
-import gevent.queue
+from ocs_ci.utility.executor import Executor
 
 log = logging.getLogger(__name__)
 
 
-class ExceptionHolder(object):
-    def __init__(self, exc_info):
-        self.exc_info = exc_info
-
-
-def capture_traceback(func, *args, **kwargs):
-    """
-    Utility function to capture tracebacks of any exception func
-    raises.
-    """
-    try:
-        return func(*args, **kwargs)
-    except Exception:
-        return ExceptionHolder(sys.exc_info())
-
-
-def resurrect_traceback(exc):
-    if isinstance(exc, ExceptionHolder):
-        exc_info = exc.exc_info
-    elif isinstance(exc, BaseException):
-        exc_info = (type(exc), exc, None)
-    else:
-        return
-
-    raise exc_info[0](exc_info[1]).with_traceback(exc_info[2])
-
-
-class parallel(object):
+class parallel(Executor):
     """
     This class is a context manager for running functions in parallel.
 
@@ -57,64 +28,29 @@ class parallel(object):
 
     At the end of the with block, the main thread waits until all
     spawned functions have completed, or, if one exited with an exception,
-    kills the rest and raises the exception.
-    """
+    cancels the functions which haven't started yet and raises the exception.
 
-    def __init__(self):
-        self.group = gevent.pool.Group()
-        self.results = gevent.queue.Queue()
-        self.count = 0
-        self.any_spawned = False
-        self.iteration_stopped = False
-
-    def spawn(self, func, *args, **kwargs):
-        self.count += 1
-        self.any_spawned = True
-        greenlet = self.group.spawn(capture_traceback, func, *args, **kwargs)
-        greenlet.link(self._finish)
-
-    def __enter__(self):
-        return self
+    The functions run in threads of ocs_ci.utility.executor.Executor, so the
+    blocking calls (e.g. run_cmd()) really overlap.
+    """
 
-    def __exit__(self, type_, value, traceback):
-        self.group.join()
+    def __init__(self, max_workers=None, timeout=None):
+        """
+        Initializer function
 
-        if value is not None:
-            return False
+        Args:
+            max_workers (int): Max number of the functions running at once
+                (default: config.RUN['executor_max_workers'])
+            timeout (float): Max time in seconds of one function
+        """
+        super(parallel, self).__init__(
+            max_workers=max_workers, timeout=timeout, name='parallel tasks'
+        )
 
-        try:
-            # raises if any greenlets exited with an exception
-            for result in self:
-                log.debug('result is %s', repr(result))
-                pass
-        except Exception:
-            # Emit message here because traceback gets stomped when we re-raise
-            log.exception("Exception in parallel execution")
-            raise
-        return True
+    def spawn(self, func, *args, **kwargs):
+        self.submit(func, *args, **kwargs)
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
-        if not self.any_spawned or self.iteration_stopped:
-            raise StopIteration()
-        result = self.results.get()
-
-        try:
-            resurrect_traceback(result)
-        except StopIteration:
-            self.iteration_stopped = True
-            raise
-
-        return result
-
-    def _finish(self, greenlet):
-        if greenlet.successful():
-            self.results.put(greenlet.value)
-        else:
-            self.results.put(greenlet.exception)
-
-        self.count -= 1
-        if self.count <= 0:
-            self.results.put(StopIteration())
+        for result in self.as_completed():
+            log.debug('result is %s', repr(result.value))
+            yield result.value
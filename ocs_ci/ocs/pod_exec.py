@@ -16,8 +16,17 @@ dispatcher class Exec.
 
 from collections import namedtuple
 import logging
-
-from ocs_ci.ocs.exceptions import CommandFailed
+import os
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+
+from ocs_ci.framework import config as ocsci_config
+from ocs_ci.ocs.exceptions import CommandFailed, ExecSessionError
+from ocs_ci.utility import command_stats
+from ocs_ci.utility.utils import mask_secrets
 
 # Upstream KubernetesClient
 from kubernetes import config
@@ -29,6 +38,9 @@ from kubernetes.stream import stream
 
 logger = logging.getLogger(__name__)
 
+# Shell started in the container by the persistent exec sessions
+SESSION_SHELL = '/bin/sh'
+
 """ This dict holds a mapping of stringified class name to class
 
 Used by factory function to dynamically find the class to be instantiated
@@ -170,3 +182,314 @@ class KubClient(object):
             stdout = outbuf
 
         return stdout, stderr, ret
+
+
+class ExecSession(object):
+    """
+    Persistent shell in the pod container over the websocket exec API
+
+    The commands are written to stdin of the shell one by one. Every command
+    is followed by a unique marker with the exit code of the command printed
+    to stdout and another marker printed to stderr, so the output and exit
+    code of each command are framed reliably and the session can be re-used
+    for any number of commands. A session runs one command at a time, see
+    ExecSessionPool for running more commands in the same pod at once.
+    """
+
+    def __init__(self, podname, namespace, container=None, kubeconfig=None):
+        """
+        Initializer function, opens the session
+
+        Args:
+            podname (str): Name of the pod
+            namespace (str): Namespace of the pod
+            container (str): Name of the container, required for pods with
+                more containers
+            kubeconfig (str): Path to the kubeconfig file, the KUBECONFIG
+                environment variable is used if not provided
+
+        Raises:
+            ExecSessionError: In case the session cannot be opened
+        """
+        from kubernetes.client import ApiClient
+
+        self.podname = podname
+        self.namespace = namespace
+        self.container = container
+        # every session has its own client, since stream() patches the
+        # request method of the client for the time the session is opened
+        client_configuration = Configuration()
+        kwargs = {'container': container} if container else {}
+        try:
+            config.load_kube_config(
+                config_file=kubeconfig or os.getenv('KUBECONFIG'),
+                client_configuration=client_configuration,
+            )
+            client_configuration.assert_hostname = False
+            api = core_v1_api.CoreV1Api(
+                ApiClient(configuration=client_configuration)
+            )
+            self._resp = stream(
+                api.connect_get_namespaced_pod_exec,
+                podname,
+                namespace,
+                command=[SESSION_SHELL],
+                stderr=True,
+                stdin=True,
+                stdout=True,
+                tty=False,
+                _preload_content=False,
+                **kwargs
+            )
+        except Exception as ex:
+            raise ExecSessionError(
+                f"Failed to open exec session to {self}: {ex}"
+            )
+
+    def __str__(self):
+        container = f"/{self.container}" if self.container else ''
+        return f"{self.namespace}/{self.podname}{container}"
+
+    def is_open(self):
+        """
+        Returns:
+            bool: True if the session can run commands
+        """
+        return self._resp.is_open()
+
+    def close(self):
+        """
+        Close the session, the running command is killed with the shell
+        """
+        try:
+            self._resp.close()
+        except Exception as ex:
+            logger.debug(f"Failed to close exec session to {self}: {ex}")
+
+    def run(self, command, timeout=600):
+        """
+        Run the command in the shell of the session
+
+        Args:
+            command (str): The shell command to run
+            timeout (int): Time in seconds to wait for the command, the
+                session is closed when the command times out
+
+        Returns:
+            tuple: stdout (str), stderr (str) and exit code (int) of the
+                command
+
+        Raises:
+            CommandFailed: In case the session was closed while running the
+                command (e.g. the pod was deleted)
+            subprocess.TimeoutExpired: In case the command timed out
+        """
+        marker = f"ocs-ci-{uuid.uuid4().hex}"
+        out_end = f"\n{marker} "
+        err_end = f"\n{marker}\n"
+        # stdin of the command is closed, so it can't read the next commands
+        self._resp.write_stdin(
+            f"{{ {command}\n}} </dev/null; "
+            f"printf '\\n{marker} %d\\n' $?; printf '\\n{marker}\\n' >&2\n"
+        )
+        deadline = time.monotonic() + timeout if timeout else None
+        stdout = stderr = ''
+        out_index = err_index = -1
+        while True:
+            if out_index < 0 or '\n' not in stdout[out_index + len(out_end):]:
+                # searching just the newly received data
+                start = max(len(stdout) - len(out_end), 0)
+                stdout += self._resp.read_stdout(timeout=0)
+                if out_index < 0:
+                    out_index = stdout.find(out_end, start)
+            if err_index < 0:
+                start = max(len(stderr) - len(err_end), 0)
+                stderr += self._resp.read_stderr(timeout=0)
+                err_index = stderr.find(err_end, start)
+            if (
+                out_index >= 0 and err_index >= 0
+                and '\n' in stdout[out_index + len(out_end):]
+            ):
+                break
+            if not self._resp.is_open():
+                raise CommandFailed(
+                    f"Exec session to {self} was closed while running: "
+                    f"{command}"
+                )
+            wait = 1
+            if deadline:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    self.close()
+                    raise subprocess.TimeoutExpired(command, timeout)
+            self._resp.update(timeout=wait)
+        returncode = stdout[out_index + len(out_end):].split('\n', 1)[0]
+        return stdout[:out_index], stderr[:err_index], int(returncode)
+
+
+class ExecSessionPool(object):
+    """
+    Pool of the persistent exec sessions keyed by pod and container
+
+    Every command checks out an idle session of the pod container (or opens
+    a new one) and returns it to the pool when finished, so the commands run
+    in the same pod at once (e.g. IO in the background and checksum of
+    a file) get separate sessions.
+    """
+
+    def __init__(self, max_idle=None):
+        """
+        Initializer function
+
+        Args:
+            max_idle (int): Max number of the idle sessions kept per pod
+                container (default: config.RUN['exec_sessions_max_idle'])
+        """
+        self.max_idle = max_idle or ocsci_config.RUN.get(
+            'exec_sessions_max_idle', 2
+        )
+        self._idle = dict()
+        self._lock = threading.Lock()
+
+    def _checkout(self, key):
+        with self._lock:
+            sessions = self._idle.get(key, [])
+            while sessions:
+                session = sessions.pop()
+                if session.is_open():
+                    return session
+        namespace, podname, container, kubeconfig = key
+        return ExecSession(podname, namespace, container, kubeconfig)
+
+    def _checkin(self, key, session):
+        if session.is_open():
+            with self._lock:
+                sessions = self._idle.setdefault(key, [])
+                if len(sessions) < self.max_idle:
+                    sessions.append(session)
+                    return
+        session.close()
+
+    def run(self, podname, namespace, command, container=None, timeout=600):
+        """
+        Run the command in a session of the pod container
+
+        Args:
+            podname (str): Name of the pod
+            namespace (str): Namespace of the pod
+            command (str): The shell command to run
+            container (str): Name of the container
+            timeout (int): Time in seconds to wait for the command
+
+        Returns:
+            tuple: stdout (str), stderr (str) and exit code (int) of the
+                command
+
+        Raises:
+            ExecSessionError: In case the session cannot be opened
+            CommandFailed: In case the session was closed while running the
+                command
+            subprocess.TimeoutExpired: In case the command timed out
+        """
+        key = (namespace, podname, container, os.getenv('KUBECONFIG'))
+        session = self._checkout(key)
+        try:
+            return session.run(command, timeout)
+        finally:
+            self._checkin(key, session)
+
+    def close(self, podname=None, namespace=None):
+        """
+        Close the idle sessions, e.g. of the deleted pod
+
+        Args:
+            podname (str): Name of the pod, all pods if not provided
+            namespace (str): Namespace of the pod, all namespaces if not
+                provided
+        """
+        with self._lock:
+            keys = [
+                key for key in self._idle
+                if podname in (None, key[1]) and namespace in (None, key[0])
+            ]
+            sessions = [
+                session for key in keys for session in self._idle.pop(key)
+            ]
+        for session in sessions:
+            session.close()
+
+
+_session_pool = None
+_session_pool_lock = threading.Lock()
+
+
+def get_session_pool():
+    """
+    Get the process wide pool of the exec sessions
+
+    Returns:
+        ExecSessionPool: The shared pool
+    """
+    global _session_pool
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = ExecSessionPool()
+        return _session_pool
+
+
+def close_sessions():
+    """
+    Close all the idle exec sessions of the process wide pool
+    """
+    with _session_pool_lock:
+        pool = _session_pool
+    if pool:
+        pool.close()
+
+
+def run_in_session(
+    podname, namespace, command, container=None, secrets=None, timeout=600
+):
+    """
+    Run the command in the pod the same way 'oc rsh <pod> <command>' does,
+    but in a persistent exec session of the pod, see ExecSessionPool
+
+    Args:
+        podname (str): Name of the pod
+        namespace (str): Namespace of the pod
+        command (str): The command with arguments, they are quoted for the
+            shell, so no shell syntax is interpreted as with 'oc rsh'
+        container (str): Name of the container
+        secrets (list): A list of secrets to be masked with asterisks
+        timeout (int): Time in seconds to wait for the command
+
+    Returns:
+        str: Masked stdout of the command
+
+    Raises:
+        ExecSessionError: In case the session cannot be opened
+        CommandFailed: In case the command fails
+        subprocess.TimeoutExpired: In case the command timed out
+    """
+    masked_cmd = mask_secrets(command, secrets)
+    logger.info(f"Executing command in {namespace}/{podname}: {masked_cmd}")
+    args = shlex.split(command)
+    start_time = time.time()
+    stdout, stderr, returncode = get_session_pool().run(
+        podname, namespace, ' '.join(shlex.quote(arg) for arg in args),
+        container, timeout,
+    )
+    command_stats.record(
+        f"exec-session {os.path.basename(args[0])}" if args else 'exec-session',
+        masked_cmd, time.time() - start_time, returncode,
+        len(stdout), len(stderr),
+    )
+    logger.debug(f"Command output: {stdout}")
+    if stderr and not returncode:
+        logger.warning(f"Command warning: {mask_secrets(stderr, secrets)}")
+    if returncode:
+        raise CommandFailed(
+            f"Error during execution of command: {masked_cmd}."
+            f"\nError is {mask_secrets(stderr, secrets)}"
+        )
+    return mask_secrets(stdout, secrets)
@@ -0,0 +1,353 @@
+"""
+Session scoped cache of listed resources (list+watch informer)
+
+Helpers like get_all_pods(), get_all_pvcs() or get_node_objs() list the same
+kinds again and again within seconds. When the cache is enabled
+(config.RUN['resource_cache']), the resources of a (kind, namespace) are
+listed once and kept up to date, so the helpers read from memory instead of
+hitting the API server:
+
+* with the 'rest' backend the resources are watched by a background thread
+  and the cache is updated as soon as the change happens
+* with the 'cli' backend the cache is re-listed when it is older than the
+  requested max_staleness
+
+Every read can specify how fresh the data has to be by max_staleness (in
+seconds, default: config.RUN['resource_cache_max_staleness']) or can force
+re-list of the resources by force_refresh.
+"""
+import logging
+import os
+import threading
+import time
+from copy import deepcopy
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.ocp import OCP
+
+log = logging.getLogger(__name__)
+
+# Time in seconds after which the watch is re-established with a fresh list
+WATCH_TIMEOUT = 60
+
+_caches = dict()
+_caches_lock = threading.Lock()
+
+
+def _split_selector(selector):
+    """
+    Split the label selector to requirements by commas which are not part
+    of the set based requirement value list, e.g. 'app in (a,b),tier'
+    """
+    requirements, depth, current = [], 0, ''
+    for char in selector:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == ',' and not depth:
+            requirements.append(current.strip())
+            current = ''
+        else:
+            current += char
+    if current.strip():
+        requirements.append(current.strip())
+    return requirements
+
+
+def labels_match(labels, selector):
+    """
+    Check if labels match the label selector, both equality based
+    (app=x, app==x, app!=x) and set based (app in (x,y), app notin (x,y),
+    app, !app) requirements are supported
+
+    Args:
+        labels (dict): Labels of the resource
+        selector (str): The label selector
+
+    Returns:
+        bool: True if the labels match all the selector requirements
+    """
+    labels = labels or {}
+    for requirement in _split_selector(selector or ''):
+        if ' notin ' in requirement or ' in ' in requirement:
+            negate = ' notin ' in requirement
+            key, values = requirement.split(
+                ' notin ' if negate else ' in ', 1
+            )
+            values = {
+                value.strip() for value in values.strip(' ()').split(',')
+            }
+            if (labels.get(key.strip()) in values) == negate:
+                return False
+        elif '!=' in requirement:
+            key, value = requirement.split('!=', 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif '=' in requirement:
+            key, value = requirement.replace('==', '=').split('=', 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith('!'):
+            if requirement[1:].strip() in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
+
+
+class ResourceCache(object):
+    """
+    Cache of all the resources of one kind in one namespace
+    """
+
+    def __init__(self, kind, namespace=None):
+        """
+        Initializer function
+
+        Args:
+            kind (str): The kind of the cached resources
+            namespace (str): The namespace of the resources, the current
+                project is used (same as for OCP.get()) if not provided
+        """
+        self.kind = kind
+        self.namespace = namespace
+        self.ocp = OCP(kind=kind, namespace=namespace)
+        self._items = dict()
+        self._synced_at = None
+        self._watching = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watch_thread = None
+
+    @property
+    def staleness(self):
+        """
+        Age of the cached data in seconds, 0 when the resources are being
+        watched
+
+        Returns:
+            float: The age of the data, infinity if the data were not
+                listed yet
+        """
+        if self._watching:
+            return 0
+        if self._synced_at is None:
+            return float('inf')
+        return time.time() - self._synced_at
+
+    def refresh(self):
+        """
+        List the resources and replace the cached data
+        """
+        listed = self.ocp.get()
+        with self._lock:
+            self._items = {
+                item['metadata']['name']: item for item in listed['items']
+            }
+            self._synced_at = time.time()
+        self._start_watch()
+
+    def _start_watch(self):
+        """
+        Start the background watch if the backend supports watching, a new
+        watch is started when the previous one was stopped, even if its
+        thread is still finishing
+        """
+        if not hasattr(self.ocp.backend, 'iter_snapshots'):
+            return
+        with self._lock:
+            if (
+                self._watch_thread and self._watch_thread.is_alive()
+                and not self._stop.is_set()
+            ):
+                return
+            # every watch has its own stop event, so the stopped watch can't
+            # update the data anymore while the new one is running
+            self._stop = threading.Event()
+            self._watch_thread = threading.Thread(
+                target=self._watch, args=(self._stop,), daemon=True,
+                name=f"cache-{self.kind}-{self.namespace}",
+            )
+            self._watch_thread.start()
+
+    def _watch(self, stop):
+        """
+        Keep the cached data up to date by the list+watch of the backend
+
+        Args:
+            stop (threading.Event): The stop event of this watch
+        """
+        while not stop.is_set():
+            try:
+                for snapshot in self.ocp.backend.iter_snapshots(
+                    self.kind, namespace=self.namespace, timeout=WATCH_TIMEOUT
+                ):
+                    with self._lock:
+                        if stop.is_set():
+                            break
+                        self._items = snapshot
+                        self._synced_at = time.time()
+                        self._watching = True
+            except Exception as ex:
+                log.warning(
+                    f"Watch of {self.kind} in {self.namespace} failed: {ex}"
+                )
+                self._set_not_watching(stop)
+                stop.wait(5)
+            self._set_not_watching(stop)
+
+    def _set_not_watching(self, stop):
+        """
+        Mark the data as not watched, unless a newer watch is running
+        """
+        with self._lock:
+            if stop is self._stop:
+                self._watching = False
+
+    def stop(self):
+        """
+        Stop the background watch, the data are re-listed on next read
+        """
+        with self._lock:
+            self._stop.set()
+            self._watching = False
+            self._synced_at = None
+
+    def get_item(self, name):
+        """
+        Get the cached resource without refreshing the cache
+
+        Args:
+            name (str): Name of the resource
+
+        Returns:
+            dict: Copy of the data of the resource, None if not cached
+        """
+        with self._lock:
+            item = self._items.get(name)
+        return deepcopy(item) if item is not None else None
+
+    def items(self, selector=None, max_staleness=None, force_refresh=False):
+        """
+        Get the cached resources
+
+        Args:
+            selector (str): The label selector to look for
+            max_staleness (float): Max age of the data in seconds, the
+                resources are re-listed if the cached data are older
+                (default: config.RUN['resource_cache_max_staleness'])
+            force_refresh (bool): True for re-listing the resources
+                regardless of their age
+
+        Returns:
+            list: Copies of the data of the matching resources
+        """
+        if max_staleness is None:
+            max_staleness = config.RUN.get('resource_cache_max_staleness', 0)
+        if force_refresh or self.staleness > max_staleness:
+            self.refresh()
+        with self._lock:
+            items = list(self._items.values())
+        return [
+            deepcopy(item) for item in items if labels_match(
+                item.get('metadata', {}).get('labels'), selector
+            )
+        ]
+
+
+def get_cache(kind, namespace=None):
+    """
+    Get the shared cache of the kind in the namespace
+
+    Args:
+        kind (str): The kind of the cached resources
+        namespace (str): The namespace of the resources
+
+    Returns:
+        ResourceCache: The shared cache instance
+    """
+    key = (kind.lower(), namespace, os.getenv('KUBECONFIG'))
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = ResourceCache(kind, namespace)
+        return _caches[key]
+
+
+def get_items(
+    kind, namespace=None, selector=None, max_staleness=None,
+    force_refresh=False
+):
+    """
+    Get the resources of the kind in the namespace, from the cache if it is
+    enabled by config.RUN['resource_cache'] or directly from the cluster
+
+    Args:
+        kind (str): The kind of the resources
+        namespace (str): The namespace of the resources
+        selector (str): The label selector to look for
+        max_staleness (float): Max age of the cached data in seconds
+        force_refresh (bool): True for re-listing the cached resources
+
+    Returns:
+        list: Data of the resources
+    """
+    if not config.RUN.get('resource_cache'):
+        return OCP(kind=kind, namespace=namespace).get(
+            selector=selector
+        )['items']
+    return get_cache(kind, namespace).items(
+        selector=selector, max_staleness=max_staleness,
+        force_refresh=force_refresh,
+    )
+
+
+def get_watched_item(kind, namespace, name):
+    """
+    Get the resource from the cache of the kind in the namespace, only when
+    the cache exists and is kept up to date by a watch, no cache is created
+    and nothing is listed
+
+    Args:
+        kind (str): The kind of the resource
+        namespace (str): The namespace of the resource
+        name (str): Name of the resource
+
+    Returns:
+        dict: Copy of the data of the resource, None if not available
+    """
+    if not (config.RUN.get('resource_cache') and kind and name):
+        return None
+    key = (kind.lower(), namespace, os.getenv('KUBECONFIG'))
+    with _caches_lock:
+        cache = _caches.get(key)
+    if cache is None or cache.staleness:
+        return None
+    return cache.get_item(name)
+
+
+def invalidate(kind=None, namespace=None):
+    """
+    Invalidate the cached data, next read re-lists the resources
+
+    Args:
+        kind (str): Invalidate only caches of this kind
+        namespace (str): Invalidate only caches in this namespace
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        if kind and cache.kind.lower() != kind.lower():
+            continue
+        if namespace and cache.namespace != namespace:
+            continue
+        cache.stop()
+
+
+def stop_all():
+    """
+    Stop all the caches, meant to be called at the end of the session
+    """
+    invalidate()
+    with _caches_lock:
+        _caches.clear()
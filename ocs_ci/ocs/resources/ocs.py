@@ -2,8 +2,11 @@
 General OCS object
 """
 import logging
+import time
 import yaml
 import tempfile
+from ocs_ci.framework import config
+from ocs_ci.ocs import resource_cache
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.utility import utils
 from ocs_ci.utility import templating
@@ -11,6 +14,22 @@ from ocs_ci.utility import templating
 log = logging.getLogger(__name__)
 
 
+def get_resource_version(data):
+    """
+    Get the resourceVersion of the resource as a number for comparison
+
+    Args:
+        data (dict): The resource data
+
+    Returns:
+        int: The resourceVersion, None if missing or not numeric
+    """
+    version = data.get('metadata', {}).get('resourceVersion')
+    if version and str(version).isdigit():
+        return int(version)
+    return None
+
+
 class OCS(object):
     """
     Base OCSClass
@@ -43,9 +62,9 @@ class OCS(object):
             api_version=self._api_version, kind=self.kind,
             namespace=self._namespace
         )
-        self.temp_yaml = tempfile.NamedTemporaryFile(
-            mode='w+', prefix=self._kind, delete=False
-        )
+        # The manifests are piped to 'oc', the temporary file is created
+        # only when requested for debugging (see the temp_yaml property)
+        self._temp_yaml = getattr(self, '_temp_yaml', None)
         # This _is_delete flag is set to True if the delete method was called
         # on object of this class and was successfull.
         self._is_deleted = False
@@ -70,15 +89,70 @@ class OCS(object):
     def is_deleted(self):
         return self._is_deleted
 
-    def reload(self):
+    @property
+    def temp_yaml(self):
+        """
+        Temporary file for the manifest of the resource, created on the
+        first access, the manifests are dumped to it only when enabled by
+        config.RUN['keep_manifests']
+
+        Returns:
+            tempfile.NamedTemporaryFile: The temporary file
+        """
+        if self._temp_yaml is None:
+            self._temp_yaml = tempfile.NamedTemporaryFile(
+                mode='w+', prefix=self._kind, delete=False
+            )
+        return self._temp_yaml
+
+    def reload(self, changed=False):
         """
         Reloading the OCS instance with the new information from its actual
         data.
         After creating a resource from a yaml file, the actual yaml file is
         being changed and more information about the resource is added.
+
+        The object is updated in place. The data are read from the watched
+        resource cache when present (see ocs_ci.ocs.resource_cache), unless
+        the cached data are older than the current ones, otherwise by 'oc
+        get'. Nothing is updated when the resourceVersion hasn't changed.
+
+        Args:
+            changed (bool): True when the resource was just changed, so the
+                cached data are used only with a newer resourceVersion
         """
-        self.data = self.get()
-        self.__init__(**self.data)
+        current = get_resource_version(self.data)
+        data = resource_cache.get_watched_item(
+            self.kind, self.namespace, self.name
+        )
+        if data is not None:
+            cached = get_resource_version(data)
+            if (
+                cached is None or current is None or cached < current
+                or (changed and cached == current)
+            ):
+                data = None
+        if data is None:
+            data = self.get()
+        if current is not None and get_resource_version(data) == current:
+            return
+        self.set_data(data)
+
+    def set_data(self, data):
+        """
+        Update the object in place with the actual data of the resource,
+        e.g. returned by the create command
+
+        Args:
+            data (dict): The resource data
+        """
+        self.data = data
+        metadata = data.get('metadata', {})
+        self._name = metadata.get('name', getattr(self, '_name', None))
+        self._namespace = metadata.get('namespace', self._namespace)
+        # e.g. the namespace of a resource created in the current project is
+        # filled in by the server
+        self.ocp.namespace = self._namespace
 
     def get(self, out_yaml_format=True):
         return self.ocp.get(
@@ -90,10 +164,17 @@ class OCS(object):
 
     def create(self, do_reload=True):
         log.info(f"Adding {self.kind} with name {self.name}")
-        templating.dump_data_to_temp_yaml(self.data, self.temp_yaml.name)
-        status = self.ocp.create(yaml_file=self.temp_yaml.name)
+        if config.RUN.get('keep_manifests'):
+            templating.dump_data_to_temp_yaml(self.data, self.temp_yaml.name)
+            status = self.ocp.create(yaml_file=self.temp_yaml.name)
+        else:
+            status = self.ocp.create(data=self.data)
         if do_reload:
-            self.reload()
+            if isinstance(status, dict) and status.get('metadata'):
+                # the created resource is returned, no need to get it
+                self.set_data(status)
+            else:
+                self.reload()
         return status
 
     def delete(self, wait=True, force=False):
@@ -123,12 +204,14 @@ class OCS(object):
         return result
 
     def apply(self, **data):
-        with open(self.temp_yaml.name, 'w') as yaml_file:
-            yaml.dump(data, yaml_file)
-        assert self.ocp.apply(yaml_file=self.temp_yaml.name), (
-            f"Failed to apply changes {data}"
-        )
-        self.reload()
+        if config.RUN.get('keep_manifests'):
+            with open(self.temp_yaml.name, 'w') as yaml_file:
+                yaml.dump(data, yaml_file)
+            applied = self.ocp.apply(yaml_file=self.temp_yaml.name)
+        else:
+            applied = self.ocp.apply(data=data)
+        assert applied, f"Failed to apply changes {data}"
+        self.reload(changed=True)
 
     def add_label(self, label):
         """
@@ -139,8 +222,84 @@ class OCS(object):
                 E.g: "label=app='rook-ceph-mds'"
         """
         status = self.ocp.add_label(resource_name=self.name, label=label)
-        self.reload()
+        self.reload(changed=True)
         return status
 
     def delete_temp_yaml_file(self):
-        utils.delete_file(self.temp_yaml.name)
+        if self._temp_yaml is not None:
+            utils.delete_file(self._temp_yaml.name)
+
+
+def delete_many(objs, wait=True, force=False, timeout=600):
+    """
+    Delete the OCS objects grouped by their kind and namespace, every group
+    is deleted at once and waited for by one watch or list, see
+    OCP.delete_many(). Already deleted objects are skipped.
+
+    Args:
+        objs (list): The OCS objects (e.g. PVCs, pods) to delete
+        wait (bool): Wait for all the objects to be deleted
+        force (bool): Force delete the objects
+        timeout (int): Time in seconds to wait for the deletion of a group
+
+    Returns:
+        bool: True in case the deletion is successful
+    """
+    groups = dict()
+    for obj in objs:
+        if not obj.is_deleted:
+            key = (obj.api_version, obj.kind, obj.namespace)
+            groups.setdefault(key, []).append(obj)
+    for (api_version, kind, namespace), group in groups.items():
+        OCP(
+            api_version=api_version, kind=kind, namespace=namespace
+        ).delete_many(
+            [obj.name for obj in group], wait=wait, force=force,
+            timeout=timeout
+        )
+        for obj in group:
+            obj._is_deleted = True
+    return True
+
+
+def wait_for_all(resources, state, timeout=60, sleep=3):
+    """
+    Wait for all the OCS objects to reach the state, the objects are grouped
+    by their kind and namespace and every group is tracked by one watch or
+    list, see OCP.wait_for_many(). The objects are updated in place with the
+    data they reached the state with.
+
+    Args:
+        resources (list): The OCS objects (e.g. PVCs, pods) to wait for
+        state (str): The status to wait for
+        timeout (int): Time in seconds to wait for all the objects
+        sleep (int): Sampling time in seconds
+
+    Returns:
+        list: Time in seconds it took every object to reach the state since
+            the wait started, in the order of resources
+
+    Raises:
+        ResourcesWrongStatusException: In case any of the objects didn't
+            reach the state in time or failed, the laggards are named in
+            the exception
+    """
+    start_time = time.time()
+    groups = dict()
+    for obj in resources:
+        key = (obj.api_version, obj.kind, obj.namespace)
+        groups.setdefault(key, []).append(obj)
+    reach_times = dict()
+    for (api_version, kind, namespace), group in groups.items():
+        offset = time.time() - start_time
+        reached = OCP(
+            api_version=api_version, kind=kind, namespace=namespace
+        ).wait_for_many(
+            [obj.name for obj in group], state,
+            timeout=max(timeout - offset, 0), sleep=sleep
+        )
+        for obj in group:
+            seconds, data = reached[obj.name]
+            obj.set_data(data)
+            reach_times[id(obj)] = offset + seconds
+    return [reach_times[id(obj)] for obj in resources]
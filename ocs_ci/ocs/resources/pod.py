@@ -6,22 +6,26 @@ Each pod in the openshift cluster will have a corresponding pod object
 import logging
 import os
 import re
+import shlex
+import subprocess
+import tarfile
 import yaml
-import tempfile
 import time
 import calendar
+from collections import namedtuple
 from threading import Thread
 import base64
 
-from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.ocp import OCP, get_status_from_data
 from tests import helpers
 from ocs_ci.ocs import workload
-from ocs_ci.ocs import constants, defaults, node
+from ocs_ci.ocs import constants, defaults, node, pod_exec, resource_cache
 from ocs_ci.framework import config
-from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.exceptions import CommandFailed, ExecSessionError
 from ocs_ci.ocs.resources.ocs import OCS
-from ocs_ci.utility import templating
-from ocs_ci.utility.utils import TimeoutSampler
+from ocs_ci.utility import memoization, templating
+from ocs_ci.utility.executor import Executor
+from ocs_ci.utility.utils import TimeoutSampler, run_cmd_pipe, run_cmd_stream
 
 logger = logging.getLogger(__name__)
 FIO_TIMEOUT = 600
@@ -39,6 +43,22 @@ TEXT_CONTENT = (
 )
 TEST_FILE = '/var/lib/www/html/test'
 
+# Policies of exec_on_pods() for the failed commands: return the failures in
+# the results, raise when all the commands finished or raise on the first
+# failure without starting the remaining commands
+EXEC_POLICY_CONTINUE = 'continue'
+EXEC_POLICY_RAISE = 'raise'
+EXEC_POLICY_FAIL_FAST = 'fail_fast'
+
+"""Result of the command run by exec_on_pods() on one pod"""
+PodExecResult = namedtuple('PodExecResult', [
+    'pod',
+    'rc',
+    'stdout',
+    'duration',
+    'error',
+])
+
 
 class Pod(OCS):
     """
@@ -55,9 +75,6 @@ class Pod(OCS):
         self.pod_data = kwargs
         super(Pod, self).__init__(**kwargs)
 
-        self.temp_yaml = tempfile.NamedTemporaryFile(
-            mode='w+', prefix='POD_', delete=False
-        )
         self._name = self.pod_data.get('metadata').get('name')
         self._labels = self.get_labels()
         self._roles = []
@@ -79,6 +96,17 @@ class Pod(OCS):
     def namespace(self):
         return self._namespace
 
+    def set_data(self, data):
+        """
+        Update the pod in place with the actual data of the pod
+
+        Args:
+            data (dict): The pod data
+        """
+        super(Pod, self).set_data(data)
+        self.pod_data = data
+        self._labels = self.get_labels()
+
     @property
     def roles(self):
         return self._roles
@@ -130,6 +158,11 @@ class Pod(OCS):
         """
         Execute a command on a pod (e.g. oc rsh)
 
+        When enabled by config.RUN['exec_sessions'], the command runs in
+        a persistent exec session of the pod instead of forking 'oc rsh',
+        see ocs_ci.ocs.pod_exec.ExecSessionPool. 'oc rsh' is used when the
+        session cannot be opened or for kwargs other than timeout.
+
         Args:
             command (str): The command to execute on the given pod
             out_yaml_format (bool): whether to return yaml loaded python
@@ -142,10 +175,123 @@ class Pod(OCS):
         Returns:
             Munch Obj: This object represents a returned yaml file
         """
+        if config.RUN.get('exec_sessions') and set(kwargs) <= {'timeout'}:
+            containers = self.pod_data.get('spec', {}).get('containers')
+            try:
+                out = pod_exec.run_in_session(
+                    self.name, self.namespace, command,
+                    container=containers[0]['name'] if containers else None,
+                    secrets=secrets, timeout=kwargs.get('timeout', 600),
+                )
+            except ExecSessionError as ex:
+                logger.warning(f"{ex}, falling back to oc rsh")
+            else:
+                return self.ocp.parse_oc_output(out, out_yaml_format)
         rsh_cmd = f"rsh {self.name} "
         rsh_cmd += command
         return self.ocp.exec_oc_cmd(rsh_cmd, out_yaml_format, secrets=secrets, **kwargs)
 
+    def _get_tar_cmd(self, tar_cmd, container=None):
+        """
+        Build the 'oc exec' command running the shell command with tar in
+        the pod, with stdin attached for receiving the archive
+        """
+        container = f"-c {container} " if container else ''
+        return self.ocp.get_oc_cmd(
+            f"exec -i {self.name} {container}-- sh -c {shlex.quote(tar_cmd)}"
+        )
+
+    def upload(
+        self, local_paths, remote_dir, compress=False, container=None,
+        timeout=None
+    ):
+        """
+        Upload local files and directories to the pod, streamed as a tar
+        archive over 'oc exec' without any temporary files
+
+        Args:
+            local_paths (str or list): The local file(s) or directory(ies),
+                directories are uploaded recursively
+            remote_dir (str): The directory in the pod to upload to, it's
+                created if it doesn't exist
+            compress (bool): True for compressing the archive by gzip, worth
+                it for compressible data over slow connection
+            container (str): Name of the container, the first container of
+                the pod by default
+            timeout (int): Time in seconds after which the transfer is
+                killed
+
+        Returns:
+            int: Number of the transferred bytes of the archive
+
+        Raises:
+            CommandFailed: In case the transfer fails
+        """
+        if isinstance(local_paths, str):
+            local_paths = [local_paths]
+        flags = 'xzf' if compress else 'xf'
+        quoted_dir = shlex.quote(remote_dir)
+        cmd = self._get_tar_cmd(
+            f"mkdir -p {quoted_dir} && tar {flags} - -C {quoted_dir}",
+            container,
+        )
+        logger.info(f"Uploading {local_paths} to {self.name}:{remote_dir}")
+        with run_cmd_pipe(cmd, mode='w', timeout=timeout) as pipe:
+            with tarfile.open(
+                fileobj=pipe, mode='w|gz' if compress else 'w|'
+            ) as tar:
+                for path in local_paths:
+                    tar.add(
+                        path, arcname=os.path.basename(path.rstrip(os.sep))
+                    )
+        return pipe.bytes
+
+    def download(
+        self, remote_paths, local_dir, compress=False, container=None,
+        timeout=None
+    ):
+        """
+        Download files and directories from the pod, streamed as a tar
+        archive over 'oc exec' without any temporary files
+
+        Args:
+            remote_paths (str or list): The file(s) or directory(ies) in the
+                pod, directories are downloaded recursively
+            local_dir (str): The local directory to download to, it's
+                created if it doesn't exist
+            compress (bool): True for compressing the archive by gzip
+            container (str): Name of the container, the first container of
+                the pod by default
+            timeout (int): Time in seconds after which the transfer is
+                killed
+
+        Returns:
+            int: Number of the transferred bytes of the archive
+
+        Raises:
+            CommandFailed: In case the transfer fails
+        """
+        if isinstance(remote_paths, str):
+            remote_paths = [remote_paths]
+        members = ' '.join(
+            f"-C {shlex.quote(os.path.dirname(path.rstrip('/')) or '.')} "
+            f"{shlex.quote(os.path.basename(path.rstrip('/')))}"
+            for path in remote_paths
+        )
+        cmd = self._get_tar_cmd(
+            f"tar {'czf' if compress else 'cf'} - {members}", container
+        )
+        logger.info(f"Downloading {remote_paths} from {self.name} to {local_dir}")
+        os.makedirs(local_dir, exist_ok=True)
+        with run_cmd_pipe(cmd, mode='r', timeout=timeout) as pipe:
+            with tarfile.open(
+                fileobj=pipe, mode='r|gz' if compress else 'r|'
+            ) as tar:
+                for member in tar:
+                    if is_safe_tar_member(member, local_dir):
+                        tar.extract(member, local_dir)
+        return pipe.bytes
+
     def exec_bash_cmd_on_pod(self, command):
         """
         Execute a pure bash command on a pod via oc exec where you can use
@@ -174,7 +320,8 @@ class Pod(OCS):
 
     def exec_ceph_cmd(self, ceph_cmd, format='json-pretty'):
         """
-        Execute a Ceph command on the Ceph tools pod
+        Execute a Ceph command on the Ceph tools pod, the JSON formats are
+        run by CephToolsClient in the exec session of the pod
 
         Args:
             ceph_cmd (str): The Ceph command to execute on the Ceph tools pod
@@ -190,10 +337,27 @@ class Pod(OCS):
             raise CommandFailed(
                 "Ceph commands can be executed only on toolbox pod"
             )
-        ceph_cmd = ceph_cmd
+        if format in ('json', 'json-pretty'):
+            # importing here to avoid circular import
+            from ocs_ci.ocs.ceph_tools import CephToolsClient
+            out = CephToolsClient(self).run(ceph_cmd, format='json')
+            if isinstance(out, list):
+                return [item for item in out if item]
+            return out
         if format:
             ceph_cmd += f" --format {format}"
-        out = self.exec_cmd_on_pod(ceph_cmd)
+        try:
+            out = self.exec_cmd_on_pod(ceph_cmd)
+        except CommandFailed as ex:
+            if 'NotFound' not in str(ex):
+                raise
+            # The toolbox pod was respun, retry on the new one
+            logger.warning(
+                f"Ceph tools pod {self.name} not found, retrying on the "
+                f"current Ceph tools pod"
+            )
+            memoization.invalidate(memoization.TOOLBOX)
+            out = get_ceph_tools_pod().exec_cmd_on_pod(ceph_cmd)
 
         # For some commands, like "ceph fs ls", the returned output is a list
         if isinstance(out, list):
@@ -300,9 +464,92 @@ class Pod(OCS):
         wl.run()
 
 
+class PodRecord(object):
+    """
+    Lightweight read-only view of the pod for bulk listings, see
+    list_pod_records()
+
+    The record holds just the fields needed for listings and the raw pod
+    data. Other attributes and methods (e.g. exec_cmd_on_pod) are looked up
+    on the full Pod object, which is created on their first access only.
+    """
+
+    __slots__ = ('name', 'namespace', 'labels', 'phase', 'node', 'data', '_pod')
+
+    def __init__(self, data):
+        """
+        Initializer function
+
+        Args:
+            data (dict): The pod data as returned by 'oc get pod -o json'
+        """
+        metadata = data['metadata']
+        self.name = metadata['name']
+        self.namespace = metadata.get('namespace')
+        self.labels = metadata.get('labels') or {}
+        self.phase = data.get('status', {}).get('phase')
+        self.node = data.get('spec', {}).get('nodeName')
+        self.data = data
+        self._pod = None
+
+    def __repr__(self):
+        return f"PodRecord({self.namespace}/{self.name}, {self.phase})"
+
+    def __getattr__(self, name):
+        # called only for the attributes which are not in the record
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.to_pod(), name)
+
+    @property
+    def status(self):
+        """
+        Returns:
+            str: The status of the pod as shown by 'oc get pod'
+        """
+        return get_status_from_data(self.data)
+
+    def to_pod(self):
+        """
+        Promote the record to the full Pod object, created once per record
+
+        Returns:
+            Pod: The Pod object
+        """
+        if self._pod is None:
+            self._pod = Pod(**self.data)
+        return self._pod
+
+
+def list_pod_records(
+    namespace=None, selector=None, max_staleness=None, force_refresh=False
+):
+    """
+    Get the lightweight records of the pods, much cheaper than the Pod
+    objects of get_all_pods() for big listings
+
+    Args:
+        namespace (str): Name of the namespace, all namespaces if None
+        selector (str): The label selector to look for
+        max_staleness (float): Max age in seconds of the pods data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached pods
+
+    Returns:
+        list: List of PodRecord objects
+    """
+    pods = resource_cache.get_items(
+        constants.POD, namespace=namespace, selector=selector,
+        max_staleness=max_staleness, force_refresh=force_refresh,
+    )
+    return [PodRecord(pod) for pod in pods]
+
+
 # Helper functions for Pods
 
-def get_all_pods(namespace=None, selector=None):
+def get_all_pods(
+    namespace=None, selector=None, max_staleness=None, force_refresh=False
+):
     """
     Get all pods in a namespace.
 
@@ -311,13 +558,18 @@ def get_all_pods(namespace=None, selector=None):
             If namespace is None - get all pods
         selector (list) : List of the resource selector to search with
             Example: ['alertmanager','prometheus']
+        max_staleness (float): Max age in seconds of the pods data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached pods
 
     Returns:
         list: List of Pod objects
 
     """
-    ocp_pod_obj = OCP(kind=constants.POD, namespace=namespace)
-    pods = ocp_pod_obj.get()['items']
+    pods = resource_cache.get_items(
+        constants.POD, namespace=namespace, max_staleness=max_staleness,
+        force_refresh=force_refresh,
+    )
     if selector:
         pods_new = [pod for pod in pods if pod['metadata']['labels'].get('app') in selector]
         pods = pods_new
@@ -325,9 +577,56 @@ def get_all_pods(namespace=None, selector=None):
     return pod_objs
 
 
+def is_safe_tar_member(member, local_dir):
+    """
+    Check the member of the archive created in the pod can be extracted to
+    the local directory: links and special files are skipped, a path out of
+    the directory (absolute or with '..') is refused
+
+    Args:
+        member (tarfile.TarInfo): The member of the archive
+        local_dir (str): The directory the archive is extracted to
+
+    Returns:
+        bool: True for a regular file or directory to extract, False for
+            a skipped member
+
+    Raises:
+        CommandFailed: In case the path of the member is out of local_dir
+    """
+    root = os.path.realpath(local_dir)
+    path = os.path.realpath(os.path.join(root, member.name))
+    if os.path.commonpath([root, path]) != root:
+        raise CommandFailed(
+            f"Refusing to extract {member.name} out of {local_dir}"
+        )
+    if not (member.isfile() or member.isdir()):
+        logger.warning(f"Skipping {member.name}, it's not a file or directory")
+        return False
+    return True
+
+
 def get_ceph_tools_pod():
     """
-    Get the Ceph tools pod
+    Get the Ceph tools pod, the found pod is memoized (see
+    ocs_ci.utility.memoization) and only checked to be still Running on
+    every call, a new one is looked up when the pod was respun
+
+    Returns:
+        Pod object: The Ceph tools pod object
+    """
+    ceph_pod = _find_ceph_tools_pod()
+    if is_pod_running(ceph_pod):
+        return ceph_pod
+    logger.info(f"Ceph tools pod {ceph_pod.name} is gone, looking up a new one")
+    memoization.invalidate(memoization.TOOLBOX)
+    return _find_ceph_tools_pod()
+
+
+@memoization.memoize(group=memoization.TOOLBOX)
+def _find_ceph_tools_pod():
+    """
+    Look up the Running Ceph tools pod, see get_ceph_tools_pod()
 
     Returns:
         Pod object: The Ceph tools pod object
@@ -344,9 +643,7 @@ def get_ceph_tools_pod():
     # one in status Terminated. Therefore, need to filter out the Terminated pod
     running_ct_pods = list()
     for pod in ct_pod_items:
-        if ocp_pod_obj.get_resource_status(
-            pod.get('metadata').get('name')
-        ) == constants.STATUS_RUNNING:
+        if get_status_from_data(pod) == constants.STATUS_RUNNING:
             running_ct_pods.append(pod)
 
     assert running_ct_pods, "No running Ceph tools pod found"
@@ -354,6 +651,32 @@ def get_ceph_tools_pod():
     return ceph_pod
 
 
+def is_pod_running(pod_obj):
+    """
+    Check the pod still exists and is Running, the pod is read from the
+    watched resource cache when available, so the check doesn't query the
+    API server
+
+    Args:
+        pod_obj (Pod): The pod object
+
+    Returns:
+        bool: True if the pod is Running and not being deleted
+    """
+    data = resource_cache.get_watched_item(
+        constants.POD, pod_obj.namespace, pod_obj.name
+    )
+    if data is None:
+        try:
+            data = pod_obj.ocp.get(resource_name=pod_obj.name)
+        except CommandFailed:
+            return False
+    return (
+        get_status_from_data(data) == constants.STATUS_RUNNING
+        and not data.get('metadata', {}).get('deletionTimestamp')
+    )
+
+
 def get_rbd_provisioner_pod():
     """
     Get the RBD provisioner pod
@@ -553,6 +876,154 @@ def run_io_in_bg(pod_obj, expect_to_fail=False):
     return thread
 
 
+def _exec_on_pod(pod_obj, command, out_yaml_format, **kwargs):
+    """
+    Run the command on the pod for exec_on_pods()
+
+    Returns:
+        PodExecResult: The result of the command
+    """
+    if callable(command):
+        command = command(pod_obj)
+    start_time = time.time()
+    try:
+        out = pod_obj.exec_cmd_on_pod(command, out_yaml_format, **kwargs)
+    except (CommandFailed, subprocess.TimeoutExpired) as ex:
+        return PodExecResult(pod_obj, 1, None, time.time() - start_time, ex)
+    return PodExecResult(pod_obj, 0, out, time.time() - start_time, None)
+
+
+def iter_exec_on_pods(
+    pod_objs, command, max_parallel=None, policy=EXEC_POLICY_RAISE,
+    out_yaml_format=False, **kwargs
+):
+    """
+    Run the command on the pods in parallel and yield the results as the
+    commands finish
+
+    Args:
+        pod_objs (list): List of the Pod objects
+        command (str or callable): The command to execute on each pod, or
+            a function returning the command for the given Pod object
+        max_parallel (int): Max number of the commands running at once
+            (default: config.RUN['exec_max_parallel'])
+        policy (str): What to do with the failed commands, one of
+            EXEC_POLICY_CONTINUE, EXEC_POLICY_RAISE or EXEC_POLICY_FAIL_FAST
+        out_yaml_format (bool): whether to return yaml loaded python
+            object OR to return raw output
+        kwargs (dict): Passed to Pod.exec_cmd_on_pod(), e.g. timeout
+
+    Yields:
+        PodExecResult: Results in the order the commands finished, rc is 0
+            for the succeeded commands, otherwise 1 and error holds the
+            exception
+
+    Raises:
+        CommandFailed: In case any command failed and the policy is
+            EXEC_POLICY_RAISE or EXEC_POLICY_FAIL_FAST
+    """
+    if policy not in (
+        EXEC_POLICY_CONTINUE, EXEC_POLICY_RAISE, EXEC_POLICY_FAIL_FAST
+    ):
+        raise ValueError(f"Unknown exec policy: {policy}")
+    pod_objs = list(pod_objs)
+    if not pod_objs:
+        return
+    max_parallel = max_parallel or config.RUN.get('exec_max_parallel', 16)
+    failed = []
+    # the commands don't raise, their errors are in the results
+    executor = Executor(
+        max_workers=min(max_parallel, len(pod_objs)), fail_fast=False,
+        name='pod commands'
+    )
+    try:
+        for pod_obj in pod_objs:
+            executor.submit(
+                _exec_on_pod, pod_obj, command, out_yaml_format, **kwargs
+            )
+        for task_result in executor.as_completed():
+            result = task_result.value
+            if result.error:
+                logger.error(
+                    f"Command failed on pod {result.pod.name}: "
+                    f"{result.error}"
+                )
+                failed.append(result)
+            yield result
+            if failed and policy == EXEC_POLICY_FAIL_FAST:
+                break
+    finally:
+        # not starting the remaining commands when stopped early
+        executor.shutdown()
+    if failed and policy != EXEC_POLICY_CONTINUE:
+        raise CommandFailed(
+            f"Command failed on {len(failed)} pod(s): "
+            f"{', '.join(result.pod.name for result in failed)}. "
+            f"First error: {failed[0].error}"
+        )
+
+
+def exec_on_pods(
+    pod_objs, command, max_parallel=None, policy=EXEC_POLICY_RAISE,
+    out_yaml_format=False, **kwargs
+):
+    """
+    Run the command on the pods in parallel, see iter_exec_on_pods()
+
+    Args:
+        pod_objs (list): List of the Pod objects
+        command (str or callable): The command to execute on each pod, or
+            a function returning the command for the given Pod object
+        max_parallel (int): Max number of the commands running at once
+            (default: config.RUN['exec_max_parallel'])
+        policy (str): What to do with the failed commands, one of
+            EXEC_POLICY_CONTINUE, EXEC_POLICY_RAISE or EXEC_POLICY_FAIL_FAST
+        out_yaml_format (bool): whether to return yaml loaded python
+            object OR to return raw output
+        kwargs (dict): Passed to Pod.exec_cmd_on_pod(), e.g. timeout
+
+    Returns:
+        list: PodExecResult of every pod, in the order of pod_objs
+
+    Raises:
+        CommandFailed: In case any command failed and the policy is
+            EXEC_POLICY_RAISE or EXEC_POLICY_FAIL_FAST
+    """
+    pod_objs = list(pod_objs)
+    order = {id(pod_obj): index for index, pod_obj in enumerate(pod_objs)}
+    results = iter_exec_on_pods(
+        pod_objs, command, max_parallel, policy, out_yaml_format, **kwargs
+    )
+    return sorted(results, key=lambda result: order[id(result.pod)])
+
+
+def cal_md5sum_on_pods(pod_objs, file_name, max_parallel=None):
+    """
+    Calculates the md5sum of the file on the pods in parallel
+
+    Args:
+        pod_objs (list): List of the Pod objects
+        file_name (str or callable): The name of the file for which md5sum
+            to be calculated, or a function returning the name for the given
+            Pod object
+        max_parallel (int): Max number of the commands running at once
+
+    Returns:
+        list: The md5sums of the file, in the order of pod_objs
+    """
+    def md5sum_cmd(pod_obj):
+        name = file_name(pod_obj) if callable(file_name) else file_name
+        return f"bash -c \"md5sum {get_file_path(pod_obj, name)}\""
+
+    results = exec_on_pods(pod_objs, md5sum_cmd, max_parallel)
+    for result in results:
+        logger.info(
+            f"md5sum of file on pod {result.pod.name}: "
+            f"{result.stdout.split()[0]}"
+        )
+    return [result.stdout.split()[0] for result in results]
+
+
 def get_admin_key_from_ceph_tools():
     """
     Fetches admin key secret from ceph
@@ -589,20 +1060,26 @@ def run_io_and_verify_mount_point(pod_obj, bs='10M', count='950'):
     return used_percentage
 
 
-def get_pods_having_label(label, namespace):
+def get_pods_having_label(
+    label, namespace, max_staleness=None, force_refresh=False
+):
     """
     Fetches pod resources with given label in given namespace
 
     Args:
         label (str): label which pods might have
         namespace (str): Namespace in which to be looked up
+        max_staleness (float): Max age in seconds of the pods data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached pods
 
     Return:
         dict: of pod info
     """
-    ocp_pod = OCP(kind=constants.POD, namespace=namespace)
-    pods = ocp_pod.get(selector=label).get('items')
-    return pods
+    return resource_cache.get_items(
+        constants.POD, namespace=namespace, selector=label,
+        max_staleness=max_staleness, force_refresh=force_refresh,
+    )
 
 
 def get_mds_pods(mds_label=constants.MDS_APP_LABEL, namespace=None):
@@ -762,6 +1239,27 @@ def get_pod_logs(pod_name, container=None):
     return pod.exec_oc_cmd(cmd, out_yaml_format=False)
 
 
+def iter_pod_logs(pod_name, container=None):
+    """
+    Iterate over the logs of a given pod line by line without holding the
+    whole logs in memory
+
+    Args:
+        pod_name (str): Name of the pod
+        container (str): Name of the container
+
+    Returns:
+        generator: Lines of the 'oc logs <pod_name>' output
+    """
+    pod = OCP(
+        kind=constants.POD, namespace=defaults.ROOK_CLUSTER_NAMESPACE
+    )
+    cmd = f"logs {pod_name}"
+    if container:
+        cmd += f" -c {container}"
+    return run_cmd_stream(pod.get_oc_cmd(cmd))
+
+
 def get_pod_node(pod_obj):
     """
     Get the node that the pod is running on
@@ -929,32 +1427,23 @@ def plugin_provisioner_leader(interface, namespace=None):
     if interface == constants.CEPHFILESYSTEM:
         pods = get_cephfsplugin_provisioner_pods(namespace=namespace)
 
-    pods_log = {}
     for pod in pods:
-        pods_log[pod] = get_pod_logs(
+        # The pod is the leader if there is no non leader message logged
+        # after the last occurrence of leader message
+        is_leader = False
+        for log_msg in iter_pod_logs(
             pod_name=pod.name, container='csi-provisioner'
-        ).split('\n')
-
-    for pod, log_list in pods_log.items():
-        # Reverse the list to find last occurrence of message without
-        # iterating over all elements
-        log_list.reverse()
-        for log_msg in log_list:
-            # Check for last occurrence of leader messages.
-            # This will be the first occurrence in reversed list.
+        ):
             if (lease_renew_msg in log_msg) or (lease_acq_msg in log_msg):
-                curr_index = log_list.index(log_msg)
-                # Ensure that there is no non leader message logged after
-                # the last occurrence of leader message
-                if not any(
-                    non_leader_msg in msg for msg in log_list[:curr_index]
-                ):
-                    assert not leader_pod, (
-                        "Couldn't identify plugin provisioner leader pod by "
-                        "analysing the logs. Found more than one match."
-                    )
-                    leader_pod = pod
-                break
+                is_leader = True
+            elif non_leader_msg in log_msg:
+                is_leader = False
+        if is_leader:
+            assert not leader_pod, (
+                "Couldn't identify plugin provisioner leader pod by "
+                "analysing the logs. Found more than one match."
+            )
+            leader_pod = pod
 
     assert leader_pod, "Couldn't identify plugin provisioner leader pod."
     logger.info(f"Plugin provisioner leader pod is {leader_pod.name}")
@@ -2,11 +2,10 @@
 General PVC object
 """
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
-from ocs_ci.ocs import constants
+from ocs_ci.ocs import constants, resource_cache
 from ocs_ci.ocs.ocp import OCP
-from ocs_ci.ocs.resources.ocs import OCS
+from ocs_ci.ocs.resources.ocs import OCS, delete_many
 from ocs_ci.framework import config
 from ocs_ci.utility.utils import run_cmd
 
@@ -149,55 +148,154 @@ def delete_pvcs(pvc_objs, concurrent=False):
 
     Args:
         pvc_objs (list): List of the pvc objects to be deleted
-        concurrent (bool): Determines if the delete operation should be
-            executed with multiple thread in parallel
+        concurrent (bool): Determines if the PVCs should be deleted at once
+            and waited for together, see ocs.delete_many()
 
     Returns:
         bool: True if deletion is successful
     """
     if concurrent:
-        with ThreadPoolExecutor() as executor:
-            for pvc in pvc_objs:
-                executor.submit(pvc.delete)
+        delete_many(pvc_objs)
     else:
         for pvc in pvc_objs:
             pvc.delete()
     return True
 
 
-def get_all_pvcs(namespace=None, selector=None):
+def get_all_pvcs(
+    namespace=None, selector=None, max_staleness=None, force_refresh=False
+):
     """
     Gets all pvc in given namespace
 
     Args:
         namespace (str): Name of namespace
         selector (str): The label selector to look for
+        max_staleness (float): Max age in seconds of the PVCs data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached PVCs
 
     Returns:
          dict: Dict of all pvc in namespaces
     """
     if not namespace:
         namespace = config.ENV_DATA['cluster_namespace']
-    ocp_pvc_obj = OCP(
-        kind=constants.PVC, namespace=namespace
+    if not config.RUN.get('resource_cache'):
+        ocp_pvc_obj = OCP(
+            kind=constants.PVC, namespace=namespace
+        )
+        return ocp_pvc_obj.get(selector=selector)
+    return {
+        'apiVersion': 'v1',
+        'kind': 'List',
+        'items': resource_cache.get_items(
+            constants.PVC, namespace=namespace, selector=selector,
+            max_staleness=max_staleness, force_refresh=force_refresh,
+        ),
+        'metadata': {'resourceVersion': '', 'selfLink': ''},
+    }
+
+
+class PVCRecord(object):
+    """
+    Lightweight read-only view of the PVC for bulk listings, see
+    list_pvc_records()
+
+    Other attributes and methods than the listed fields are looked up on the
+    full PVC object, which is created on their first access only.
+    """
+
+    __slots__ = (
+        'name', 'namespace', 'labels', 'status', 'backed_pv', 'storage_class',
+        'capacity', 'data', '_pvc',
     )
-    out = ocp_pvc_obj.get(selector=selector)
-    return out
+
+    def __init__(self, data):
+        """
+        Initializer function
+
+        Args:
+            data (dict): The PVC data as returned by 'oc get pvc -o json'
+        """
+        metadata = data['metadata']
+        spec = data.get('spec', {})
+        status = data.get('status', {})
+        self.name = metadata['name']
+        self.namespace = metadata.get('namespace')
+        self.labels = metadata.get('labels') or {}
+        self.status = status.get('phase')
+        self.backed_pv = spec.get('volumeName')
+        self.storage_class = spec.get('storageClassName')
+        self.capacity = status.get('capacity', {}).get('storage')
+        self.data = data
+        self._pvc = None
+
+    def __repr__(self):
+        return f"PVCRecord({self.namespace}/{self.name}, {self.status})"
+
+    def __getattr__(self, name):
+        # called only for the attributes which are not in the record
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.to_pvc(), name)
+
+    def to_pvc(self):
+        """
+        Promote the record to the full PVC object, created once per record
+
+        Returns:
+            PVC: The PVC object
+        """
+        if self._pvc is None:
+            self._pvc = PVC(**self.data)
+        return self._pvc
 
 
-def get_all_pvc_objs(namespace=None, selector=None):
+def list_pvc_records(
+    namespace=None, selector=None, max_staleness=None, force_refresh=False
+):
+    """
+    Get the lightweight records of the PVCs, much cheaper than the PVC
+    objects of get_all_pvc_objs() for big listings
+
+    Args:
+        namespace (str): Name of namespace
+        selector (str): The label selector to look for
+        max_staleness (float): Max age in seconds of the PVCs data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached PVCs
+
+    Returns:
+        list: List of PVCRecord objects
+    """
+    all_pvcs = get_all_pvcs(
+        namespace=namespace, selector=selector, max_staleness=max_staleness,
+        force_refresh=force_refresh,
+    )
+    return [PVCRecord(pvc) for pvc in all_pvcs['items']]
+
+
+def get_all_pvc_objs(
+    namespace=None, selector=None, max_staleness=None, force_refresh=False
+):
     """
     Gets all PVCs objects in given namespace
 
     Args:
         namespace (str): Name of namespace
         selector (str): The label selector to look for
+        max_staleness (float): Max age in seconds of the PVCs data when
+            read from the resource cache
+        force_refresh (bool): True for re-listing the cached PVCs
 
     Returns:
          list: Instances of PVC
 
     """
-    all_pvcs = get_all_pvcs(namespace=namespace, selector=selector)
+    all_pvcs = get_all_pvcs(
+        namespace=namespace, selector=selector, max_staleness=max_staleness,
+        force_refresh=force_refresh,
+    )
     err_msg = f"Failed to get the PVCs for namespace {namespace}"
     if selector:
         err_msg = err_msg + f" and selector {selector}"
@@ -0,0 +1,87 @@
+"""
+Generators of fake resource data, shaped as returned by 'oc get -o json',
+for the unit tests and benchmarks
+"""
+
+
+def fake_pod(index, namespace='openshift-storage', phase='Running'):
+    """
+    Generate data of a fake pod
+
+    Args:
+        index (int): The index used in the name of the pod
+        namespace (str): The namespace of the pod
+        phase (str): The phase of the pod
+
+    Returns:
+        dict: The pod data
+
+    """
+    name = f"pod-test-{index:05d}"
+    return {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {
+            'name': name,
+            'namespace': namespace,
+            'uid': f"6c4d2d4e-0000-4000-8000-{index:012d}",
+            'resourceVersion': str(100000 + index),
+            'creationTimestamp': '2019-11-11T11:11:11Z',
+            'labels': {'app': 'test', 'pod-template-hash': f"{index:08x}"},
+            'selfLink': f"/api/v1/namespaces/{namespace}/pods/{name}",
+        },
+        'spec': {
+            'containers': [{
+                'name': 'web-server',
+                'image': 'nginx',
+                'imagePullPolicy': 'IfNotPresent',
+                'resources': {},
+                'volumeMounts': [
+                    {'mountPath': '/var/lib/www/html', 'name': 'data'},
+                ],
+            }],
+            'nodeName': f"ip-10-0-{index % 3}-1.ec2.internal",
+            'restartPolicy': 'Always',
+            'volumes': [{
+                'name': 'data',
+                'persistentVolumeClaim': {'claimName': f"pvc-test-{index:05d}"},
+            }],
+        },
+        'status': {
+            'phase': phase,
+            'hostIP': f"10.0.{index % 3}.1",
+            'podIP': f"10.128.{index // 250}.{index % 250}",
+            'startTime': '2019-11-11T11:11:12Z',
+            'conditions': [
+                {'type': 'Ready', 'status': 'True'},
+                {'type': 'PodScheduled', 'status': 'True'},
+            ],
+            'containerStatuses': [{
+                'name': 'web-server',
+                'image': 'nginx:latest',
+                'ready': phase == 'Running',
+                'restartCount': 0,
+                'state': {'running': {'startedAt': '2019-11-11T11:11:20Z'}},
+            }],
+        },
+    }
+
+
+def fake_pod_list(count, namespace='openshift-storage'):
+    """
+    Generate data of a list of fake pods
+
+    Args:
+        count (int): The number of pods in the list
+        namespace (str): The namespace of the pods
+
+    Returns:
+        dict: The 'List' data with the pods as items
+
+    """
+    return {
+        'apiVersion': 'v1',
+        'kind': 'List',
+        'items': [fake_pod(index, namespace) for index in range(count)],
+        'metadata': {'resourceVersion': '', 'selfLink': ''},
+    }
@@ -0,0 +1,40 @@
+import pytest
+
+from ocs_ci.ocs.ceph_tools import CephToolsClient, parse_output
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.utils import run_cmd
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = CephToolsClient()
+    # running the commands locally instead of the toolbox pod
+    monkeypatch.setattr(
+        client, 'exec_cmd', lambda command, timeout=None: run_cmd(command)
+    )
+    return client
+
+
+def test_parse_output():
+    assert parse_output('{"key": "value"}\n') == {'key': 'value'}
+    assert parse_output('rook: v1.1.0\n') == {'rook': 'v1.1.0'}
+    assert parse_output('\n') is None
+
+
+def test_format_cmd():
+    assert CephToolsClient.format_cmd("ceph auth add client.a mon 'allow r'") \
+        == "ceph auth add client.a mon 'allow r' --format json"
+
+
+def test_run_batch(client):
+    outputs = client.run_batch(
+        ["echo '{\"pools\": []}'", "printf '[1, 2]'", 'true'], format=None
+    )
+    assert outputs == [{'pools': []}, [1, 2], None]
+
+
+def test_run_batch_failure(client):
+    with pytest.raises(CommandFailed) as ex:
+        client.run_batch(['ls /nonexistent', "echo '{}'"], format=None)
+    assert 'ls /nonexistent' in str(ex.value)
+    assert 'No such file' in str(ex.value)
@@ -0,0 +1,56 @@
+import json
+import logging
+import time
+
+import pytest
+import yaml
+
+from ocs_ci.ocs.tests.fake_data import fake_pod, fake_pod_list
+from ocs_ci.utility import serialization
+
+log = logging.getLogger(__name__)
+
+
+def test_load_json_output():
+    pod = fake_pod(1)
+    assert serialization.load_oc_output(json.dumps(pod, indent=4)) == pod
+
+
+def test_load_concatenated_json_output():
+    pods = [fake_pod(1), fake_pod(2)]
+    out = '\n'.join(json.dumps(pod, indent=4) for pod in pods)
+    data = serialization.load_oc_output(out)
+    assert data['kind'] == 'List'
+    assert data['items'] == pods
+
+
+def test_load_yaml_output():
+    pod = fake_pod(1)
+    assert serialization.load_oc_output(yaml.safe_dump(pod)) == pod
+    assert serialization.load_oc_output('pod/pod-1 created') == (
+        'pod/pod-1 created'
+    )
+
+
+@pytest.mark.benchmark
+def test_benchmark_parse_5k_pods():
+    pods = fake_pod_list(5000)
+    json_out = json.dumps(pods, indent=4)
+    yaml_out = yaml.dump(pods, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
+    parsers = {
+        'yaml.safe_load': lambda: yaml.safe_load(yaml_out),
+        f'yaml {serialization.SafeLoader.__name__}': (
+            lambda: serialization.yaml_load(yaml_out)
+        ),
+        'json.loads': lambda: json.loads(json_out),
+        'load_oc_output (-o json)': (
+            lambda: serialization.load_oc_output(json_out)
+        ),
+    }
+    timings = dict()
+    for name, parser in parsers.items():
+        start = time.perf_counter()
+        assert parser() == pods
+        timings[name] = time.perf_counter() - start
+        log.info(f"{name}: {timings[name]:.3f}s")
+    assert timings['load_oc_output (-o json)'] < timings['yaml.safe_load']
@@ -0,0 +1,246 @@
+import json
+import os
+import subprocess
+import tempfile
+
+import pytest
+
+from ocs_ci.ocs import constants, ocp
+from ocs_ci.ocs.exceptions import (
+    CommandFailed, ResourcesWrongStatusException,
+)
+from ocs_ci.ocs.ocp import (
+    OCP, STATUS_EXTRACTORS, get_manifest_input, get_status_from_data,
+    register_status_extractor,
+)
+from ocs_ci.ocs.resources.pod import Pod
+from ocs_ci.ocs.tests.fake_data import fake_pod
+
+
+def test_pod_status_from_data():
+    pod = {
+        'kind': constants.POD,
+        'metadata': {'name': 'pod-1'},
+        'status': {
+            'phase': 'Pending',
+            'containerStatuses': [
+                {'state': {'waiting': {'reason': 'ContainerCreating'}}},
+            ],
+        },
+    }
+    assert get_status_from_data(pod) == constants.STATUS_CONTAINER_CREATING
+    pod['status'] = {
+        'phase': 'Running',
+        'containerStatuses': [{'state': {'running': {}}}],
+    }
+    assert get_status_from_data(pod) == constants.STATUS_RUNNING
+    pod['metadata']['deletionTimestamp'] = '2019-10-10T10:10:10Z'
+    assert get_status_from_data(pod) == constants.STATUS_TERMINATING
+
+
+def test_node_status_from_data():
+    node = {
+        'kind': constants.NODE,
+        'spec': {'unschedulable': True},
+        'status': {'conditions': [{'type': 'Ready', 'status': 'True'}]},
+    }
+    assert get_status_from_data(
+        node
+    ) == constants.NODE_READY_SCHEDULING_DISABLED
+
+
+def test_pvc_status_from_data():
+    pvc = {'kind': constants.PVC, 'status': {'phase': 'Bound'}}
+    assert get_status_from_data(pvc) == constants.STATUS_BOUND
+
+
+def test_pod_init_status_from_data():
+    pod = {
+        'kind': constants.POD,
+        'metadata': {'name': 'pod-1'},
+        'spec': {'initContainers': [{'name': 'init-1'}, {'name': 'init-2'}]},
+        'status': {
+            'phase': 'Pending',
+            'initContainerStatuses': [
+                {'state': {'terminated': {'exitCode': 0}}},
+                {'state': {'running': {}}},
+            ],
+        },
+    }
+    assert get_status_from_data(pod) == 'Init:1/2'
+
+
+def test_registered_status_extractor():
+    @register_status_extractor('CephCluster')
+    def _get_ceph_cluster_status(data):
+        return data['status']['ceph']['health']
+
+    try:
+        cluster = {
+            'kind': 'CephCluster',
+            'status': {'phase': 'Ready', 'ceph': {'health': 'HEALTH_OK'}},
+        }
+        assert get_status_from_data(cluster) == 'HEALTH_OK'
+    finally:
+        STATUS_EXTRACTORS.pop('cephcluster')
+
+
+def test_manifest_input():
+    pod = fake_pod(1)
+    assert json.loads(get_manifest_input(pod)) == pod
+    manifest = json.loads(get_manifest_input([pod, fake_pod(2)]))
+    assert manifest['kind'] == 'List'
+    assert [item['metadata']['name'] for item in manifest['items']] == [
+        'pod-test-00001', 'pod-test-00002',
+    ]
+
+
+def test_no_temp_files_for_objects():
+    before = set(os.listdir(tempfile.gettempdir()))
+    pod_obj = Pod(**fake_pod(1))
+    pod_obj.__init__(**pod_obj.data)
+    assert set(os.listdir(tempfile.gettempdir())) == before
+    # created on explicit request only
+    assert os.path.exists(pod_obj.temp_yaml.name)
+    pod_obj.delete_temp_yaml_file()
+
+
+def test_bulk_create(monkeypatch):
+    manifests = []
+
+    def fake_oc_create(cmd, input, **kwargs):
+        # 'oc create' of the List creates all the items but the existing one
+        items = json.loads(input)['items']
+        manifests.append(items)
+        created = []
+        for index, item in enumerate(items):
+            item = json.loads(json.dumps(item))
+            metadata = item['metadata']
+            if metadata.get('name') == 'pod-test-00002':
+                continue
+            if 'generateName' in metadata:
+                # the second generated resource fails
+                if index == 1:
+                    continue
+                metadata['name'] = f"{metadata['generateName']}{index}"
+            created.append(item)
+        return subprocess.CompletedProcess(
+            cmd, 1, json.dumps({'kind': 'List', 'items': created}),
+            'Error from server (AlreadyExists): error when creating "STDIN": '
+            'pods "pod-test-00002" already exists\n'
+        )
+
+    monkeypatch.setattr(ocp, 'exec_cmd', fake_oc_create)
+    pods = [fake_pod(index) for index in range(1, 6)]
+    results = OCP(kind=constants.POD).bulk_create(pods, chunk_size=2)
+    assert [len(items) for items in manifests] == [2, 2, 1]
+    assert [result.item for result in results] == pods
+    assert [result.data is None for result in results] == [
+        False, True, False, False, False,
+    ]
+    assert 'already exists' in results[1].error
+
+    manifests.clear()
+    results = OCP(kind=constants.POD).bulk_create(
+        pods[:3], generate_name='pod-gen-'
+    )
+    assert 'name' not in manifests[0][0]['metadata']
+    # the failed resource doesn't shift the others
+    assert results[0].data['metadata']['name'] == 'pod-gen-0'
+    assert results[1].data is None and results[1].error
+    assert results[2].data['metadata']['name'] == 'pod-gen-2'
+    assert 'name' in pods[0]['metadata']
+    assert 'annotations' not in results[0].item['metadata']
+
+
+def test_delete_many(monkeypatch):
+    commands = []
+    existing = {f"pod-{index}" for index in range(5)}
+    listed = []
+
+    def fake_exec_oc_cmd(self, command, out_yaml_format=True, **kwargs):
+        commands.append(command)
+        existing.difference_update(command.split())
+        return ''
+
+    def fake_get(self, selector=None, **kwargs):
+        # the last pod is deleted after the first list
+        items = [{'metadata': {'name': name}} for name in sorted(existing)]
+        listed.append(selector)
+        existing.discard('pod-4')
+        return {'kind': 'List', 'items': items}
+
+    monkeypatch.setattr(ocp, 'DELETE_NAMES_PER_COMMAND', 3)
+    monkeypatch.setattr(OCP, 'exec_oc_cmd', fake_exec_oc_cmd)
+    monkeypatch.setattr(OCP, 'get', fake_get)
+    existing.add('other')
+    names = [f"pod-{index}" for index in range(4)]
+    pod_ocp = OCP(kind=constants.POD, namespace='ns')
+    assert pod_ocp.delete_many(names)
+    assert commands == [
+        'delete Pod pod-0 pod-1 pod-2 --wait=false --ignore-not-found',
+        'delete Pod pod-3 --wait=false --ignore-not-found',
+    ]
+    assert len(listed) == 1
+
+    existing.add('pod-4')
+    assert pod_ocp.wait_for_delete_many(['pod-4'], sleep=0)
+    assert len(listed) == 3
+    with pytest.raises(TimeoutError):
+        pod_ocp.wait_for_delete_many(['other'], timeout=0, sleep=0)
+    with pytest.raises(CommandFailed):
+        pod_ocp.delete_by_selector('')
+
+
+def fake_pvc_lists(phases):
+    """
+    Fake 'oc get pvc' outputs, phases is a list of samples, every sample a
+    dict of PVC name -> phase
+    """
+    samples = iter(phases)
+
+    def fake_get(self, *args, **kwargs):
+        return {'kind': 'List', 'items': [
+            {'kind': constants.PVC, 'metadata': {'name': name},
+             'status': {'phase': phase}}
+            for name, phase in next(samples).items()
+        ]}
+
+    return fake_get
+
+
+def test_wait_for_many(monkeypatch):
+    monkeypatch.setattr(OCP, 'get', fake_pvc_lists([
+        {'pvc-1': 'Pending'},
+        {'pvc-1': 'Bound', 'pvc-2': 'Pending', 'other': 'Pending'},
+        {'pvc-1': 'Bound', 'pvc-2': 'Bound', 'other': 'Pending'},
+    ]))
+    reached = OCP(kind=constants.PVC, namespace='ns').wait_for_many(
+        ['pvc-1', 'pvc-2'], constants.STATUS_BOUND, timeout=5, sleep=0
+    )
+    assert sorted(reached) == ['pvc-1', 'pvc-2']
+    assert reached['pvc-1'][0] <= reached['pvc-2'][0]
+    assert reached['pvc-2'][1]['status']['phase'] == 'Bound'
+
+
+def test_wait_for_many_laggards(monkeypatch):
+    monkeypatch.setattr(OCP, 'get', fake_pvc_lists(
+        [{'pvc-1': 'Bound', 'pvc-2': 'Pending'}] * 100
+    ))
+    with pytest.raises(ResourcesWrongStatusException) as error:
+        OCP(kind=constants.PVC).wait_for_many(
+            ['pvc-1', 'pvc-2', 'pvc-3'], constants.STATUS_BOUND, timeout=0.2,
+            sleep=0.05
+        )
+    assert error.value.laggards == {'pvc-2': 'Pending', 'pvc-3': 'NotFound'}
+    assert str(error.value).startswith('1/3 PersistentVolumeClaim reached')
+
+    # failed and deleted resources fail the wait right away
+    monkeypatch.setattr(OCP, 'get', fake_pvc_lists([
+        {'pvc-1': 'Pending', 'pvc-2': 'Pending'}, {'pvc-1': 'Lost'},
+    ]))
+    with pytest.raises(ResourcesWrongStatusException) as error:
+        OCP(kind=constants.PVC).wait_for_many(
+            ['pvc-1', 'pvc-2'], constants.STATUS_BOUND, timeout=60, sleep=0
+        )
+    assert error.value.laggards == {'pvc-1': 'Lost', 'pvc-2': 'Deleted'}
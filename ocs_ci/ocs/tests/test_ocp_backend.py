@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs import ocp_backend
+from ocs_ci.ocs.exceptions import UnsupportedBackendOperation
+
+
+class FakeInstance(object):
+    def __init__(self, data):
+        self.data = data
+
+    def to_dict(self):
+        return self.data
+
+
+def test_cli_backend_is_none():
+    assert ocp_backend.get_backend(ocp_backend.CLI_BACKEND) is None
+
+
+def test_unknown_backend():
+    with pytest.raises(UnsupportedBackendOperation):
+        ocp_backend.get_backend('unknown')
+
+
+def test_failed_backend_falls_back_to_cli(monkeypatch):
+    def broken_backend(kubeconfig=None):
+        raise KeyError('current-context')
+
+    monkeypatch.setitem(ocp_backend._backend_classes, 'broken', broken_backend)
+    try:
+        assert ocp_backend.get_backend('broken') is None
+    finally:
+        ocp_backend.reset_backends()
+
+
+def test_rest_list_has_oc_shape():
+    resource = SimpleNamespace(group_version='v1', kind='Pod')
+    instance = FakeInstance({
+        'apiVersion': 'v1',
+        'kind': 'PodList',
+        'metadata': {'resourceVersion': '42'},
+        'items': [{'metadata': {'name': 'pod-1'}}],
+    })
+    data = ocp_backend.RESTBackend._to_dict(resource, instance)
+    assert data['kind'] == 'List'
+    assert data['metadata']['resourceVersion'] == '42'
+    assert data['items'][0]['kind'] == 'Pod'
+    assert data['items'][0]['apiVersion'] == 'v1'
+
+
+def test_rest_single_object_untouched():
+    resource = SimpleNamespace(group_version='v1', kind='Pod')
+    pod = {'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'pod-1'}}
+    assert ocp_backend.RESTBackend._to_dict(
+        resource, FakeInstance(pod)
+    ) == pod
@@ -0,0 +1,69 @@
+from ocs_ci.ocs import resource_cache
+from ocs_ci.ocs.resources.pod import Pod
+from ocs_ci.ocs.tests.fake_data import fake_pod
+
+
+def with_version(data, version, **labels):
+    data = dict(data, metadata=dict(data['metadata'], resourceVersion=version))
+    data['metadata']['labels'] = dict(data['metadata']['labels'], **labels)
+    return data
+
+
+def make_pod(monkeypatch, server_data, cached_data=None):
+    pod_obj = Pod(**with_version(fake_pod(1), '10'))
+    calls = []
+
+    def get(out_yaml_format=True):
+        calls.append(pod_obj.name)
+        return server_data
+
+    monkeypatch.setattr(pod_obj, 'get', get)
+    monkeypatch.setattr(
+        resource_cache, 'get_watched_item', lambda *args: cached_data
+    )
+    return pod_obj, calls
+
+
+def test_reload_in_place(monkeypatch):
+    server_data = with_version(fake_pod(1), '11', tier='gold')
+    pod_obj, calls = make_pod(monkeypatch, server_data)
+    ocp = pod_obj.ocp
+    pod_obj.reload()
+    assert calls == [pod_obj.name]
+    assert pod_obj.labels['tier'] == 'gold'
+    assert pod_obj.pod_data is server_data
+    assert pod_obj.ocp is ocp
+
+
+def test_reload_unchanged_version(monkeypatch):
+    pod_obj, calls = make_pod(monkeypatch, with_version(fake_pod(1), '10'))
+    data = pod_obj.data
+    pod_obj.reload()
+    assert calls and pod_obj.data is data
+
+
+def test_reload_from_watched_cache(monkeypatch):
+    cached = with_version(fake_pod(1), '12', tier='silver')
+    pod_obj, calls = make_pod(monkeypatch, None, cached)
+    pod_obj.reload()
+    assert not calls
+    assert pod_obj.labels['tier'] == 'silver'
+
+
+def test_reload_after_change_skips_stale_cache(monkeypatch):
+    cached = with_version(fake_pod(1), '10')
+    server_data = with_version(fake_pod(1), '11', tier='gold')
+    pod_obj, calls = make_pod(monkeypatch, server_data, cached)
+    pod_obj.reload(changed=True)
+    assert calls
+    assert pod_obj.labels['tier'] == 'gold'
+
+
+def test_set_data_updates_namespace():
+    data = fake_pod(1)
+    del data['metadata']['namespace']
+    pod_obj = Pod(**data)
+    assert pod_obj.ocp.namespace is None
+    pod_obj.set_data(fake_pod(1))
+    assert pod_obj.namespace == fake_pod(1)['metadata']['namespace']
+    assert pod_obj.ocp.namespace == pod_obj.namespace
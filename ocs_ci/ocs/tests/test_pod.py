@@ -0,0 +1,99 @@
+import tarfile
+import time
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources.pod import (
+    EXEC_POLICY_CONTINUE, EXEC_POLICY_FAIL_FAST, exec_on_pods,
+    get_ceph_tools_pod, is_safe_tar_member, iter_exec_on_pods,
+)
+from ocs_ci.ocs.tests.fake_data import fake_pod
+from ocs_ci.utility import memoization
+
+
+class FakePod(object):
+    def __init__(self, name, delay=0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.commands = []
+
+    def exec_cmd_on_pod(self, command, out_yaml_format=True, **kwargs):
+        self.commands.append(command)
+        time.sleep(self.delay)
+        if self.fail:
+            raise CommandFailed(f"{command} failed on {self.name}")
+        return f"{command} on {self.name}"
+
+
+def test_exec_on_pods_order_and_parallelism():
+    pods = [FakePod(f"pod-{i}", delay=0.2) for i in range(10)]
+    start = time.time()
+    results = exec_on_pods(
+        pods, lambda pod: f"md5sum {pod.name}", max_parallel=5
+    )
+    assert 0.4 <= time.time() - start < 1
+    assert [result.pod for result in results] == pods
+    assert results[3].stdout == 'md5sum pod-3 on pod-3'
+    assert all(result.rc == 0 for result in results)
+
+
+def test_exec_on_pods_streams_results():
+    pods = [FakePod('slow', delay=0.3), FakePod('fast')]
+    results = iter_exec_on_pods(pods, 'ls', max_parallel=2)
+    assert [result.pod.name for result in results] == ['fast', 'slow']
+
+
+def test_exec_on_pods_policies():
+    pods = [FakePod('ok'), FakePod('bad', fail=True)]
+    results = exec_on_pods(pods, 'ls', policy=EXEC_POLICY_CONTINUE)
+    assert [result.rc for result in results] == [0, 1]
+    assert isinstance(results[1].error, CommandFailed)
+    with pytest.raises(CommandFailed, match='bad'):
+        exec_on_pods(pods, 'ls')
+
+    pods = [FakePod('bad', fail=True)] + [FakePod(f"pod-{i}") for i in range(5)]
+    with pytest.raises(CommandFailed):
+        exec_on_pods(pods, 'ls', max_parallel=1, policy=EXEC_POLICY_FAIL_FAST)
+    assert not pods[-1].commands
+
+
+def test_ceph_tools_pod_respin(monkeypatch):
+    tools_pods = {'pod-test-00001': fake_pod(1)}
+    lists = []
+
+    def fake_get(self, resource_name='', selector=None, **kwargs):
+        if selector:
+            lists.append(selector)
+            return {'kind': 'List', 'items': list(tools_pods.values())}
+        if resource_name not in tools_pods:
+            raise CommandFailed(f'pods "{resource_name}" not found')
+        return tools_pods[resource_name]
+
+    monkeypatch.setattr(OCP, 'get', fake_get)
+    memoization.invalidate(memoization.TOOLBOX)
+    assert get_ceph_tools_pod().name == 'pod-test-00001'
+    assert get_ceph_tools_pod().name == 'pod-test-00001'
+    assert len(lists) == 1
+    # the toolbox is respun, the memoized pod is replaced by the new one
+    tools_pods = {'pod-test-00002': fake_pod(2)}
+    assert get_ceph_tools_pod().name == 'pod-test-00002'
+    assert len(lists) == 2
+    memoization.invalidate(memoization.TOOLBOX)
+
+
+def test_is_safe_tar_member(tmpdir):
+    def member(name, type=tarfile.REGTYPE):
+        info = tarfile.TarInfo(name)
+        info.type = type
+        return info
+
+    local_dir = str(tmpdir)
+    assert is_safe_tar_member(member('logs/ceph.log'), local_dir)
+    assert is_safe_tar_member(member('logs', tarfile.DIRTYPE), local_dir)
+    assert not is_safe_tar_member(member('logs/link', tarfile.SYMTYPE), local_dir)
+    for name in ('../escape', '/etc/passwd', 'logs/../../escape'):
+        with pytest.raises(CommandFailed):
+            is_safe_tar_member(member(name), local_dir)
@@ -0,0 +1,87 @@
+import subprocess
+import threading
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.pod_exec import SESSION_SHELL, ExecSession
+
+
+class LocalShell(object):
+    """
+    Local shell with the interface of the websocket exec client
+    """
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            [SESSION_SHELL], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, universal_newlines=True, bufsize=0,
+        )
+        self.channels = {1: '', 2: ''}
+        self.cond = threading.Condition()
+        for channel, pipe in ((1, self.proc.stdout), (2, self.proc.stderr)):
+            threading.Thread(
+                target=self._read, args=(channel, pipe), daemon=True
+            ).start()
+
+    def _read(self, channel, pipe):
+        for data in iter(lambda: pipe.read(1), ''):
+            with self.cond:
+                self.channels[channel] += data
+                self.cond.notify_all()
+
+    def is_open(self):
+        return self.proc.poll() is None
+
+    def update(self, timeout=0):
+        with self.cond:
+            self.cond.wait(timeout)
+
+    def _read_channel(self, channel):
+        with self.cond:
+            data, self.channels[channel] = self.channels[channel], ''
+        return data
+
+    def read_stdout(self, timeout=0):
+        return self._read_channel(1)
+
+    def read_stderr(self, timeout=0):
+        return self._read_channel(2)
+
+    def write_stdin(self, data):
+        self.proc.stdin.write(data)
+
+    def close(self):
+        self.proc.kill()
+        self.proc.wait()
+
+
+@pytest.fixture
+def session():
+    session = ExecSession.__new__(ExecSession)
+    session.podname, session.namespace, session.container = 'pod', 'ns', None
+    session._resp = LocalShell()
+    yield session
+    session.close()
+
+
+def test_exec_session_framing(session):
+    assert session.run('echo hello') == ('hello\n', '', 0)
+    assert session.run('printf no-newline') == ('no-newline', '', 0)
+    assert session.run('echo oops >&2; exit_code() { return 3; }; exit_code') \
+        == ('', 'oops\n', 3)
+    # the command can't consume the next commands from stdin
+    assert session.run('cat') == ('', '', 0)
+    assert session.run('seq 1 3') == ('1\n2\n3\n', '', 0)
+
+
+def test_exec_session_timeout(session):
+    with pytest.raises(subprocess.TimeoutExpired):
+        session.run('sleep 10', timeout=0.5)
+    assert not session.is_open()
+
+
+def test_exec_session_closed(session):
+    with pytest.raises(CommandFailed):
+        session.run('exit 1')
+    assert not session.is_open()
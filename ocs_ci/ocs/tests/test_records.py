@@ -0,0 +1,67 @@
+import gc
+import logging
+import time
+import tracemalloc
+
+import pytest
+
+from ocs_ci.ocs.resources.pod import Pod, PodRecord
+from ocs_ci.ocs.resources.pvc import PVCRecord
+from ocs_ci.ocs.tests.fake_data import fake_pod, fake_pod_list
+
+log = logging.getLogger(__name__)
+
+
+def test_pod_record():
+    record = PodRecord(fake_pod(1, phase='Pending'))
+    assert record.name == 'pod-test-00001'
+    assert record.phase == 'Pending'
+    assert record._pod is None
+    # promoted to the full Pod on access of its attributes only
+    assert record.pod_data == record.data
+    assert isinstance(record._pod, Pod)
+    assert record.to_pod() is record._pod
+    with pytest.raises(AttributeError):
+        record.__dict__
+
+
+def test_pvc_record():
+    record = PVCRecord({
+        'kind': 'PersistentVolumeClaim',
+        'metadata': {'name': 'pvc-1', 'namespace': 'ns'},
+        'spec': {'volumeName': 'pv-1', 'storageClassName': 'sc'},
+        'status': {'phase': 'Bound', 'capacity': {'storage': '5Gi'}},
+    })
+    assert (record.status, record.backed_pv, record.capacity) == (
+        'Bound', 'pv-1', '5Gi',
+    )
+    assert record.size == 5
+
+
+def measure(factory, items):
+    """
+    Returns:
+        tuple: Time in seconds and memory in bytes taken by the objects
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [factory(item) for item in items]
+    duration = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return duration, memory
+
+
+@pytest.mark.benchmark
+def test_benchmark_10k_pod_records():
+    pods = fake_pod_list(10000)['items']
+    results = {
+        'Pod': measure(lambda pod: Pod(**pod), pods),
+        'PodRecord': measure(PodRecord, pods),
+    }
+    for name, (duration, memory) in results.items():
+        log.info(f"{name}: {duration:.3f}s, {memory / 2 ** 20:.1f} MiB")
+    assert results['PodRecord'][0] < results['Pod'][0]
+    assert results['PodRecord'][1] < results['Pod'][1]
@@ -0,0 +1,88 @@
+import queue
+import time
+
+import pytest
+
+from ocs_ci.ocs.resource_cache import ResourceCache, labels_match
+
+
+LABELS = {'app': 'rook-ceph-osd', 'ceph-osd-id': '0', 'tier': 'storage'}
+
+
+@pytest.mark.parametrize('selector, expected', [
+    (None, True),
+    ('app=rook-ceph-osd', True),
+    ('app==rook-ceph-osd', True),
+    ('app=rook-ceph-mon', False),
+    ('app!=rook-ceph-mon', True),
+    ('app=rook-ceph-osd,ceph-osd-id=1', False),
+    ('app in (rook-ceph-mon,rook-ceph-osd),tier', True),
+    ('app notin (rook-ceph-mon, rook-ceph-osd)', False),
+    ('!tier', False),
+    ('!missing,tier', True),
+])
+def test_labels_match(selector, expected):
+    assert labels_match(LABELS, selector) is expected
+
+
+class FakeWatchBackend(object):
+    """
+    Streams the snapshots put to the queue of every watch, a watch is blocked
+    until its next snapshot
+    """
+
+    def __init__(self):
+        self.streams = []
+
+    def iter_snapshots(self, kind, namespace=None, timeout=None):
+        stream = queue.Queue()
+        self.streams.append(stream)
+        while True:
+            yield stream.get()
+
+
+class FakeOCP(object):
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def get(self):
+        return {'items': []}
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_cache_watch_restarts_after_stop():
+    backend = FakeWatchBackend()
+    cache = ResourceCache('Pod', namespace='test')
+    cache.ocp = FakeOCP(backend)
+    cache.refresh()
+    wait_for(lambda: len(backend.streams) == 1)
+    backend.streams[0].put({'pod-1': {}})
+    wait_for(lambda: cache.staleness == 0)
+    old_thread = cache._watch_thread
+
+    # the stopped watch is still blocked in its stream when refreshed
+    cache.stop()
+    assert cache.staleness == float('inf')
+    cache.refresh()
+    assert old_thread.is_alive()
+    wait_for(lambda: len(backend.streams) == 2)
+    backend.streams[1].put({'pod-2': {}})
+    wait_for(lambda: cache.staleness == 0)
+
+    # the stopped watch ends without touching the data of the new one
+    backend.streams[0].put({'pod-3': {}})
+    old_thread.join(2)
+    assert not old_thread.is_alive()
+    assert set(cache._items) == {'pod-2'}
+    assert cache.staleness == 0
+    cache.stop()
+    backend.streams[1].put({})
+    cache._watch_thread.join(2)
+    assert not cache._watch_thread.is_alive()
@@ -8,7 +8,6 @@ import traceback
 from subprocess import TimeoutExpired
 
 import yaml
-from gevent import sleep
 from libcloud.common.exceptions import BaseHTTPError
 from libcloud.common.types import LibcloudError
 from libcloud.compute.providers import get_driver
@@ -22,10 +21,13 @@ from ocs_ci.ocs.clients import WinNode
 from ocs_ci.ocs.exceptions import CommandFailed
 from ocs_ci.ocs.openstack import CephVMNode
 from ocs_ci.ocs.parallel import parallel
-from ocs_ci.utility.utils import create_directory_path, run_cmd
+from ocs_ci.utility.utils import (
+    create_directory_path, run_cmd, run_cmd_stream,
+)
 from ocs_ci.ocs import constants
 from ocs_ci.framework import config as ocsci_config
-from ocs_ci.utility import templating
+from ocs_ci.utility import memoization, templating
+from ocs_ci.utility.serialization import json_loads
 
 log = logging.getLogger(__name__)
 
@@ -138,8 +140,8 @@ def cleanup_ceph_nodes(osp_cred, pattern=None, timeout=300):
                                     node_name=node.name,
                                     timeout=timeout, stack_trace=traceback.format_exc()))
                         else:
-                            sleep(1)
-                sleep(5)
+                            time.sleep(1)
+                time.sleep(5)
     with parallel() as p:
         for fips in driver.ex_list_floating_ips():
             if fips.node_id is None:
@@ -152,7 +154,7 @@ def cleanup_ceph_nodes(osp_cred, pattern=None, timeout=300):
                 log.info("Volume has no name, skipping")
             elif name in volume.name:
                 log.info("Removing volume %s", volume.name)
-                sleep(10)
+                time.sleep(10)
                 try:
                     volume.destroy()
                 except BaseHTTPError as e:
@@ -223,7 +225,7 @@ def check_ceph_healthly(ceph_mon, num_osds, num_mons, mon_container=None, timeou
         if not any(state in lines for state in pending_states):
             if all(state in lines for state in valid_states):
                 break
-        sleep(5)
+        time.sleep(5)
     log.info(lines)
     if not all(state in lines for state in valid_states):
         log.error("Valid States are not found in the health check")
@@ -632,14 +634,15 @@ def setup_ceph_toolbox():
     namespace = ocsci_config.ENV_DATA['cluster_namespace']
     rook_operator = get_pod_name_by_pattern('rook-ceph-operator', namespace)
     out = run_cmd(
-        f'oc -n {namespace} get pods {rook_operator[0]} -o yaml',
+        f'oc -n {namespace} get pods {rook_operator[0]} -o json',
     )
-    version = yaml.safe_load(out)
+    version = json_loads(out)
     rook_version = version['spec']['containers'][0]['image']
     tool_box_data = templating.load_yaml(constants.TOOL_POD_YAML)
     tool_box_data['spec']['template']['spec']['containers'][0]['image'] = rook_version
     rook_toolbox = OCS(**tool_box_data)
     rook_toolbox.create()
+    memoization.invalidate(memoization.TOOLBOX)
 
 
 def apply_oc_resource(
@@ -697,9 +700,11 @@ def run_must_gather(log_dir_path, image, command=None):
     log.info(f"OCS logs will be placed in location {log_dir_path}")
     occli = OCP()
     try:
-        occli.exec_oc_cmd(
-            cmd, out_yaml_format=False, timeout=must_gather_timeout
-        )
+        # the output is streamed and dropped, it can be huge
+        for _ in run_cmd_stream(
+            occli.get_oc_cmd(cmd), timeout=must_gather_timeout
+        ):
+            pass
     except CommandFailed as ex:
         log.error(f"Failed during must gather logs! Error: {ex}")
     except TimeoutExpired as ex:
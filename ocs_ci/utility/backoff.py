@@ -0,0 +1,153 @@
+"""
+Backoff policy shared by TimeoutSampler and retry()
+
+The delay between the attempts grows exponentially by the backoff factor
+(1 for the fixed interval), can grow further with every consecutive error so
+the waiters back off while the API server is unavailable (opt-in by
+error_backoff, many sampled functions raise until the resource exists and
+must keep the fixed interval), is capped by max_delay and randomized by
+jitter so concurrent waiters don't hit the API server in lockstep. The sleep
+is always clamped to the time left until the deadline.
+
+Defaults configured in config.RUN:
+    sampler_jitter - relative jitter of the delay (0.1 = +-10%)
+    sampler_error_backoff - multiplier of the delay per consecutive error,
+        1 (no error backoff) by default
+    sampler_max_delay - max delay in seconds between the attempts
+"""
+import random
+import threading
+import time
+
+from ocs_ci.framework import config
+
+
+class BackoffPolicy(object):
+    """
+    Computes the delays between the attempts
+    """
+
+    def __init__(
+        self, delay, backoff=1, max_delay=None, jitter=None,
+        error_backoff=None
+    ):
+        """
+        Initializer function
+
+        Args:
+            delay (float): The delay in seconds after the first attempt
+            backoff (float): Multiplier of the delay after every attempt,
+                1 for the fixed interval
+            max_delay (float): Max delay in seconds, not lower than delay
+                (default: config.RUN['sampler_max_delay'])
+            jitter (float): Relative random deviation of the delay, e.g. 0.1
+                for +-10% (default: config.RUN['sampler_jitter'])
+            error_backoff (float): Multiplier of the delay for every
+                consecutive failed attempt
+                (default: config.RUN['sampler_error_backoff'])
+        """
+        self.delay = delay
+        self.backoff = backoff
+        if max_delay is None:
+            max_delay = max(delay, config.RUN.get('sampler_max_delay', 30))
+        self.max_delay = max_delay
+        self.jitter = (
+            config.RUN.get('sampler_jitter', 0.1) if jitter is None else jitter
+        )
+        self.error_backoff = (
+            config.RUN.get('sampler_error_backoff', 1)
+            if error_backoff is None else error_backoff
+        )
+
+    def get_delay(self, attempt, consecutive_errors=0):
+        """
+        Get the delay after the attempt
+
+        Args:
+            attempt (int): The number of the finished attempt, 0 for the first
+            consecutive_errors (int): The number of the consecutive failed
+                attempts, including the finished one
+
+        Returns:
+            float: The delay in seconds
+        """
+        delay = self.delay * self.backoff ** attempt
+        delay *= self.error_backoff ** consecutive_errors
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(delay, 0)
+
+    @staticmethod
+    def clamp(delay, deadline):
+        """
+        Clamp the delay to the time left until the deadline
+
+        Args:
+            delay (float): The delay in seconds
+            deadline (float): The deadline (time.time() based), None for
+                no deadline
+
+        Returns:
+            float: The clamped delay in seconds
+        """
+        if deadline is None:
+            return delay
+        return max(0, min(delay, deadline - time.time()))
+
+
+class AttemptStats(object):
+    """
+    Timing and error statistics of the attempts (samples)
+    """
+
+    def __init__(self):
+        self.attempts = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.last_error = None
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.total_sleep = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, duration, error=None):
+        """
+        Record the finished attempt
+
+        Args:
+            duration (float): Duration of the attempt in seconds
+            error (Exception): The error of the failed attempt
+        """
+        with self._lock:
+            self.attempts += 1
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+            if error is None:
+                self.consecutive_errors = 0
+            else:
+                self.errors += 1
+                self.consecutive_errors += 1
+                self.last_error = error
+
+    def record_sleep(self, duration):
+        """
+        Record the sleep between the attempts
+
+        Args:
+            duration (float): Duration of the sleep in seconds
+        """
+        with self._lock:
+            self.total_sleep += duration
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.attempts if self.attempts else 0.0
+
+    def __repr__(self):
+        return (
+            f"{self.attempts} attempts ({self.errors} failed), "
+            f"mean {self.mean_time:.3f}s, max {self.max_time:.3f}s, "
+            f"slept {self.total_sleep:.3f}s"
+        )
@@ -0,0 +1,217 @@
+"""
+Latency statistics of the commands and API requests
+
+run_cmd(), run_cmd_async() and the REST backend record wall time, exit code
+and output sizes of every command. The commands are grouped by a normalized
+key, e.g. 'oc get pod' or 'rest delete PersistentVolumeClaim', into histograms
+collected for the whole session and for the currently running test. The
+reports are dumped as JSON by the ocscilib pytest hooks when enabled by
+config.RUN['command_stats'].
+"""
+import heapq
+import json
+import logging
+import os
+import threading
+
+from ocs_ci.framework import config
+from ocs_ci.utility.rate_limiter import API_COMMANDS, get_oc_verb
+
+log = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float('inf'))
+# oc verbs followed by the kind of the resource
+VERBS_WITH_KIND = (
+    'get', 'create', 'delete', 'describe', 'patch', 'label', 'annotate',
+    'edit', 'scale', 'expose', 'set', 'replace', 'apply',
+)
+
+
+def get_command_key(cmd):
+    """
+    Normalize the command to the key the statistics are grouped by, e.g.
+    'oc -n ns get pod pod-1 -o json' to 'oc get pod'
+
+    Args:
+        cmd (list): The command split to arguments
+
+    Returns:
+        str: The normalized command
+    """
+    if not cmd:
+        return ''
+    binary = os.path.basename(cmd[0])
+    if binary not in API_COMMANDS:
+        return binary
+    verb = get_oc_verb(cmd)
+    if not verb:
+        return binary
+    key = f"{binary} {verb}"
+    if verb in VERBS_WITH_KIND:
+        rest = cmd[cmd.index(verb) + 1:]
+        if '-f' in rest or any(arg.startswith('--filename') for arg in rest):
+            return f"{key} -f"
+        kinds = [arg for arg in rest if not arg.startswith('-')]
+        if kinds:
+            key += f" {kinds[0].split('/')[0].lower()}"
+    return key
+
+
+class CommandStats(object):
+    """
+    Latency statistics of the commands run in one scope (session or test)
+    """
+
+    def __init__(self, name, top=None):
+        """
+        Initializer function
+
+        Args:
+            name (str): Name of the scope, e.g. the test node id
+            top (int): The number of the slowest and most frequent commands
+                in the report (default: config.RUN['command_stats_top'])
+        """
+        self.name = name
+        self._top = top
+        self.commands = dict()
+        self._slowest = []
+        self._lock = threading.Lock()
+
+    @property
+    def top(self):
+        return self._top or config.RUN.get('command_stats_top', 10)
+
+    def record(
+        self, key, command, duration, returncode=0, stdout_bytes=0,
+        stderr_bytes=0
+    ):
+        """
+        Record the finished command
+
+        Args:
+            key (str): The normalized command, see get_command_key()
+            command (str): The (masked) command
+            duration (float): Wall time of the command in seconds
+            returncode (int): Exit code of the command
+            stdout_bytes (int): Size of the standard output
+            stderr_bytes (int): Size of the error output
+        """
+        with self._lock:
+            stats = self.commands.get(key)
+            if stats is None:
+                stats = self.commands[key] = {
+                    'count': 0, 'errors': 0, 'total': 0.0,
+                    'min': duration, 'max': duration,
+                    'stdout_bytes': 0, 'stderr_bytes': 0,
+                    'histogram': [0] * len(BUCKETS),
+                }
+            stats['count'] += 1
+            stats['errors'] += 1 if returncode else 0
+            stats['total'] += duration
+            stats['min'] = min(stats['min'], duration)
+            stats['max'] = max(stats['max'], duration)
+            stats['stdout_bytes'] += stdout_bytes
+            stats['stderr_bytes'] += stderr_bytes
+            for index, bound in enumerate(BUCKETS):
+                if duration <= bound:
+                    stats['histogram'][index] += 1
+                    break
+            entry = (duration, command, returncode)
+            if len(self._slowest) < self.top:
+                heapq.heappush(self._slowest, entry)
+            elif duration > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def report(self):
+        """
+        Build the report of the collected statistics
+
+        Returns:
+            dict: The report with per-command statistics and top N slowest
+                and most frequent commands
+        """
+        with self._lock:
+            commands = {
+                key: dict(stats, mean=stats['total'] / stats['count'])
+                for key, stats in self.commands.items()
+            }
+            slowest = sorted(self._slowest, reverse=True)
+        most_frequent = sorted(
+            commands.items(), key=lambda item: item[1]['count'], reverse=True
+        )[:self.top]
+        return {
+            'name': self.name,
+            'total_commands': sum(s['count'] for s in commands.values()),
+            'total_time': sum(s['total'] for s in commands.values()),
+            'buckets': [str(bound) for bound in BUCKETS],
+            'commands': commands,
+            'top_slowest': [
+                {'command': command, 'duration': duration, 'returncode': rc}
+                for duration, command, rc in slowest
+            ],
+            'most_frequent': [
+                {'command': key, 'count': stats['count'],
+                 'total': stats['total']}
+                for key, stats in most_frequent
+            ],
+        }
+
+    def dump(self, path):
+        """
+        Dump the report to the JSON file
+
+        Args:
+            path (str): Path of the file
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as fd:
+            json.dump(self.report(), fd, indent=2)
+        log.info(f"Command statistics of {self.name} dumped to {path}")
+
+
+session_stats = CommandStats('session')
+test_stats = None
+
+
+def record(cmd, command, duration, returncode=0, stdout_bytes=0, stderr_bytes=0):
+    """
+    Record the finished command to the session and current test statistics
+
+    Args:
+        cmd (list or str): The command split to arguments or the key
+        command (str): The (masked) command
+        duration (float): Wall time of the command in seconds
+        returncode (int): Exit code of the command
+        stdout_bytes (int): Size of the standard output
+        stderr_bytes (int): Size of the error output
+    """
+    key = cmd if isinstance(cmd, str) else get_command_key(cmd)
+    for stats in (session_stats, test_stats):
+        if stats is not None:
+            stats.record(
+                key, command, duration, returncode, stdout_bytes, stderr_bytes
+            )
+
+
+def start_test(name):
+    """
+    Start collecting the statistics of the test
+
+    Args:
+        name (str): The test node id
+    """
+    global test_stats
+    test_stats = CommandStats(name)
+
+
+def finish_test():
+    """
+    Stop collecting the statistics of the current test
+
+    Returns:
+        CommandStats: The statistics of the finished test
+    """
+    global test_stats
+    stats, test_stats = test_stats, None
+    return stats
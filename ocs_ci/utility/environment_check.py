@@ -5,8 +5,8 @@ leftovers
 import copy
 import logging
 import yaml
-from gevent.threadpool import ThreadPoolExecutor
 from ocs_ci.ocs import ocp, constants, exceptions
+from ocs_ci.utility.executor import Executor
 
 log = logging.getLogger(__name__)
 
@@ -93,7 +93,9 @@ def get_environment_status(env_dict):
     Args:
         env_dict (dict): Dictionary that is a copy.deepcopy(ENV_STATUS_DICT)
     """
-    with ThreadPoolExecutor(max_workers=len(KINDS)) as executor:
+    with Executor(
+        max_workers=len(KINDS), name='environment status'
+    ) as executor:
         for key, kind in zip(env_dict.keys(), KINDS):
             executor.submit(assign_get_values, env_dict, key, kind)
 
@@ -0,0 +1,460 @@
+"""
+Executor running the tasks of the framework concurrently
+
+Executor runs blocking functions (e.g. run_cmd() based helpers) in a bounded
+pool of threads, AsyncExecutor runs coroutines on an event loop with the same
+semantics:
+    - at most max_workers tasks run at once
+    - every task can be limited by a timeout
+    - the first failure cancels the sibling tasks which haven't started yet
+      (fail_fast), the running coroutines of AsyncExecutor are cancelled too
+    - the results are returned in the order the tasks were submitted
+      (results()) or as the tasks finish (as_completed())
+    - the progress callback is called for every finished task and a timing
+      summary of all the tasks is available by summary()
+
+Example:
+    with Executor(max_workers=8, timeout=300) as executor:
+        for pvc_obj in pvc_objs:
+            executor.submit(pvc_obj.delete)
+    log.info(executor.summary())
+
+A thread can't be interrupted, so the thread of a timed out task of Executor
+keeps running in the background, only the result of the task is not waited
+for.
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import TaskTimeoutError
+
+log = logging.getLogger(__name__)
+
+# Outcome of one task, the value returned by the task or the error it raised
+TaskResult = namedtuple(
+    'TaskResult', ['index', 'name', 'value', 'error', 'duration']
+)
+
+
+def get_task_name(func):
+    """
+    Get the name of the task function for logging
+
+    Args:
+        func (callable): The task function
+
+    Returns:
+        str: The name of the function
+    """
+    func = getattr(func, 'func', func)
+    return getattr(func, '__qualname__', None) or repr(func)
+
+
+class _Task(object):
+    """
+    The submitted task, see Executor.submit()
+    """
+
+    def __init__(self, index, func, args, kwargs):
+        self.index = index
+        self.name = get_task_name(func)
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.start_time = None
+        self.end_time = None
+        self.future = None
+
+    @property
+    def duration(self):
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.time()) - self.start_time
+
+
+class BaseExecutor(object):
+    """
+    Bookkeeping shared by Executor and AsyncExecutor
+    """
+
+    def __init__(
+        self, max_workers=None, timeout=None, fail_fast=True, progress=None,
+        name='tasks'
+    ):
+        """
+        Initializer function
+
+        Args:
+            max_workers (int): Max number of the tasks running at once
+                (default: config.RUN['executor_max_workers'])
+            timeout (float): Max time in seconds of one task, None for no
+                limit
+            fail_fast (bool): True for cancelling the sibling tasks and
+                raising the error right after the first task failed,
+                otherwise the error is raised after all the tasks finished
+            progress (callable): Called with (finished count, total count,
+                TaskResult) after every finished task
+            name (str): Name of the tasks for logging
+        """
+        self.max_workers = max_workers or config.RUN.get(
+            'executor_max_workers', 16
+        )
+        self.timeout = timeout
+        self.fail_fast = fail_fast
+        self.progress = progress
+        self.name = name
+        self._tasks = []
+        self._results = dict()
+        self._cancelled = 0
+        self._start_time = None
+        self._end_time = None
+        self._lock = threading.Lock()
+
+    def _add_task(self, func, args, kwargs):
+        with self._lock:
+            task = _Task(len(self._tasks), func, args, kwargs)
+            self._tasks.append(task)
+        if self._start_time is None:
+            self._start_time = time.time()
+        return task
+
+    def _finish(self, task, value=None, error=None):
+        """
+        Record the finished task and report the progress
+
+        Returns:
+            TaskResult: The result of the task
+        """
+        if task.end_time is None:
+            task.end_time = time.time()
+        result = TaskResult(task.index, task.name, value, error, task.duration)
+        self._results[task.index] = result
+        self._end_time = time.time()
+        if error is not None:
+            log.error(f"Task {task.name} of {self.name} failed: {error}")
+        if self.progress:
+            self.progress(len(self._results), len(self._tasks), result)
+        return result
+
+    def _get_values(self, results):
+        """
+        Get the values of the results in the order of the tasks
+
+        Raises:
+            Exception: The error of the first failed task
+        """
+        results = sorted(results, key=lambda result: result.index)
+        for result in results:
+            if result.error is not None:
+                raise result.error
+        return [result.value for result in results]
+
+    def summary(self):
+        """
+        Timing summary of the finished tasks
+
+        Returns:
+            dict: The numbers of the tasks, wall time of all of them and
+                total, mean and max duration of one task in seconds
+        """
+        durations = [result.duration for result in self._results.values()]
+        wall_time = 0.0
+        if self._start_time is not None:
+            wall_time = (self._end_time or time.time()) - self._start_time
+        return {
+            'name': self.name,
+            'tasks': len(self._tasks),
+            'finished': len(self._results),
+            'failed': sum(
+                1 for result in self._results.values()
+                if result.error is not None
+            ),
+            'cancelled': self._cancelled,
+            'wall_time': wall_time,
+            'total_time': sum(durations),
+            'mean_time': sum(durations) / len(durations) if durations else 0,
+            'max_time': max(durations, default=0.0),
+        }
+
+
+class Executor(BaseExecutor):
+    """
+    Runs blocking functions in a bounded pool of threads
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializer function, see BaseExecutor for the arguments
+        """
+        super(Executor, self).__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        # future -> task of the unfinished tasks, in the order of submission
+        self._pending = dict()
+        # futures of the tasks in the order they finished
+        self._done = queue.Queue()
+
+    def _run(self, task):
+        task.start_time = time.time()
+        try:
+            return task.func(*task.args, **task.kwargs)
+        finally:
+            task.end_time = time.time()
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Submit the function to run
+
+        Args:
+            func (callable): The function
+            args: Positional arguments of the function
+            kwargs: Keyword arguments of the function
+
+        Returns:
+            concurrent.futures.Future: The future of the task
+        """
+        task = self._add_task(func, args, kwargs)
+        task.future = self._pool.submit(self._run, task)
+        self._pending[task.future] = task
+        task.future.add_done_callback(self._done.put)
+        return task.future
+
+    def submit_raw(self, func, *args, **kwargs):
+        """
+        Submit the function to run in the pool without any bookkeeping, for
+        the callers waiting for the returned future themselves. The task
+        isn't part of results(), as_completed(), summary() or the timeout.
+
+        Args:
+            func (callable): The function
+            args: Positional arguments of the function
+            kwargs: Keyword arguments of the function
+
+        Returns:
+            concurrent.futures.Future: The future of the task
+        """
+        return self._pool.submit(func, *args, **kwargs)
+
+    def map(self, func, *iterables):
+        """
+        Run the function for every item of the iterables
+
+        Returns:
+            list: Values returned by the function, in the order of the items
+        """
+        start = len(self._tasks)
+        for args in zip(*iterables):
+            self.submit(func, *args)
+        return self.results()[start:]
+
+    def _timed_out(self, task, now):
+        return (
+            self.timeout is not None and task.start_time is not None
+            and now - task.start_time >= self.timeout
+        )
+
+    def _get_wait_timeout(self):
+        """
+        Time in seconds until the oldest running task times out, the pool
+        starts the tasks in the order of submission, so the first pending
+        task is the oldest one
+        """
+        if self.timeout is None:
+            return None
+        oldest = next(iter(self._pending.values()))
+        if oldest.start_time is None:
+            return self.timeout
+        return max(oldest.start_time + self.timeout - time.time(), 0)
+
+    def as_completed(self):
+        """
+        Wait for the submitted tasks and yield the results as the tasks
+        finish
+
+        Yields:
+            TaskResult: The results in the order the tasks finished, the
+                failed tasks are yielded only without fail_fast
+
+        Raises:
+            Exception: The error of the first failed task in case of
+                fail_fast, the sibling tasks which haven't started yet are
+                cancelled
+        """
+        try:
+            while self._pending:
+                try:
+                    future = self._done.get(timeout=self._get_wait_timeout())
+                    finished = [future] if future in self._pending else []
+                except queue.Empty:
+                    now = time.time()
+                    finished = [
+                        future for future, task in self._pending.items()
+                        if self._timed_out(task, now)
+                    ]
+                for future in finished:
+                    task = self._pending.pop(future)
+                    if future.done() and not future.cancelled():
+                        error = future.exception()
+                        value = None if error else future.result()
+                    else:
+                        error = TaskTimeoutError(task.name, self.timeout)
+                        value = None
+                    result = self._finish(task, value, error)
+                    if error is not None and self.fail_fast:
+                        raise error
+                    yield result
+        finally:
+            self.cancel()
+
+    def results(self):
+        """
+        Wait for all the submitted tasks
+
+        Returns:
+            list: Values returned by the tasks, in the order the tasks were
+                submitted
+
+        Raises:
+            Exception: The error of the first failed task
+        """
+        for _ in self.as_completed():
+            pass
+        return self._get_values(self._results.values())
+
+    def cancel(self):
+        """
+        Cancel the tasks which haven't started yet
+        """
+        for future in list(self._pending):
+            if future.cancel():
+                del self._pending[future]
+                self._cancelled += 1
+        if self._cancelled:
+            log.info(f"{self._cancelled} {self.name} cancelled")
+
+    def shutdown(self, wait=True):
+        """
+        Cancel the tasks which haven't started yet and release the threads
+
+        Args:
+            wait (bool): Wait for the running tasks to finish
+        """
+        self.cancel()
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_value is not None:
+            self.shutdown(wait=False)
+            return False
+        try:
+            self.results()
+        finally:
+            self.shutdown(wait=False)
+            log.debug(f"Executor summary: {self.summary()}")
+        return False
+
+
+class AsyncExecutor(BaseExecutor):
+    """
+    Runs coroutines concurrently on an event loop
+    """
+
+    def submit(self, coroutine_func, *args, **kwargs):
+        """
+        Submit the coroutine function to run, it's called when the task
+        starts
+
+        Args:
+            coroutine_func (callable): The coroutine function
+            args: Positional arguments of the function
+            kwargs: Keyword arguments of the function
+        """
+        self._add_task(coroutine_func, args, kwargs)
+
+    async def _run(self, task, semaphore):
+        async with semaphore:
+            task.start_time = time.time()
+            try:
+                return await asyncio.wait_for(
+                    task.func(*task.args, **task.kwargs), self.timeout
+                )
+            except asyncio.TimeoutError:
+                raise TaskTimeoutError(task.name, self.timeout)
+            finally:
+                task.end_time = time.time()
+
+    async def as_completed(self):
+        """
+        Run the submitted coroutines and yield the results as they finish
+
+        Yields:
+            TaskResult: The results in the order the tasks finished, the
+                failed tasks are yielded only without fail_fast
+
+        Raises:
+            Exception: The error of the first failed task in case of
+                fail_fast, the sibling tasks are cancelled
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        pending = {
+            asyncio.ensure_future(self._run(task, semaphore)): task
+            for task in self._tasks if task.index not in self._results
+        }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    task = pending.pop(future)
+                    error = future.exception()
+                    value = None if error else future.result()
+                    result = self._finish(task, value, error)
+                    if error is not None and self.fail_fast:
+                        raise error
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            self._cancelled += len(pending)
+            if pending:
+                await asyncio.wait(pending)
+                log.info(f"{len(pending)} {self.name} cancelled")
+
+    async def results(self):
+        """
+        Run all the submitted coroutines
+
+        Returns:
+            list: Values returned by the coroutines, in the order the tasks
+                were submitted
+
+        Raises:
+            Exception: The error of the first failed task
+        """
+        async for _ in self.as_completed():
+            pass
+        return self._get_values(self._results.values())
+
+    def run(self):
+        """
+        Run all the submitted coroutines on a new event loop, meant to be
+        used from the synchronous test code, see results()
+
+        Returns:
+            list: Values returned by the coroutines, in the order the tasks
+                were submitted
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.results())
+        finally:
+            loop.close()
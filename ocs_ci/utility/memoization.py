@@ -0,0 +1,225 @@
+"""
+Memoization of the cluster metadata queries
+
+The results of the decorated functions (cluster/ceph/rook/CSI versions, Ceph
+tools pod, ...) are cached in memory per cluster (KUBECONFIG) until they are
+invalidated by invalidate() of their group, e.g. after an upgrade or a respin
+of the toolbox pod.
+
+Functions decorated with persist=True are also cached on disk in the cluster
+directory when enabled by config.RUN['metadata_disk_cache'], so repeated
+runs against the same cluster don't have to query them again. The disk cache
+is bound to the UID of the cluster (the UID of the kube-system namespace) and
+its entries expire after config.RUN['metadata_cache_ttl'] seconds.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from copy import deepcopy
+
+from ocs_ci.framework import config
+
+log = logging.getLogger(__name__)
+
+DISK_CACHE_FILE = 'ocs_ci_metadata_cache.json'
+
+# Invalidation groups
+VERSIONS = 'versions'
+TOOLBOX = 'toolbox'
+
+# (group, memoized function) of all the decorated functions
+_memoized = list()
+_disk_lock = threading.Lock()
+_cluster_uids = dict()
+
+
+def _get_cluster_key():
+    """
+    Key of the cluster the cached values belong to
+    """
+    return os.getenv('KUBECONFIG'), config.ENV_DATA.get('cluster_path')
+
+
+def _copy(value):
+    """
+    Copy of the cached data structures, so the callers can't modify them
+    """
+    if isinstance(value, (dict, list)):
+        return deepcopy(value)
+    return value
+
+
+def _get_disk_cache_path():
+    """
+    Returns:
+        str: Path of the disk cache file or None if the disk cache is
+            disabled
+    """
+    cluster_path = config.ENV_DATA.get('cluster_path')
+    if not (config.RUN.get('metadata_disk_cache') and cluster_path):
+        return None
+    return os.path.join(os.path.expanduser(cluster_path), DISK_CACHE_FILE)
+
+
+def _get_cluster_uid():
+    """
+    Returns:
+        str: UID of the cluster (UID of the kube-system namespace)
+    """
+    cluster_key = _get_cluster_key()
+    if cluster_key not in _cluster_uids:
+        # importing here to avoid circular imports
+        from ocs_ci.ocs.ocp import OCP
+        _cluster_uids[cluster_key] = OCP(kind='namespace').get(
+            'kube-system'
+        )['metadata']['uid']
+    return _cluster_uids[cluster_key]
+
+
+def _load_disk_cache(path):
+    """
+    Load the disk cache, the cache of other cluster (different UID) is
+    dropped
+
+    Args:
+        path (str): Path of the disk cache file
+
+    Returns:
+        dict: The disk cache data
+    """
+    uid = _get_cluster_uid()
+    try:
+        with open(path) as fd:
+            data = json.load(fd)
+    except (OSError, ValueError):
+        data = dict()
+    if data.get('cluster_uid') != uid:
+        data = {'cluster_uid': uid, 'entries': dict()}
+    return data
+
+
+def _write_disk_cache(path, data):
+    """
+    Atomically write the disk cache
+
+    Args:
+        path (str): Path of the disk cache file
+        data (dict): The disk cache data
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as fd:
+        json.dump(data, fd, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _disk_get(key):
+    """
+    Get the value from the disk cache
+
+    Returns:
+        tuple: (bool, value) the bool is True if the valid value was found
+    """
+    path = _get_disk_cache_path()
+    if not path:
+        return False, None
+    with _disk_lock:
+        entry = _load_disk_cache(path)['entries'].get(key)
+    if not entry:
+        return False, None
+    if time.time() - entry['time'] > config.RUN.get('metadata_cache_ttl', 3600):
+        return False, None
+    log.debug(f"Using {key} from the disk cache {path}")
+    return True, entry['value']
+
+
+def _disk_set(key, value):
+    """
+    Store the value to the disk cache
+    """
+    path = _get_disk_cache_path()
+    if not path:
+        return
+    with _disk_lock:
+        data = _load_disk_cache(path)
+        data['entries'][key] = {'time': time.time(), 'value': value}
+        _write_disk_cache(path, data)
+
+
+def _disk_delete(prefix):
+    """
+    Delete the entries starting with the prefix from the disk cache
+    """
+    path = _get_disk_cache_path()
+    if not (path and os.path.exists(path)):
+        return
+    with _disk_lock:
+        data = _load_disk_cache(path)
+        data['entries'] = {
+            key: entry for key, entry in data['entries'].items()
+            if not key.startswith(prefix)
+        }
+        _write_disk_cache(path, data)
+
+
+def memoize(group=None, persist=False):
+    """
+    Decorator caching the results of the function per cluster and arguments
+
+    Args:
+        group (str): Invalidation group of the function, see invalidate()
+        persist (bool): True for caching JSON serializable results on disk as
+            well (if enabled by config.RUN['metadata_disk_cache'])
+
+    Returns:
+        function: The decorator
+
+    """
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        cache = dict()
+        # held during the call, so the concurrent callers wait for the result
+        # instead of running the same query
+        lock = threading.RLock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (_get_cluster_key(), args, tuple(sorted(kwargs.items())))
+            disk_key = f"{name}:{json.dumps([args, kwargs], default=str)}"
+            with lock:
+                if key in cache:
+                    return _copy(cache[key])
+                found, value = _disk_get(disk_key) if persist else (False, None)
+                if not found:
+                    value = func(*args, **kwargs)
+                    if persist:
+                        _disk_set(disk_key, value)
+                cache[key] = value
+                return _copy(value)
+
+        def invalidate_func():
+            with lock:
+                cache.clear()
+            if persist:
+                _disk_delete(f"{name}:")
+
+        wrapper.invalidate = invalidate_func
+        _memoized.append((group, wrapper))
+        return wrapper
+    return decorator
+
+
+def invalidate(group=None):
+    """
+    Invalidate the cached results of the functions in the group
+
+    Args:
+        group (str): The group to invalidate, all the groups if None
+
+    """
+    log.info(f"Invalidating memoized cluster metadata (group: {group})")
+    for func_group, func in _memoized:
+        if group is None or func_group == group:
+            func.invalidate()
@@ -0,0 +1,260 @@
+"""
+Streaming pipeline of stages processing many objects
+
+Scale tests used to run in barriers (create all PVCs, wait for all of them,
+create all pods, wait for all of them), so the slowest object of a stage held
+back all the others. Pipeline moves every object to the next stage as soon
+as the previous stage is done with it. Every stage runs in its own bounded
+pool of threads (see ocs_ci.utility.executor.Executor) and the latency of
+every stage is recorded for every object.
+
+Example:
+    pipeline = Pipeline([
+        Stage('create PVC', create_pvc, concurrency=10),
+        Stage('PVC Bound', wait_for_bound, concurrency=50),
+        Stage('create pod', create_pod, concurrency=10),
+        Stage('pod Running', wait_for_running, concurrency=50),
+    ])
+    results = pipeline.run(range(1000))
+    log.info(pipeline.report())
+"""
+import logging
+import math
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from ocs_ci.utility.executor import Executor
+
+log = logging.getLogger(__name__)
+
+# One stage of the pipeline, func is called with the output of the previous
+# stage (the input object for the first stage) and returns the input of the
+# next stage, concurrency is the max number of objects processed at once
+Stage = namedtuple('Stage', ['name', 'func', 'concurrency'])
+Stage.__new__.__defaults__ = (None,)
+
+
+def percentile(values, percent):
+    """
+    Get the percentile of the values (nearest rank)
+
+    Args:
+        values (list): Sorted values
+        percent (float): The percentile, e.g. 90
+
+    Returns:
+        float: The percentile, None for no values
+    """
+    if not values:
+        return None
+    rank = math.ceil(percent / 100 * len(values))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+class PipelineResult(object):
+    """
+    Outcome of one object processed by the pipeline
+    """
+
+    def __init__(self, index, item):
+        self.index = index
+        self.item = item
+        self.value = item
+        self.outputs = dict()
+        ''' stage name -> output of the stage '''
+        self.latencies = dict()
+        ''' stage name -> time in seconds the stage took '''
+        self.queued = dict()
+        ''' stage name -> time in seconds waiting for a free worker '''
+        self.error = None
+        self.failed_stage = None
+        self.start_time = time.time()
+        self.end_time = None
+
+    @property
+    def total_time(self):
+        """
+        Time in seconds the object spent in the pipeline
+        """
+        return (self.end_time or time.time()) - self.start_time
+
+    def __repr__(self):
+        status = f"failed in {self.failed_stage}" if self.error else 'done'
+        return f"<PipelineResult {self.index} {status}>"
+
+
+class Pipeline(object):
+    """
+    Streams the objects through the stages
+    """
+
+    def __init__(self, stages, fail_fast=False, progress=None, name='pipeline'):
+        """
+        Initializer function
+
+        Args:
+            stages (list): The Stages the objects go through, in order
+            fail_fast (bool): True for stopping the whole pipeline and
+                raising the error when any object fails, otherwise the
+                failed object leaves the pipeline and the others continue
+            progress (callable): Called with (stage name, processed count by
+                the stage, total count) after every processed object
+            name (str): Name of the pipeline for logging
+        """
+        self.stages = list(stages)
+        self.fail_fast = fail_fast
+        self.progress = progress
+        self.name = name
+        self.results = []
+        self.start_time = None
+        self.end_time = None
+
+    def _run_stage(self, stage, result, submit_time):
+        start_time = time.time()
+        result.queued[stage.name] = start_time - submit_time
+        try:
+            return stage.func(result.value)
+        finally:
+            result.latencies[stage.name] = time.time() - start_time
+
+    def run(self, items):
+        """
+        Run all the objects through the pipeline
+
+        Args:
+            items (iterable): The input objects of the first stage
+
+        Returns:
+            list: PipelineResult for every object, in the order of items
+
+        Raises:
+            Exception: The first error in case of fail_fast
+        """
+        self.start_time = time.time()
+        self.results = [
+            PipelineResult(index, item) for index, item in enumerate(items)
+        ]
+        executors = [
+            Executor(
+                max_workers=stage.concurrency or None, name=stage.name
+            ) for stage in self.stages
+        ]
+        processed = [0] * len(self.stages)
+        pending = dict()
+
+        def submit(result, stage_index):
+            stage = self.stages[stage_index]
+            future = executors[stage_index].submit_raw(
+                self._run_stage, stage, result, time.time()
+            )
+            pending[future] = (result, stage_index)
+
+        log.info(
+            f"Running {len(self.results)} objects through {self.name}: "
+            f"{' -> '.join(stage.name for stage in self.stages)}"
+        )
+        try:
+            if self.stages:
+                for result in self.results:
+                    submit(result, 0)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result, stage_index = pending.pop(future)
+                    stage = self.stages[stage_index]
+                    processed[stage_index] += 1
+                    if self.progress:
+                        self.progress(
+                            stage.name, processed[stage_index],
+                            len(self.results)
+                        )
+                    error = future.exception()
+                    if error is not None:
+                        result.error = error
+                        result.failed_stage = stage.name
+                        result.end_time = time.time()
+                        log.error(
+                            f"{self.name}: object {result.index} failed in "
+                            f"stage {stage.name}: {error}"
+                        )
+                        if self.fail_fast:
+                            raise error
+                        continue
+                    result.value = result.outputs[stage.name] = future.result()
+                    if stage_index + 1 < len(self.stages):
+                        submit(result, stage_index + 1)
+                    else:
+                        result.end_time = time.time()
+        finally:
+            for future in pending:
+                future.cancel()
+            for executor in executors:
+                executor.shutdown(wait=not pending)
+            self.end_time = time.time()
+        log.info(self.report())
+        return self.results
+
+    def summary(self):
+        """
+        Latency distribution of every stage
+
+        Returns:
+            dict: stage name -> count, failed count and mean, min, p50, p90,
+                p99 and max latency in seconds, 'total' for the whole
+                pipeline
+        """
+        summary = dict()
+        names = [stage.name for stage in self.stages]
+        for name in names + ['total']:
+            if name == 'total':
+                latencies = sorted(
+                    result.total_time for result in self.results
+                    if result.end_time and not result.error
+                )
+                failed = sum(1 for result in self.results if result.error)
+            else:
+                latencies = sorted(
+                    result.latencies[name] for result in self.results
+                    if name in result.latencies
+                )
+                failed = sum(
+                    1 for result in self.results
+                    if result.failed_stage == name
+                )
+            summary[name] = {
+                'count': len(latencies),
+                'failed': failed,
+                'mean': sum(latencies) / len(latencies) if latencies else None,
+                'min': latencies[0] if latencies else None,
+                'p50': percentile(latencies, 50),
+                'p90': percentile(latencies, 90),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if latencies else None,
+            }
+        return summary
+
+    def report(self):
+        """
+        Human readable latency report of the stages
+
+        Returns:
+            str: The report
+        """
+        wall_time = (self.end_time or time.time()) - (
+            self.start_time or time.time()
+        )
+        lines = [
+            f"{self.name}: {len(self.results)} objects in {wall_time:.1f}s"
+        ]
+        for name, stats in self.summary().items():
+            if not stats['count']:
+                lines.append(f"  {name}: 0 done, {stats['failed']} failed")
+                continue
+            lines.append(
+                f"  {name}: {stats['count']} done, {stats['failed']} failed, "
+                f"mean {stats['mean']:.2f}s, p50 {stats['p50']:.2f}s, "
+                f"p90 {stats['p90']:.2f}s, p99 {stats['p99']:.2f}s, "
+                f"max {stats['max']:.2f}s"
+            )
+        return '\n'.join(lines)
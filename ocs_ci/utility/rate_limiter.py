@@ -0,0 +1,295 @@
+"""
+Client side rate limiting of the requests to the API server
+
+All the 'oc'/'kubectl' commands run by run_cmd()/run_cmd_async() and the calls
+of the REST backend go through one process wide limiter, which combines
+a token bucket (max requests per second with allowed burst) and a cap of the
+requests in flight. When the API server throttles us (429 TooManyRequests),
+all the requests are paused for the Retry-After period and the throttled
+request is retried. Long running 'oc' commands (exec, rsh, logs, ...) are
+not limited. Commands blocking until the cluster changes ('delete' waiting
+for the deletion, 'get --watch', 'rollout status') are rate limited, but
+they don't hold a slot of the requests in flight while they wait.
+
+Configured in config.RUN:
+    api_qps - requests per second, 0 for unlimited
+    api_burst - max number of requests sent at once over the api_qps rate
+    api_max_in_flight - max number of requests in flight, 0 for unlimited
+    api_throttle_retries - how many times the throttled request is retried
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from ocs_ci.framework import config
+
+log = logging.getLogger(__name__)
+
+API_COMMANDS = ('oc', 'kubectl')
+# Streaming commands holding the connection for long time
+LONG_RUNNING_VERBS = (
+    'rsh', 'exec', 'logs', 'attach', 'port-forward', 'rsync', 'cp', 'debug',
+    'proxy', 'wait', 'observe', 'adm',
+)
+# Options making 'oc get' block watching the changes
+WATCH_OPTIONS = ('-w', '--watch', '--watch-only')
+# Global options of 'oc' followed by the value as separate argument
+OPTIONS_WITH_VALUE = (
+    '-n', '--namespace', '--kubeconfig', '--context', '--cluster', '--user',
+    '-s', '--server', '--token', '--as', '--config', '--request-timeout',
+)
+# Messages of the throttled requests in the 'oc' error output
+THROTTLED_MESSAGES = ('TooManyRequests', 'Too Many Requests', 'status code 429')
+# Default and max time in seconds to back off when Retry-After is not known
+DEFAULT_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 30
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+class RateLimiter(object):
+    """
+    Token bucket rate limiter with the cap of requests in flight
+    """
+
+    def __init__(self, qps=0, burst=1, max_in_flight=0):
+        """
+        Initializer function
+
+        Args:
+            qps (float): Requests per second, 0 for unlimited
+            burst (int): Max number of requests sent at once over the rate
+            max_in_flight (int): Max number of requests in flight, 0 for
+                unlimited
+        """
+        self.qps = qps
+        self.burst = max(burst, 1)
+        self.max_in_flight = max_in_flight
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._paused_until = 0
+        self._cond = threading.Condition()
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def _try_acquire(self, in_flight=True):
+        """
+        Try to acquire a slot for the request, has to be called with the
+        condition lock held
+
+        Args:
+            in_flight (bool): False for not holding a slot of the requests
+                in flight, only the rate is limited
+
+        Returns:
+            float: 0 if the slot was acquired, otherwise time in seconds to
+                wait before the next try, None for waiting until a request
+                in flight is finished
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if (
+            in_flight and self.max_in_flight
+            and self._in_flight >= self.max_in_flight
+        ):
+            return None
+        if self.qps:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.qps
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.qps
+            self._tokens -= 1
+        if in_flight:
+            self._in_flight += 1
+        return 0
+
+    def acquire(self, in_flight=True):
+        """
+        Block until the request can be sent
+
+        Args:
+            in_flight (bool): False for not holding a slot of the requests
+                in flight (for the blocking commands), release() has to be
+                called with the same value
+        """
+        with self._cond:
+            while True:
+                wait = self._try_acquire(in_flight)
+                if wait == 0:
+                    return
+                self._cond.wait(wait)
+
+    async def acquire_async(self, in_flight=True):
+        """
+        Wait until the request can be sent without blocking the event loop,
+        see acquire()
+        """
+        while True:
+            with self._cond:
+                wait = self._try_acquire(in_flight)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait if wait is not None else 0.05)
+
+    def release(self, in_flight=True):
+        """
+        Mark the request as finished
+
+        Args:
+            in_flight (bool): The value the request was acquired with
+        """
+        if not in_flight:
+            return
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def limit(self):
+        """
+        Context manager holding a slot for the request
+        """
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def pause(self, retry_after=None):
+        """
+        Pause all the requests after the API server throttled us
+
+        Args:
+            retry_after (float): Time in seconds to pause, as requested by
+                the Retry-After header
+        """
+        retry_after = min(retry_after or DEFAULT_RETRY_AFTER, MAX_RETRY_AFTER)
+        log.warning(
+            f"API server is throttling requests, pausing for {retry_after}s"
+        )
+        with self._cond:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + retry_after
+            )
+
+
+def get_limiter():
+    """
+    Get the process wide limiter of the API requests configured in
+    config.RUN
+
+    Returns:
+        RateLimiter: The shared limiter
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(
+                qps=config.RUN.get('api_qps', 0),
+                burst=config.RUN.get('api_burst', 1),
+                max_in_flight=config.RUN.get('api_max_in_flight', 0),
+            )
+        return _limiter
+
+
+def reset_limiter():
+    """
+    Drop the shared limiter, so it's re-created from the current config
+    """
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
+
+
+def get_oc_verb(cmd):
+    """
+    Get the verb (sub-command) of the 'oc'/'kubectl' command
+
+    Args:
+        cmd (list): The command split to arguments
+
+    Returns:
+        str: The verb, e.g. 'get', or None if not found
+    """
+    args = iter(cmd[1:])
+    for arg in args:
+        if arg.startswith('-'):
+            if '=' not in arg and arg in OPTIONS_WITH_VALUE:
+                next(args, None)
+            continue
+        return arg
+    return None
+
+
+def is_api_command(cmd):
+    """
+    Check if the command sends rate limited requests to the API server, the
+    long running commands (exec, logs, rsync, ...) are not limited since
+    they would hold the slot for the whole time they run
+
+    Args:
+        cmd (list): The command split to arguments
+
+    Returns:
+        bool: True for 'oc' and 'kubectl' API request commands
+    """
+    if not cmd or os.path.basename(cmd[0]) not in API_COMMANDS:
+        return False
+    return get_oc_verb(cmd) not in LONG_RUNNING_VERBS
+
+
+def is_blocking_command(cmd):
+    """
+    Check if the API command blocks until the cluster changes, such command
+    shouldn't hold a slot of the requests in flight for the whole time it
+    waits
+
+    Args:
+        cmd (list): The command split to arguments
+
+    Returns:
+        bool: True for 'oc delete' waiting for the deletion, 'oc get --watch'
+            and 'oc rollout status'
+    """
+    verb = get_oc_verb(cmd)
+    if verb == 'get':
+        return any(
+            arg.split('=')[0] in WATCH_OPTIONS and not arg.endswith('=false')
+            for arg in cmd
+        )
+    if verb == 'delete':
+        return '--wait=false' not in cmd
+    if verb == 'rollout':
+        return cmd[cmd.index(verb) + 1:][:1] == ['status']
+    return False
+
+
+def is_throttled(error_output):
+    """
+    Check if the command failed because the API server throttled it
+
+    Args:
+        error_output (str): The error output of the command
+
+    Returns:
+        bool: True if the request was throttled
+    """
+    return any(message in error_output for message in THROTTLED_MESSAGES)
+
+
+def get_throttle_retries():
+    """
+    Returns:
+        int: How many times the throttled request is retried
+    """
+    return config.RUN.get('api_throttle_retries', 5)
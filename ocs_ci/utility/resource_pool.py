@@ -0,0 +1,267 @@
+"""
+Pool of warm (pre-provisioned) resources
+
+Provisioning a resource for a test (e.g. a PVC with a Running pod on it) takes
+tens of seconds, while most of the tests don't need a fresh one. ResourcePool
+keeps up to size ready resources provisioned in the background. A test checks
+a resource out and checks it in when done, the returned resource is recycled
+(e.g. its volume is wiped) in the background and becomes ready again. The
+pool is refilled asynchronously after every checkout and never owns more than
+max_size resources, including the checked out ones.
+
+Example:
+    pool = ResourcePool(create_pair, recycle_pair, delete_pairs, size=2)
+    pool.fill()
+    pair = pool.checkout() or create_pair()
+    ...
+    pool.checkin(pair)
+    ...
+    pool.close()
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import wait
+
+from ocs_ci.utility.executor import Executor
+
+log = logging.getLogger(__name__)
+
+
+class ResourcePool(object):
+    """
+    Keeps ready resources provisioned in the background
+    """
+
+    def __init__(
+        self, create, recycle=None, destroy=None, size=1, max_size=None,
+        max_workers=None, name='resource pool'
+    ):
+        """
+        Initializer function
+
+        Args:
+            create (callable): Called without arguments for provisioning a new
+                ready resource
+            recycle (callable): Called with a returned resource, returns the
+                resource ready to be checked out again or raises in case the
+                resource can't be reused (it's destroyed then), None for
+                reusing the returned resources as they are
+            destroy (callable): Called with a list of resources to delete
+            size (int): Number of ready resources kept in the pool
+            max_size (int): Max number of resources owned by the pool
+                including the checked out ones, not lower than size
+                (default: 2 * size)
+            max_workers (int): Max number of resources provisioned,
+                recycled or destroyed at once (default: size)
+            name (str): Name of the pool for logging
+        """
+        self.create = create
+        self.recycle = recycle
+        self.destroy = destroy
+        self.size = size
+        self.max_size = max(max_size or 2 * size, size)
+        self.name = name
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'created': 0,
+            'recycled': 0,
+            'destroyed': 0,
+            'failed': 0,
+        }
+        self._idle = deque()
+        self._creating = 0
+        self._busy = 0
+        self._closed = False
+        self._futures = set()
+        self._cond = threading.Condition()
+        self._executor = Executor(
+            max_workers=max_workers or max(size, 1), fail_fast=False,
+            name=name
+        )
+
+    @property
+    def total(self):
+        """
+        Number of the resources owned by the pool: ready, being provisioned,
+        checked out and being recycled
+        """
+        return len(self._idle) + self._creating + self._busy
+
+    @property
+    def ready(self):
+        """
+        Number of the ready resources
+        """
+        return len(self._idle)
+
+    def _submit(self, func, *args):
+        with self._cond:
+            future = self._executor.submit_raw(func, *args)
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future):
+        with self._cond:
+            self._futures.discard(future)
+
+    def _refill(self):
+        """
+        Start provisioning the missing resources, called with the lock held
+        """
+        while (
+            not self._closed
+            and len(self._idle) + self._creating < self.size
+            and self.total < self.max_size
+        ):
+            self._creating += 1
+            self._submit(self._create_one)
+
+    def _create_one(self):
+        start_time = time.time()
+        try:
+            resource = self.create()
+        except Exception as ex:
+            log.error(f"Failed to provision a resource of {self.name}: {ex}")
+            with self._cond:
+                self._creating -= 1
+                self.stats['failed'] += 1
+                self._cond.notify_all()
+            return
+        log.info(
+            f"Provisioned a resource of {self.name} in "
+            f"{time.time() - start_time:.1f}s"
+        )
+        with self._cond:
+            self._creating -= 1
+            self.stats['created'] += 1
+            if not self._closed:
+                self._idle.append(resource)
+                self._cond.notify_all()
+                return
+        self._destroy([resource])
+
+    def _recycle_one(self, resource):
+        keep = False
+        try:
+            if self.recycle:
+                resource = self.recycle(resource)
+            keep = True
+        except Exception as ex:
+            log.warning(f"Failed to recycle a resource of {self.name}: {ex}")
+        with self._cond:
+            self._busy -= 1
+            if keep and not self._closed and len(self._idle) < self.size:
+                self._idle.append(resource)
+                self.stats['recycled'] += 1
+                self._cond.notify_all()
+                self._refill()
+                return
+            self._refill()
+        self._destroy([resource])
+
+    def _destroy(self, resources):
+        if not resources:
+            return
+        try:
+            if self.destroy:
+                self.destroy(resources)
+        except Exception as ex:
+            log.error(
+                f"Failed to delete {len(resources)} resources of {self.name}: "
+                f"{ex}"
+            )
+        with self._cond:
+            self.stats['destroyed'] += len(resources)
+
+    def fill(self):
+        """
+        Start provisioning the resources in the background
+        """
+        with self._cond:
+            self._refill()
+
+    def checkout(self, timeout=0):
+        """
+        Take a ready resource from the pool
+
+        Args:
+            timeout (float): Time in seconds to wait for a resource being
+                provisioned or recycled, 0 for not waiting
+
+        Returns:
+            object: The resource, None in case there is no ready resource,
+                the caller provisions its own resource then
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            while not self._idle and not self._closed:
+                left = deadline - time.time()
+                if left <= 0 or (self._creating == 0 and self._busy == 0):
+                    break
+                self._cond.wait(left)
+            resource = None
+            if self._idle:
+                resource = self._idle.popleft()
+                self._busy += 1
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+            self._refill()
+        return resource
+
+    def checkin(self, resource):
+        """
+        Return the checked out resource, it's recycled in the background
+
+        Args:
+            resource (object): The resource returned by checkout()
+        """
+        with self._cond:
+            if self._closed:
+                self._busy -= 1
+            else:
+                self._submit(self._recycle_one, resource)
+                return
+        self._destroy([resource])
+
+    def discard(self, resource):
+        """
+        Return the checked out resource which can't be reused, it's
+        destroyed and replaced in the background
+
+        Args:
+            resource (object): The resource returned by checkout()
+        """
+        with self._cond:
+            self._busy -= 1
+            self._refill()
+            if not self._closed:
+                self._submit(self._destroy, [resource])
+                return
+        self._destroy([resource])
+
+    def close(self):
+        """
+        Stop refilling the pool, wait for the background work and destroy
+        the ready resources
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            futures = list(self._futures)
+        wait(futures)
+        self._executor.shutdown()
+        with self._cond:
+            resources = list(self._idle)
+            self._idle.clear()
+        self._destroy(resources)
+        log.info(f"{self.name} closed: {self.stats}")
+
+    def __repr__(self):
+        return (
+            f"<ResourcePool {self.name}: {self.ready} ready, "
+            f"{self.total} total, {self.stats}>"
+        )
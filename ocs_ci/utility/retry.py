@@ -2,10 +2,15 @@ import logging
 import time
 from functools import wraps
 
+from ocs_ci.utility.backoff import BackoffPolicy
+
 logger = logging.getLogger(__name__)
 
 
-def retry(exception_to_check, tries=4, delay=3, backoff=2):
+def retry(
+    exception_to_check, tries=4, delay=3, backoff=2, jitter=None,
+    max_delay=None
+):
     """
     Retry calling the decorated function using exponential backoff.
 
@@ -14,20 +19,26 @@ def retry(exception_to_check, tries=4, delay=3, backoff=2):
         tries: number of times to try (not retry) before giving up
         delay: initial delay between retries in seconds
         backoff: backoff multiplier e.g. value of 2 will double the delay each retry
+        jitter: relative random deviation of the delay, e.g. 0.1 for +-10%
+            (default: config.RUN['sampler_jitter'])
+        max_delay: max delay between retries in seconds, unlimited by default
     """
     def deco_retry(f):
 
         @wraps(f)
         def f_retry(*args, **kwargs):
-            mtries, mdelay = tries, delay
-            while mtries > 1:
+            # the delay grows by the backoff only, not by the errors
+            policy = BackoffPolicy(
+                delay, backoff=backoff, max_delay=max_delay or float('inf'),
+                jitter=jitter, error_backoff=1
+            )
+            for attempt in range(tries - 1):
                 try:
                     return f(*args, **kwargs)
                 except exception_to_check as e:
-                    logger.warning("%s, Retrying in %d seconds..." % (str(e), mdelay))
+                    mdelay = policy.get_delay(attempt)
+                    logger.warning(f"{e}, Retrying in {mdelay:.1f} seconds...")
                     time.sleep(mdelay)
-                    mtries -= 1
-                    mdelay *= backoff
             return f(*args, **kwargs)
 
         return f_retry
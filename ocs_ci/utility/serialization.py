@@ -0,0 +1,130 @@
+"""
+Fast parsing of the data returned by 'oc' and other cluster tools
+
+JSON is parsed by orjson when it is installed (the standard json module is
+used otherwise) and YAML by the LibYAML based CSafeLoader when PyYAML is built
+with LibYAML support. Both are several times faster than the pure Python
+yaml.safe_load() on big outputs like the list of all pods.
+"""
+import json
+import logging
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def json_loads(data):
+    """
+    Parse the JSON string by the fastest available parser
+
+    Args:
+        data (str): The JSON string
+
+    Returns:
+        object: The parsed data
+
+    Raises:
+        ValueError: In case the data are not valid JSON
+
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """
+    Serialize the data to JSON by the fastest available serializer, e.g.
+    for piping a manifest to 'oc create -f -'
+
+    Args:
+        data (object): The data, values which are not JSON serializable
+            (like dates from YAML) are converted to strings
+
+    Returns:
+        bytes: The UTF-8 encoded JSON
+
+    """
+    if orjson:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode()
+
+
+def yaml_load(data):
+    """
+    Parse the YAML document by the fastest available safe loader
+
+    Args:
+        data (str or file): The YAML document
+
+    Returns:
+        object: The parsed data
+
+    """
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def yaml_load_all(data):
+    """
+    Parse all the YAML documents by the fastest available safe loader
+
+    Args:
+        data (str or file): The YAML documents
+
+    Returns:
+        generator: The parsed documents
+
+    """
+    return yaml.load_all(data, Loader=SafeLoader)
+
+
+def _json_load_stream(data):
+    """
+    Parse concatenated JSON objects, as printed by 'oc ... -o json' for more
+    than one resource, to the generic 'List' kind
+    """
+    decoder = json.JSONDecoder()
+    items, index = [], 0
+    while index < len(data):
+        item, index = decoder.raw_decode(data, index)
+        items.append(item)
+        while index < len(data) and data[index].isspace():
+            index += 1
+    return {
+        'apiVersion': 'v1',
+        'kind': 'List',
+        'items': items,
+        'metadata': {'resourceVersion': '', 'selfLink': ''},
+    }
+
+
+def load_oc_output(out):
+    """
+    Parse the output of 'oc' command, JSON output ('-o json') is parsed by
+    the JSON parser, anything else by the YAML loader
+
+    Args:
+        out (str): The output of the command
+
+    Returns:
+        object: The parsed output
+
+    """
+    stripped = out.lstrip()
+    if stripped.startswith(('{', '[')):
+        try:
+            return json_loads(stripped)
+        except ValueError:
+            try:
+                return _json_load_stream(stripped)
+            except ValueError:
+                log.debug("Output is not JSON, parsing it as YAML")
+    return yaml_load(out)
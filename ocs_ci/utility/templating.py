@@ -1,12 +1,107 @@
+"""
+Templating of the resources
+
+The parsed YAML templates and the compiled Jinja2 templates are cached for the
+whole process, so the same template (e.g. CSI pvc.yaml) is read and parsed
+only once and not for every created resource. load_yaml() hands out deep
+copies of the cached data, so the callers can modify them freely. The cache
+entry is refreshed when the modification time or size of the file changes.
+"""
 import logging
-from jinja2 import Environment, FileSystemLoader, Template
+import os
+import threading
+
+from jinja2 import Environment, FileSystemLoader
 import yaml
 
 from ocs_ci.ocs.constants import TEMPLATE_DIR
+from ocs_ci.utility.serialization import yaml_load, yaml_load_all
 from ocs_ci.utility.utils import get_url_content
 
 logger = logging.getLogger(__name__)
 
+# (path, multi_document) -> (mtime, size, parsed data) of the YAML files
+_yaml_cache = dict()
+# (base path, trim_blocks) -> Jinja2 environment caching compiled templates
+_jinja_envs = dict()
+_cache_lock = threading.Lock()
+
+
+def copy_data(data):
+    """
+    Deep copy of the data loaded from YAML or JSON (dicts, lists and
+    scalars), much faster than copy.deepcopy() for this kind of data
+
+    Args:
+        data (object): The data to copy
+
+    Returns:
+        object: The copy of the data
+    """
+    if isinstance(data, dict):
+        return {key: copy_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [copy_data(value) for value in data]
+    return data
+
+
+def clear_template_cache():
+    """
+    Drop all the cached YAML and Jinja2 templates
+    """
+    with _cache_lock:
+        _yaml_cache.clear()
+        _jinja_envs.clear()
+
+
+def get_jinja_env(base_path, trim_blocks=True):
+    """
+    Get the cached Jinja2 environment loading the templates from the base
+    path, the environment keeps the compiled templates and recompiles them
+    when their files change
+
+    Args:
+        base_path (str): Path from which the templates are loaded
+        trim_blocks (bool): Remove the first newline after a block
+
+    Returns:
+        jinja2.Environment: The environment
+    """
+    key = (os.path.abspath(base_path), trim_blocks)
+    with _cache_lock:
+        j2_env = _jinja_envs.get(key)
+        if j2_env is None:
+            j2_env = Environment(
+                loader=FileSystemLoader(key[0]), trim_blocks=trim_blocks
+            )
+            j2_env.filters['to_nice_yaml'] = to_nice_yaml
+            _jinja_envs[key] = j2_env
+    return j2_env
+
+
+def _load_cached_yaml(file, multi_document):
+    """
+    Load the local YAML file from the cache, the file is parsed when not
+    cached yet or changed since cached
+
+    Returns:
+        object: The cached data (not a copy), list of the documents for
+            multi_document
+    """
+    stat = os.stat(file)
+    key = (os.path.abspath(file), multi_document)
+    cached = _yaml_cache.get(key)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(file, 'r') as fs:
+        content = fs.read()
+    data = list(yaml_load_all(content)) if multi_document else yaml_load(
+        content
+    )
+    with _cache_lock:
+        _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
 
 def load_config_data(data_path):
     """
@@ -75,12 +170,9 @@ class Templating:
         Returns: rendered template
 
         """
-        j2_env = Environment(
-            loader=FileSystemLoader(self._base_path),
-            trim_blocks=True
+        j2_template = get_jinja_env(self._base_path).get_template(
+            template_path
         )
-        j2_env.filters['to_nice_yaml'] = to_nice_yaml
-        j2_template = j2_env.get_template(template_path)
         return j2_template.render(**data)
 
     @property
@@ -117,9 +209,8 @@ def generate_yaml_from_jinja2_template_with_data(file_, **kwargs):
     Examples:
         generate_yaml_from_template(file_='path/to/file/name', pv_data_dict')
     """
-    with open(file_, 'r') as stream:
-        data = stream.read()
-    template = Template(data)
+    j2_env = get_jinja_env(os.path.dirname(file_), trim_blocks=False)
+    template = j2_env.get_template(os.path.basename(file_))
     out = template.render(**kwargs)
     return yaml.safe_load(out)
 
@@ -151,12 +242,13 @@ def load_yaml(file, multi_document=False):
             iteration returns dict from one loaded document from a file.
 
     """
-    loader = yaml.safe_load_all if multi_document else yaml.safe_load
     if file.startswith('http'):
+        loader = yaml_load_all if multi_document else yaml_load
         return loader(get_url_content(file))
-    else:
-        with open(file, 'r') as fs:
-            return loader(fs.read())
+    data = _load_cached_yaml(file, multi_document)
+    if multi_document:
+        return (copy_data(document) for document in data)
+    return copy_data(data)
 
 
 def get_n_document_from_yaml(yaml_generator, index=0):
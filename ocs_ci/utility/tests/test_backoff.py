@@ -0,0 +1,84 @@
+import functools
+import time
+
+import pytest
+
+from ocs_ci.ocs.exceptions import TimeoutExpiredError
+from ocs_ci.utility.backoff import BackoffPolicy
+from ocs_ci.utility.retry import retry
+from ocs_ci.utility.utils import TimeoutSampler
+
+
+def test_backoff_policy():
+    policy = BackoffPolicy(1, backoff=2, max_delay=5, jitter=0, error_backoff=3)
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+    assert policy.get_delay(0, consecutive_errors=1) == 3
+    policy.jitter = 0.5
+    delays = [policy.get_delay(0) for _ in range(100)]
+    assert all(0.5 <= delay <= 1.5 for delay in delays)
+    assert len(set(delays)) > 1
+    assert BackoffPolicy.clamp(10, time.time() + 1) <= 1
+    assert BackoffPolicy.clamp(10, time.time() - 1) == 0
+
+
+def test_sampler_clamped_to_timeout():
+    sampler = TimeoutSampler(0.5, 10, lambda: False)
+    start = time.time()
+    with pytest.raises(TimeoutExpiredError):
+        for _ in sampler:
+            pass
+    assert time.time() - start < 1
+    # the last sample is taken right at the timeout
+    assert sampler.stats.attempts == 2
+
+
+def test_sampler_error_backoff():
+    results = iter([ValueError('outage'), ValueError('outage'), True])
+
+    def func():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    sampler = TimeoutSampler(5, 0.05, func)
+    sampler.policy = BackoffPolicy(
+        0.05, jitter=0, error_backoff=2, max_delay=1
+    )
+    assert sampler.wait_for_func_status(result=True)
+    assert sampler.stats.attempts == 3
+    assert sampler.stats.errors == 2
+    assert sampler.stats.consecutive_errors == 0
+    assert str(sampler.stats.last_error) == 'outage'
+    # 0.1s after the first and 0.2s after the second failed sample
+    assert sampler.stats.total_sleep == pytest.approx(0.3)
+
+
+def test_sampler_fast_probe():
+    sampler = TimeoutSampler(5, 10, iter([False, True]).__next__)
+    sampler.fast_probe = 0.01
+    start = time.time()
+    assert sampler.wait_for_func_status(result=True)
+    assert time.time() - start < 1
+
+
+def test_retry():
+    calls = []
+
+    @retry(ValueError, tries=3, delay=0.01, backoff=2, jitter=0)
+    def func():
+        calls.append(time.time())
+        raise ValueError('failed')
+
+    with pytest.raises(ValueError):
+        func()
+    assert len(calls) == 3
+    assert calls[2] - calls[1] >= calls[1] - calls[0]
+
+
+def test_sampler_of_partial():
+    sampler = TimeoutSampler(0.1, 0.05, functools.partial(int, 'x'))
+    with pytest.raises(TimeoutExpiredError):
+        for _ in sampler:
+            pass
+    assert sampler.stats.errors == sampler.stats.attempts
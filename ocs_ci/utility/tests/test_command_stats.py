@@ -0,0 +1,29 @@
+import pytest
+
+from ocs_ci.utility import command_stats
+
+
+@pytest.mark.parametrize('cmd, key', [
+    ('oc -n openshift-storage get pod pod-1 -o json', 'oc get pod'),
+    ('oc --kubeconfig /tmp/kc get pods/pod-1', 'oc get pods'),
+    ('oc create -f /tmp/pvc.yaml -o json', 'oc create -f'),
+    ('oc -n openshift-storage rsh pod-1 ceph health', 'oc rsh'),
+    ('ceph health', 'ceph'),
+])
+def test_command_key(cmd, key):
+    assert command_stats.get_command_key(cmd.split()) == key
+
+
+def test_report():
+    stats = command_stats.CommandStats('test', top=2)
+    for duration in (0.2, 3, 0.01, 1.5):
+        stats.record('oc get pod', f"oc get pod {duration}", duration)
+    stats.record('oc delete pod', 'oc delete pod x', 0.5, returncode=1)
+    report = stats.report()
+    get_pod = report['commands']['oc get pod']
+    assert get_pod['count'] == 4
+    assert get_pod['max'] == 3
+    assert sum(get_pod['histogram']) == 4
+    assert report['commands']['oc delete pod']['errors'] == 1
+    assert [slow['duration'] for slow in report['top_slowest']] == [3, 1.5]
+    assert report['most_frequent'][0]['command'] == 'oc get pod'
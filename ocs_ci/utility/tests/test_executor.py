@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+import pytest
+
+from ocs_ci.ocs.exceptions import TaskTimeoutError
+from ocs_ci.ocs.parallel import parallel
+from ocs_ci.utility.executor import AsyncExecutor, Executor
+
+
+def test_executor_results():
+    progress = []
+    with Executor(
+        max_workers=4, progress=lambda *args: progress.append(args[:2])
+    ) as executor:
+        for delay in (0.3, 0.1, 0.2):
+            executor.submit(time.sleep, delay)
+            executor.submit(lambda value=delay: value)
+    assert executor.results() == [None, 0.3, None, 0.1, None, 0.2]
+    assert sorted(progress) == [(count, 6) for count in range(1, 7)]
+    summary = executor.summary()
+    assert summary['finished'] == 6
+    assert summary['failed'] == 0
+    assert summary['max_time'] >= 0.3
+    # the sleeps overlap
+    assert summary['wall_time'] < summary['total_time']
+
+
+def test_executor_as_completed():
+    executor = Executor(max_workers=3)
+    assert executor.map(time.sleep, [0.2, 0.01]) == [None, None]
+    for delay in (0.3, 0.01):
+        executor.submit(lambda value=delay: time.sleep(value) or value)
+    assert [result.value for result in executor.as_completed()] == [0.01, 0.3]
+    executor.shutdown()
+
+
+def test_executor_fail_fast():
+    started = []
+
+    def task(index):
+        started.append(index)
+        if index == 0:
+            raise ValueError('failed')
+        time.sleep(0.2)
+
+    with pytest.raises(ValueError):
+        with Executor(max_workers=1) as executor:
+            for index in range(5):
+                executor.submit(task, index)
+    assert started == [0]
+    assert executor.summary()['cancelled'] == 4
+
+    executor = Executor(max_workers=2, fail_fast=False)
+    for index in range(3):
+        executor.submit(task, index)
+    results = list(executor.as_completed())
+    assert len(results) == 3
+    with pytest.raises(ValueError):
+        executor.results()
+
+
+def test_executor_many_tasks_and_raw_futures():
+    executor = Executor(max_workers=8)
+    assert executor.map(abs, range(-2000, 0)) == list(range(2000, 0, -1))
+    future = executor.submit_raw(abs, -1)
+    assert future.result() == 1
+    # the raw future isn't tracked
+    assert executor.summary()['tasks'] == 2000
+    assert not executor._pending
+    executor.shutdown()
+
+
+def test_executor_timeout():
+    start = time.time()
+    with pytest.raises(TaskTimeoutError):
+        with Executor(timeout=0.1) as executor:
+            executor.submit(time.sleep, 1)
+    assert time.time() - start < 0.5
+
+
+def test_async_executor():
+    finished = []
+
+    async def task(delay, fail=False):
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError('failed')
+        finished.append(delay)
+        return delay
+
+    executor = AsyncExecutor(max_workers=2, timeout=1)
+    for delay in (0.2, 0.1, 0.15):
+        executor.submit(task, delay)
+    assert executor.run() == [0.2, 0.1, 0.15]
+    assert finished == [0.1, 0.2, 0.15]
+
+    # the running sibling is cancelled on the first failure
+    finished.clear()
+    executor = AsyncExecutor()
+    executor.submit(task, 0.05, fail=True)
+    executor.submit(task, 0.5)
+    with pytest.raises(ValueError):
+        executor.run()
+    assert finished == []
+    assert executor.summary()['cancelled'] == 1
+
+    executor = AsyncExecutor(timeout=0.05)
+    executor.submit(task, 1)
+    with pytest.raises(TaskTimeoutError):
+        executor.run()
+
+
+def test_parallel():
+    with parallel() as p:
+        for delay in (0.2, 0.01):
+            p.spawn(lambda value=delay: time.sleep(value) or value)
+        assert list(p) == [0.01, 0.2]
+    with pytest.raises(ValueError):
+        with parallel() as p:
+            p.spawn(int, 'not a number')
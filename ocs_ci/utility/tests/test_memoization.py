@@ -0,0 +1,48 @@
+from ocs_ci.framework import config
+from ocs_ci.utility import memoization
+
+
+def test_memoize_and_invalidate():
+    calls = []
+
+    @memoization.memoize(group='test')
+    def get_versions():
+        calls.append(1)
+        return {'ceph': '14.2.4'}
+
+    assert get_versions() == {'ceph': '14.2.4'}
+    # the cached data are copied, so the caller can't modify them
+    get_versions()['ceph'] = 'modified'
+    assert get_versions() == {'ceph': '14.2.4'}
+    assert len(calls) == 1
+    memoization.invalidate('other')
+    get_versions()
+    assert len(calls) == 1
+    memoization.invalidate('test')
+    get_versions()
+    assert len(calls) == 2
+
+
+def test_disk_cache(tmpdir, monkeypatch):
+    monkeypatch.setitem(config.RUN, 'metadata_disk_cache', True)
+    monkeypatch.setitem(config.ENV_DATA, 'cluster_path', str(tmpdir))
+    monkeypatch.setattr(memoization, '_get_cluster_uid', lambda: 'uid-1')
+    calls = []
+
+    def get_version():
+        calls.append(1)
+        return '4.3.0'
+
+    memoized = memoization.memoize(group='test-disk', persist=True)
+    assert memoized(get_version)() == '4.3.0'
+    assert tmpdir.join(memoization.DISK_CACHE_FILE).check()
+    # new process (new in-memory cache) against the same cluster
+    assert memoized(get_version)() == '4.3.0'
+    assert len(calls) == 1
+    # other cluster re-uses the cluster directory
+    monkeypatch.setattr(memoization, '_get_cluster_uid', lambda: 'uid-2')
+    assert memoized(get_version)() == '4.3.0'
+    assert len(calls) == 2
+    memoization.invalidate('test-disk')
+    assert memoized(get_version)() == '4.3.0'
+    assert len(calls) == 3
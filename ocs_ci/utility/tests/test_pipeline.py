@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from ocs_ci.utility.pipeline import Pipeline, Stage, percentile
+
+
+def test_pipeline_streams_objects():
+    finished = []
+
+    def create(index):
+        return index
+
+    def wait_ready(index):
+        # object 0 is the slow one, it mustn't hold back the others
+        time.sleep(0.5 if index == 0 else 0.01)
+        return index
+
+    def finish(index):
+        finished.append(index)
+        return index * 10
+
+    pipeline = Pipeline([
+        Stage('create', create, 2),
+        Stage('ready', wait_ready, 10),
+        Stage('finish', finish, 1),
+    ])
+    results = pipeline.run(range(5))
+    assert [result.value for result in results] == [0, 10, 20, 30, 40]
+    assert finished[-1] == 0
+    assert results[0].latencies['ready'] >= 0.5
+    assert results[1].latencies['ready'] < 0.5
+    assert results[1].end_time < results[0].end_time
+    summary = pipeline.summary()
+    assert summary['ready']['count'] == 5
+    assert summary['ready']['max'] >= 0.5
+    assert summary['total']['count'] == 5
+    assert 'ready' in pipeline.report()
+
+
+def test_pipeline_failures():
+    def stage(index):
+        if index == 1:
+            raise ValueError('failed')
+        return index
+
+    pipeline = Pipeline([Stage('first', stage), Stage('second', str)])
+    results = pipeline.run(range(3))
+    assert results[1].failed_stage == 'first'
+    assert isinstance(results[1].error, ValueError)
+    assert 'second' not in results[1].latencies
+    assert [results[0].value, results[2].value] == ['0', '2']
+    assert pipeline.summary()['first']['failed'] == 1
+
+    with pytest.raises(ValueError):
+        Pipeline([Stage('first', stage, 1)], fail_fast=True).run(range(3))
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 90) == 7
+    assert percentile([], 90) is None
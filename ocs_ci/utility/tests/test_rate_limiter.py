@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from ocs_ci.utility import rate_limiter
+
+
+@pytest.mark.parametrize('cmd, expected', [
+    ('oc get pods', True),
+    ('oc -n openshift-storage --kubeconfig /tmp/kc get pods', True),
+    ('kubectl --namespace=default delete pod pod-1', True),
+    ('oc -n openshift-storage rsh pod-1 fio', False),
+    ('oc logs -f pod-1', False),
+    ('ceph health', False),
+])
+def test_is_api_command(cmd, expected):
+    assert rate_limiter.is_api_command(cmd.split()) is expected
+
+
+def test_is_throttled():
+    assert rate_limiter.is_throttled(
+        'Error from server (TooManyRequests): the server has received too '
+        'many requests and has asked us to try again later (get pods)'
+    )
+    assert not rate_limiter.is_throttled('Error from server (NotFound)')
+
+
+def test_token_bucket_rate():
+    limiter = rate_limiter.RateLimiter(qps=20, burst=5)
+    start = time.monotonic()
+    for _ in range(15):
+        with limiter.limit():
+            pass
+    # 5 requests from the burst, 10 over the rate of 20 per second
+    assert 0.4 <= time.monotonic() - start < 1
+
+
+def test_max_in_flight():
+    limiter = rate_limiter.RateLimiter(max_in_flight=2)
+    max_seen = []
+
+    def request():
+        with limiter.limit():
+            max_seen.append(limiter.in_flight)
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(max_seen) == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.parametrize('cmd, expected', [
+    ('oc -n openshift-storage delete pod pod-1', True),
+    ('oc delete pod pod-1 --wait=false', False),
+    ('oc get pods -w', True),
+    ('oc get pods --watch=true', True),
+    ('oc get pods', False),
+    ('oc rollout status dc/app', True),
+    ('oc rollout latest dc/app', False),
+])
+def test_is_blocking_command(cmd, expected):
+    assert rate_limiter.is_blocking_command(cmd.split()) is expected
+
+
+def test_blocking_commands_dont_hold_slots():
+    limiter = rate_limiter.RateLimiter(max_in_flight=1)
+    limiter.acquire(in_flight=False)
+    # the blocking command doesn't take the only slot
+    limiter.acquire()
+    assert limiter.in_flight == 1
+    limiter.release()
+    limiter.release(in_flight=False)
+    assert limiter.in_flight == 0
@@ -0,0 +1,88 @@
+import itertools
+import threading
+import time
+
+from ocs_ci.utility.resource_pool import ResourcePool
+
+
+class FakeResources(object):
+    """
+    Provisions numbered resources slowly, the recycle fails for the
+    resources marked as broken
+    """
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.counter = itertools.count()
+        self.destroyed = []
+        self.recycled = []
+        self.lock = threading.Lock()
+
+    def create(self):
+        time.sleep(self.delay)
+        return {'id': next(self.counter), 'broken': False}
+
+    def recycle(self, resource):
+        if resource['broken']:
+            raise ValueError('broken')
+        self.recycled.append(resource['id'])
+        return resource
+
+    def destroy(self, resources):
+        with self.lock:
+            self.destroyed.extend(resource['id'] for resource in resources)
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_pool_checkout_and_recycle():
+    fake = FakeResources()
+    pool = ResourcePool(
+        fake.create, fake.recycle, fake.destroy, size=2, max_size=3
+    )
+    # nothing provisioned yet and no waiting
+    assert pool.checkout() is None
+    assert pool.stats['misses'] == 1
+    wait_for(lambda: pool.ready == 2)
+
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first and second
+    # the cap allows only one more resource while two are checked out
+    wait_for(lambda: pool.ready == 1)
+    assert pool.total == 3
+    time.sleep(fake.delay * 2)
+    assert pool.total == 3
+
+    pool.checkin(first)
+    second['broken'] = True
+    pool.checkin(second)
+    wait_for(lambda: pool.ready == 2 and pool.total == 2)
+    assert fake.recycled == [first['id']]
+    assert second['id'] in fake.destroyed
+    assert pool.stats['hits'] == 2
+
+    pool.close()
+    # every provisioned resource is deleted
+    assert sorted(fake.destroyed) == list(range(pool.stats['created']))
+    assert pool.total == 0
+    assert pool.checkout() is None
+
+
+def test_pool_checkout_waits_for_provisioning():
+    fake = FakeResources(delay=0.2)
+    pool = ResourcePool(fake.create, destroy=fake.destroy, size=1)
+    pool.fill()
+    start = time.time()
+    resource = pool.checkout(timeout=1)
+    assert resource is not None
+    assert time.time() - start < 1
+    pool.discard(resource)
+    pool.close()
+    assert resource['id'] in fake.destroyed
+    assert pool.stats['created'] == pool.stats['destroyed']
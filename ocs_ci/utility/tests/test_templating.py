@@ -0,0 +1,62 @@
+import logging
+import os
+import time
+
+import pytest
+
+from ocs_ci.ocs import constants
+from ocs_ci.utility import templating
+
+log = logging.getLogger(__name__)
+
+
+def test_load_yaml_cached_copies():
+    first = templating.load_yaml(constants.CSI_PVC_YAML)
+    first['metadata']['name'] = 'changed'
+    first['spec']['accessModes'].append('changed')
+    second = templating.load_yaml(constants.CSI_PVC_YAML)
+    assert second['metadata']['name'] != 'changed'
+    assert 'changed' not in second['spec']['accessModes']
+
+
+def test_load_yaml_reloads_changed_file(tmpdir):
+    path = tmpdir.join('template.yaml')
+    path.write('kind: Pod\n')
+    assert templating.load_yaml(str(path)) == {'kind': 'Pod'}
+    path.write('kind: PersistentVolumeClaim\n---\nkind: Pod\n')
+    # make sure the modification time differs on coarse grained filesystems
+    os.utime(str(path), ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    documents = templating.load_yaml(str(path), multi_document=True)
+    assert list(documents) == [
+        {'kind': 'PersistentVolumeClaim'}, {'kind': 'Pod'},
+    ]
+
+
+def test_jinja_env_reused(tmpdir):
+    tmpdir.join('template.yaml.j2').write('name: {{ name }}\n')
+    assert templating.generate_yaml_from_jinja2_template_with_data(
+        str(tmpdir.join('template.yaml.j2')), name='pvc-1'
+    ) == {'name': 'pvc-1'}
+    env = templating.get_jinja_env(str(tmpdir))
+    assert templating.get_jinja_env(str(tmpdir)) is env
+    assert templating.Templating(str(tmpdir)).render_template(
+        'template.yaml.j2', {'name': 'pvc-2'}
+    ) == 'name: pvc-2'
+
+
+@pytest.mark.benchmark
+def test_benchmark_10k_pvc_manifests():
+    from tests.helpers import get_pvc_data
+
+    def generate(clear_cache):
+        start = time.perf_counter()
+        for _ in range(10000):
+            if clear_cache:
+                templating.clear_template_cache()
+            get_pvc_data('sc', namespace='ns', size='1Gi')
+        return time.perf_counter() - start
+
+    uncached = generate(clear_cache=True)
+    cached = generate(clear_cache=False)
+    log.info(f"10k PVC manifests: {uncached:.3f}s uncached, {cached:.3f}s cached")
+    assert cached < uncached
@@ -0,0 +1,82 @@
+import os
+import tarfile
+import time
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.async_ocp import run_coroutines
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.utils import (
+    run_cmd, run_cmd_async, run_cmd_pipe, run_cmd_spooled, run_cmd_stream,
+)
+
+
+def test_run_cmd_async():
+    assert run_coroutines([run_cmd_async('echo hello')]) == ['hello\n']
+    with pytest.raises(CommandFailed):
+        run_coroutines([run_cmd_async('false')])
+
+
+def test_run_cmd_input():
+    assert run_cmd('cat', input=b'manifest') == 'manifest'
+    assert run_coroutines([run_cmd_async('cat', input=b'data')]) == ['data']
+
+
+def test_run_cmd_async_concurrency(monkeypatch):
+    monkeypatch.setitem(config.RUN, 'async_max_concurrency', 2)
+    start = time.time()
+    run_coroutines(run_cmd_async('sleep 0.3') for _ in range(4))
+    duration = time.time() - start
+    assert 0.6 <= duration < 1.2
+
+
+def test_run_cmd_stream():
+    lines = run_cmd_stream(r"printf 'a secret\nb\n'", secrets=['secret'])
+    assert list(lines) == ['a *****\n', 'b\n']
+    with pytest.raises(CommandFailed):
+        list(run_cmd_stream('false'))
+
+
+def test_run_cmd_stream_stops_command():
+    start = time.time()
+    # endless output, only the first lines are read
+    lines = run_cmd_stream('yes')
+    assert [next(lines) for _ in range(3)] == ['y\n'] * 3
+    lines.close()
+    assert time.time() - start < 5
+
+
+def test_run_cmd_spooled():
+    with run_cmd_spooled('seq 1 20000', max_size=1024) as spool:
+        assert spool._rolled
+        assert spool.readline() == '1\n'
+        assert sum(1 for _ in spool) == 19999
+
+
+def test_run_cmd_pipe(tmpdir):
+    source = tmpdir.mkdir('source')
+    source.join('data').write('x' * 100000)
+    target = tmpdir.mkdir('target')
+    with run_cmd_pipe(f"tar xzf - -C {target}", mode='w') as pipe:
+        with tarfile.open(fileobj=pipe, mode='w|gz') as tar:
+            tar.add(str(source), arcname='source')
+    assert 0 < pipe.bytes < 100000
+    assert target.join('source', 'data').read() == 'x' * 100000
+
+    download = tmpdir.mkdir('download')
+    with run_cmd_pipe(f"tar cf - -C {target} source", mode='r') as pipe:
+        with tarfile.open(fileobj=pipe, mode='r|') as tar:
+            tar.extractall(str(download))
+    assert os.path.getsize(download.join('source', 'data')) == 100000
+
+
+def test_run_cmd_pipe_failure(tmpdir):
+    with pytest.raises(CommandFailed):
+        with run_cmd_pipe(f"tar cf - -C {tmpdir} missing", mode='r') as pipe:
+            with tarfile.open(fileobj=pipe, mode='r|') as tar:
+                tar.extractall(str(tmpdir))
+    with pytest.raises(CommandFailed):
+        with run_cmd_pipe('false', mode='w') as pipe:
+            time.sleep(0.2)
+            pipe.write(b'x' * 1000000)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -6,7 +7,11 @@ import random
 import shlex
 import string
 import subprocess
+import tempfile
+import threading
 import time
+import weakref
+from contextlib import contextmanager
 from copy import deepcopy
 from shutil import which
 
@@ -24,6 +29,8 @@ from ocs_ci.framework import config
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from ocs_ci.ocs import constants
+from ocs_ci.utility import command_stats, memoization, rate_limiter
+from ocs_ci.utility.backoff import AttemptStats, BackoffPolicy
 from ocs_ci.utility.retry import retry
 from bs4 import BeautifulSoup
 from paramiko import SSHClient, AutoAddPolicy
@@ -389,27 +396,401 @@ def run_cmd(cmd, secrets=None, **kwargs):
     Returns:
         (str) Decoded stdout of command
 
+    """
+    return exec_cmd(cmd, secrets=secrets, **kwargs).stdout
+
+
+def exec_cmd(cmd, secrets=None, ignore_error=False, **kwargs):
+    """
+    Run an arbitrary command locally, the variant of run_cmd() for callers
+    which need the error output or the exit code of the command
+
+    Args:
+        cmd (str): command to run
+        secrets (list): A list of secrets to be masked with asterisks
+        ignore_error (bool): True to return the result of the failed command
+            instead of raising CommandFailed
+
+    Raises:
+        CommandFailed: In case the command execution fails and ignore_error
+            is False
+
+    Returns:
+        subprocess.CompletedProcess: The result of the command with decoded
+            and masked stdout and stderr
+
     """
     masked_cmd = mask_secrets(cmd, secrets)
     log.info(f"Executing command: {masked_cmd}")
     if isinstance(cmd, str):
         cmd = shlex.split(cmd)
-    r = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        stdin=subprocess.PIPE,
-        **kwargs
+    # Requests to the API server are rate limited and retried when throttled
+    limiter = None
+    retries = 0
+    in_flight = True
+    if rate_limiter.is_api_command(cmd):
+        limiter = rate_limiter.get_limiter()
+        retries = rate_limiter.get_throttle_retries()
+        in_flight = not rate_limiter.is_blocking_command(cmd)
+    # stdin is set up by subprocess.run() when the input is piped
+    stdin_kwargs = {} if 'input' in kwargs else {'stdin': subprocess.PIPE}
+    start_time = time.time()
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.acquire(in_flight)
+        try:
+            r = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **stdin_kwargs,
+                **kwargs
+            )
+        finally:
+            if limiter:
+                limiter.release(in_flight)
+        if not (
+            r.returncode and attempt < retries
+            and rate_limiter.is_throttled(r.stderr.decode())
+        ):
+            break
+        limiter.pause(2 ** attempt)
+    command_stats.record(
+        cmd, masked_cmd, time.time() - start_time, r.returncode,
+        len(r.stdout), len(r.stderr)
     )
     log.debug(f"Command output: {r.stdout.decode()}")
     if r.stderr and not r.returncode:
         log.warning(f"Command warning: {mask_secrets(r.stderr.decode(), secrets)}")
-    if r.returncode:
+    r.stdout = mask_secrets(r.stdout.decode(), secrets)
+    r.stderr = mask_secrets(r.stderr.decode(), secrets)
+    if r.returncode and not ignore_error:
+        raise CommandFailed(
+            f"Error during execution of command: {masked_cmd}."
+            f"\nError is {r.stderr}"
+        )
+    return r
+
+
+def run_cmd_stream(cmd, secrets=None, timeout=None, **kwargs):
+    """
+    Run an arbitrary command locally and yield its output line by line,
+    streaming variant of run_cmd() for commands with large output (e.g. 'oc
+    logs') which is never held in memory as a whole. Secrets are masked in
+    each line. When the consumer stops iterating, the command is killed.
+
+    Args:
+        cmd (str): command to run
+        secrets (list): A list of secrets to be masked with asterisks
+        timeout (int): Time in seconds after which the command is killed
+
+    Raises:
+        CommandFailed: In case the command execution fails
+        TimeoutExpired: In case the command was killed after timeout
+
+    Yields:
+        str: Decoded lines of stdout (including the line ending)
+
+    """
+    masked_cmd = mask_secrets(cmd, secrets)
+    log.info(f"Executing command (streaming output): {masked_cmd}")
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+    start_time = time.time()
+    stdout_bytes = 0
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            stdin=subprocess.DEVNULL,
+            **kwargs
+        )
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            for line in proc.stdout:
+                stdout_bytes += len(line)
+                yield mask_secrets(line.decode(errors='replace'), secrets)
+            proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            command_stats.record(
+                cmd, masked_cmd, time.time() - start_time, proc.returncode,
+                stdout_bytes, stderr.tell()
+            )
+        log.debug(f"Command output: {stdout_bytes} bytes streamed")
+        stderr.seek(0)
+        error = mask_secrets(stderr.read().decode(errors='replace'), secrets)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(masked_cmd, timeout)
+    if error and not proc.returncode:
+        log.warning(f"Command warning: {error}")
+    if proc.returncode:
+        raise CommandFailed(
+            f"Error during execution of command: {masked_cmd}."
+            f"\nError is {error}"
+        )
+
+
+def run_cmd_spooled(cmd, secrets=None, max_size=None, **kwargs):
+    """
+    Run an arbitrary command locally and return its output in a spooled
+    file, which is kept in memory up to max_size and moved to disk when the
+    output is bigger
+
+    Args:
+        cmd (str): command to run
+        secrets (list): A list of secrets to be masked with asterisks
+        max_size (int): Max size of the output kept in memory in bytes
+            (default: config.RUN['spool_max_size'])
+
+    Raises:
+        CommandFailed: In case the command execution fails
+
+    Returns:
+        tempfile.SpooledTemporaryFile: The masked output of the command, read
+            from the beginning, it's up to the caller to close it
+
+    """
+    max_size = max_size or config.RUN.get('spool_max_size', 8 * 1024 * 1024)
+    spool = tempfile.SpooledTemporaryFile(max_size=max_size, mode='w+')
+    try:
+        for line in run_cmd_stream(cmd, secrets=secrets, **kwargs):
+            spool.write(line)
+    except Exception:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+class _CountingPipe(object):
+    """
+    Binary pipe of the command counting the transferred bytes
+    """
+
+    def __init__(self, pipe):
+        self.pipe = pipe
+        self.bytes = 0
+
+    def read(self, size=-1):
+        data = self.pipe.read(size)
+        self.bytes += len(data)
+        return data
+
+    def write(self, data):
+        self.bytes += len(data)
+        return self.pipe.write(data)
+
+    def flush(self):
+        self.pipe.flush()
+
+
+@contextmanager
+def run_cmd_pipe(cmd, mode='r', secrets=None, timeout=None, **kwargs):
+    """
+    Run an arbitrary command locally and stream binary data to its stdin or
+    from its stdout, e.g. a tar archive over 'oc exec -i', without staging
+    the data in memory or temporary files. The throughput is logged when
+    the command finishes.
+
+    Args:
+        cmd (str): command to run
+        mode (str): 'r' for reading stdout of the command, 'w' for writing
+            to its stdin
+        secrets (list): A list of secrets to be masked with asterisks
+        timeout (int): Time in seconds after which the command is killed
+
+    Raises:
+        CommandFailed: In case the command execution fails
+        TimeoutExpired: In case the command was killed after timeout
+
+    Yields:
+        file-like object: Binary pipe with read() or write() method, the
+            number of transferred bytes is in its 'bytes' attribute
+
+    """
+    if mode not in ('r', 'w'):
+        raise ValueError(f"Unknown mode of the command pipe: {mode}")
+    masked_cmd = mask_secrets(cmd, secrets)
+    log.info(f"Executing command (streaming {mode}): {masked_cmd}")
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+    start_time = time.time()
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if mode == 'w' else subprocess.DEVNULL,
+            stdout=subprocess.PIPE if mode == 'r' else subprocess.DEVNULL,
+            stderr=stderr,
+            **kwargs
+        )
+        pipe = _CountingPipe(proc.stdin if mode == 'w' else proc.stdout)
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+        if timer:
+            timer.start()
+        body_error = None
+        killed = False
+        try:
+            yield pipe
+        except Exception as ex:
+            # e.g. broken pipe or truncated data when the command failed,
+            # which is reported with the error output of the command
+            body_error = ex
+        finally:
+            try:
+                pipe.pipe.close()
+            except OSError:
+                pass
+            try:
+                proc.wait(timeout=None if body_error is None else 5)
+            except subprocess.TimeoutExpired:
+                killed = True
+                proc.kill()
+                proc.wait()
+            if timer:
+                timer.cancel()
+            duration = time.time() - start_time
+            command_stats.record(
+                cmd, masked_cmd, duration, proc.returncode,
+                pipe.bytes if mode == 'r' else 0, stderr.tell()
+            )
+        stderr.seek(0)
+        error = mask_secrets(stderr.read().decode(errors='replace'), secrets)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(masked_cmd, timeout)
+    if proc.returncode and not killed:
         raise CommandFailed(
             f"Error during execution of command: {masked_cmd}."
-            f"\nError is {mask_secrets(r.stderr.decode(), secrets)}"
+            f"\nError is {error}"
+        ) from body_error
+    if body_error is not None:
+        raise body_error
+    if error:
+        log.warning(f"Command warning: {error}")
+    log.info(
+        f"Transferred {pipe.bytes / 2 ** 20:.1f} MiB in {duration:.1f}s "
+        f"({pipe.bytes / 2 ** 20 / max(duration, 1e-6):.1f} MiB/s)"
+    )
+
+
+# Semaphores limiting the number of concurrent run_cmd_async() commands per
+# event loop
+_async_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_async_semaphore():
+    """
+    Get the semaphore limiting the concurrent commands in the current event
+    loop, the limit is configured by config.RUN['async_max_concurrency']
+
+    Returns:
+        asyncio.Semaphore: The semaphore of the current event loop
+
+    """
+    loop = asyncio.get_event_loop()
+    if loop not in _async_semaphores:
+        _async_semaphores[loop] = asyncio.Semaphore(
+            config.RUN.get('async_max_concurrency', 64)
         )
-    return mask_secrets(r.stdout.decode(), secrets)
+    return _async_semaphores[loop]
+
+
+async def run_cmd_async(cmd, secrets=None, timeout=None, input=None, **kwargs):
+    """
+    Run an arbitrary command locally, asyncio variant of run_cmd()
+
+    The number of commands running concurrently in one event loop is limited
+    by config.RUN['async_max_concurrency'], commands over the limit wait
+    for a free slot, so thousands of them can be scheduled at once.
+
+    Args:
+        cmd (str): command to run
+        secrets (list): A list of secrets to be masked with asterisks
+        timeout (int): Time in seconds to wait for the command to finish
+        input (bytes): Data sent to stdin of the command
+
+    Raises:
+        CommandFailed: In case the command execution fails
+        TimeoutExpired: In case the command doesn't finish in timeout
+
+    Returns:
+        (str) Decoded stdout of command
+
+    """
+    masked_cmd = mask_secrets(cmd, secrets)
+    if isinstance(cmd, str):
+        cmd = shlex.split(cmd)
+    limiter = None
+    retries = 0
+    in_flight = True
+    if rate_limiter.is_api_command(cmd):
+        limiter = rate_limiter.get_limiter()
+        retries = rate_limiter.get_throttle_retries()
+        in_flight = not rate_limiter.is_blocking_command(cmd)
+    async with _get_async_semaphore():
+        log.info(f"Executing command: {masked_cmd}")
+        start_time = time.time()
+        for attempt in range(retries + 1):
+            if limiter:
+                await limiter.acquire_async(in_flight)
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    stdin=subprocess.PIPE,
+                    **kwargs
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(
+                        proc.communicate(input), timeout
+                    )
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise subprocess.TimeoutExpired(masked_cmd, timeout)
+            finally:
+                if limiter:
+                    limiter.release(in_flight)
+            if not (
+                proc.returncode and attempt < retries
+                and rate_limiter.is_throttled(stderr.decode())
+            ):
+                break
+            limiter.pause(2 ** attempt)
+        command_stats.record(
+            cmd, masked_cmd, time.time() - start_time, proc.returncode,
+            len(stdout), len(stderr)
+        )
+    log.debug(f"Command output: {stdout.decode()}")
+    if stderr and not proc.returncode:
+        log.warning(f"Command warning: {mask_secrets(stderr.decode(), secrets)}")
+    if proc.returncode:
+        raise CommandFailed(
+            f"Error during execution of command: {masked_cmd}."
+            f"\nError is {mask_secrets(stderr.decode(), secrets)}"
+        )
+    return mask_secrets(stdout.decode(), secrets)
 
 
 def run_mcg_cmd(cmd, namespace=None):
@@ -678,7 +1059,10 @@ class TimeoutSampler(object):
 
     This is a generator object that at first yields the output of function
     `func`. After the yield, it either raises instance of `timeout_exc_cls` or
-    sleeps `sleep` seconds.
+    sleeps according to the backoff `policy` (by default `sleep` seconds with
+    jitter, longer after consecutive errors of `func` when the policy has
+    error_backoff), but never past the
+    timeout, so the last sample is taken right at the timeout.
 
     Yielding the output allows you to handle every value as you wish.
 
@@ -708,19 +1092,51 @@ class TimeoutSampler(object):
         self.timeout_exc_args = (self.timeout,)
         ''' An args for __init__ of the timeout exception. '''
 
+        self.policy = None
+        ''' BackoffPolicy computing the sleep between the samples, by
+        default the sleep interval with jitter and error backoff. '''
+        self.fast_probe = None
+        ''' Sleep seconds before the second sample, e.g. 0.5 for resources
+        which are usually ready right after the first sample. '''
+        self.stats = AttemptStats()
+        ''' Timing and error statistics of the samples. '''
+
     def __iter__(self):
         if self.start_time is None:
             self.start_time = time.time()
+        deadline = self.start_time + self.timeout
+        policy = self.policy or BackoffPolicy(self.sleep)
+        func_name = getattr(self.func, '__name__', repr(self.func))
+        attempt = 0
         while True:
             self.last_sample_time = time.time()
+            error = None
             try:
-                yield self.func(*self.func_args, **self.func_kwargs)
-            except Exception:
-                pass
-
-            if self.timeout < (time.time() - self.start_time):
+                value = self.func(*self.func_args, **self.func_kwargs)
+            except Exception as ex:
+                error = ex
+                log.debug(f"Sampling of {func_name} failed: {ex}")
+            self.stats.record(time.time() - self.last_sample_time, error)
+            if error is None:
+                yield value
+
+            if time.time() >= deadline:
+                if self.stats.last_error is not None:
+                    log.warning(
+                        f"Sampling of {func_name} timed out "
+                        f"({self.stats}), last error: {self.stats.last_error}"
+                    )
                 raise self.timeout_exc_cls(*self.timeout_exc_args)
-            time.sleep(self.sleep)
+            if attempt == 0 and self.fast_probe is not None:
+                delay = self.fast_probe
+            else:
+                delay = policy.get_delay(
+                    attempt, self.stats.consecutive_errors
+                )
+            delay = policy.clamp(delay, deadline)
+            self.stats.record_sleep(delay)
+            time.sleep(delay)
+            attempt += 1
 
     def wait_for_func_status(self, result):
         """
@@ -744,8 +1160,9 @@ class TimeoutSampler(object):
                     return True
 
         except self.timeout_exc_cls:
+            func_name = getattr(self.func, '__name__', repr(self.func))
             log.error(
-                f"({self.func.__name__}) return incorrect status after timeout"
+                f"({func_name}) return incorrect status after timeout"
             )
             return False
 
@@ -892,6 +1309,7 @@ def email_reports():
         log.exception(e)
 
 
+@memoization.memoize(group=memoization.VERSIONS, persist=True)
 def get_cluster_version_info():
     """
     Gets the complete cluster version information
@@ -929,6 +1347,7 @@ def get_cluster_image():
     return get_cluster_version_info()["status"]["desired"]["image"]
 
 
+@memoization.memoize(group=memoization.VERSIONS, persist=True)
 def get_ceph_version():
     """
     Gets the ceph version
@@ -944,6 +1363,7 @@ def get_ceph_version():
     return re.split(r'ceph version ', ceph_version['version'])[1]
 
 
+@memoization.memoize(group=memoization.VERSIONS, persist=True)
 def get_rook_version():
     """
     Gets the rook version
@@ -959,6 +1379,7 @@ def get_rook_version():
     return rook_versions['rook']
 
 
+@memoization.memoize(group=memoization.VERSIONS, persist=True)
 def get_csi_versions():
     """
     Gets the CSI related version information
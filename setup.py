@@ -16,7 +16,6 @@ setup(
     install_requires=[
         'apache-libcloud',
         'docopt==0.6.2',
-        'gevent==1.4.0',
         'reportportal-client @ git+https://github.com/reportportal/client-Python.git@master',
         'requests==2.21.0',
         'paramiko==2.4.2',
@@ -5,12 +5,14 @@ import pytest
 import threading
 from datetime import datetime
 import random
+from functools import partial
 from math import floor
 
 from ocs_ci.utility.utils import TimeoutSampler, get_rook_repo
 from ocs_ci.ocs.exceptions import TimeoutExpiredError
 from ocs_ci.utility.spreadsheet.spreadsheet_api import GoogleSpreadSheetAPI
 from ocs_ci.utility import aws
+from ocs_ci.utility.resource_pool import ResourcePool
 from ocs_ci.framework import config
 from ocs_ci.framework.pytest_customization.marks import (
     deployment, destroy, ignore_leftovers
@@ -24,7 +26,7 @@ from ocs_ci.utility.utils import (
 from ocs_ci.deployment import factory as dep_factory
 from tests import helpers
 from ocs_ci.ocs import constants, ocp, defaults, node, platform_nodes
-from ocs_ci.ocs.resources.ocs import OCS
+from ocs_ci.ocs.resources.ocs import OCS, delete_many
 from ocs_ci.ocs.resources.pvc import PVC
 
 
@@ -53,6 +55,11 @@ def secret_factory_class(request):
     return secret_factory_fixture(request)
 
 
+@pytest.fixture(scope='session')
+def secret_factory_session(request):
+    return secret_factory_fixture(request)
+
+
 @pytest.fixture(scope='function')
 def secret_factory(request):
     return secret_factory_fixture(request)
@@ -98,6 +105,11 @@ def ceph_pool_factory_class(request):
     return ceph_pool_factory_fixture(request)
 
 
+@pytest.fixture(scope='session')
+def ceph_pool_factory_session(request):
+    return ceph_pool_factory_fixture(request)
+
+
 @pytest.fixture(scope='function')
 def ceph_pool_factory(request):
     return ceph_pool_factory_fixture(request)
@@ -151,6 +163,19 @@ def storageclass_factory_class(
     )
 
 
+@pytest.fixture(scope='session')
+def storageclass_factory_session(
+    request,
+    ceph_pool_factory_session,
+    secret_factory_session
+):
+    return storageclass_factory_fixture(
+        request,
+        ceph_pool_factory_session,
+        secret_factory_session
+    )
+
+
 @pytest.fixture(scope='function')
 def storageclass_factory(
     request,
@@ -240,6 +265,11 @@ def project_factory_class(request):
     return project_factory_fixture(request)
 
 
+@pytest.fixture(scope='session')
+def project_factory_session(request):
+    return project_factory_fixture(request)
+
+
 @pytest.fixture()
 def project_factory(request):
     return project_factory_fixture(request)
@@ -392,43 +422,83 @@ def pvc_factory_fixture(
         """
         Delete the PVC
         """
-        pv_objs = []
-
         # Get PV form PVC instances and delete PVCs
-        for instance in instances:
-            if not instance.is_deleted:
-                pv_objs.append(instance.backed_pv_obj)
-                instance.delete()
-                instance.ocp.wait_for_delete(
-                    instance.name
-                )
+        pv_names = [
+            instance.backed_pv_obj.name for instance in instances
+            if not instance.is_deleted
+        ]
+        delete_many(instances)
 
         # Wait for PVs to delete
-        for pv_obj in pv_objs:
-            pv_obj.ocp.wait_for_delete(
-                resource_name=pv_obj.name, timeout=180
-            )
+        ocp.OCP(kind=constants.PV).wait_for_delete_many(
+            pv_names, timeout=180
+        )
 
     request.addfinalizer(finalizer)
     return factory
 
 
+@pytest.fixture(scope='session')
+def warm_pool(request, storageclass_factory_session, project_factory_session):
+    """
+    Warm pool of pod_factory, enabled by config.RUN['warm_pool_size'].
+    Running pods with a Bound PVC are provisioned in the background in one
+    project for every interface, pod_factory checks a pod out instead of
+    creating a new one and the pod is returned to the pool (its volume is
+    wiped) when the test is done.
+
+    Returns:
+        dict: interface -> ResourcePool, None when the pool is disabled
+    """
+    size = config.RUN.get('warm_pool_size', 0)
+    if not size:
+        return None
+    project = project_factory_session()
+    pools = dict()
+    for interface in (constants.CEPHBLOCKPOOL, constants.CEPHFILESYSTEM):
+        pools[interface] = ResourcePool(
+            partial(
+                helpers.create_warm_pod, storageclass_factory_session(interface),
+                project.namespace, interface
+            ),
+            recycle=helpers.recycle_warm_pod,
+            destroy=helpers.delete_warm_pods,
+            size=size,
+            max_size=config.RUN.get('warm_pool_max_size', 10),
+            name=f"{interface} warm pool"
+        )
+        pools[interface].fill()
+
+    def finalizer():
+        """
+        Delete the pods and PVCs of the pools
+        """
+        for pool in pools.values():
+            pool.close()
+
+    request.addfinalizer(finalizer)
+    return pools
+
+
 @pytest.fixture(scope='class')
-def pod_factory_class(request, pvc_factory_class):
-    return pod_factory_fixture(request, pvc_factory_class)
+def pod_factory_class(request, pvc_factory_class, warm_pool):
+    return pod_factory_fixture(request, pvc_factory_class, warm_pool)
 
 
 @pytest.fixture(scope='function')
-def pod_factory(request, pvc_factory):
-    return pod_factory_fixture(request, pvc_factory)
+def pod_factory(request, pvc_factory, warm_pool):
+    return pod_factory_fixture(request, pvc_factory, warm_pool)
 
 
-def pod_factory_fixture(request, pvc_factory):
+def pod_factory_fixture(request, pvc_factory, warm_pool=None):
     """
     Create a Pod factory. Calling this fixture creates new Pod.
     For custom Pods provide 'pvc' parameter.
+    Pods without custom 'pvc' and 'custom_data' are checked out from the
+    warm pool when it's enabled, see warm_pool.
     """
     instances = []
+    checked_out = []
 
     def factory(
         interface=constants.CEPHBLOCKPOOL,
@@ -451,6 +521,17 @@ def pod_factory_fixture(request, pvc_factory):
         Returns:
             object: helpers.create_pvc instance.
         """
+        pool = warm_pool.get(interface) if warm_pool else None
+        if pool and not (pvc or custom_data) and (
+            status == constants.STATUS_RUNNING
+        ):
+            pod_obj = pool.checkout(
+                timeout=config.RUN.get('warm_pool_checkout_timeout', 0)
+            )
+            if pod_obj:
+                log.info(f"Using pod {pod_obj.name} of the {pool.name}")
+                checked_out.append((pool, pod_obj))
+                return pod_obj
         if custom_data:
             pod_obj = helpers.create_resource(**custom_data)
         else:
@@ -474,11 +555,9 @@ def pod_factory_fixture(request, pvc_factory):
         """
         Delete the Pod
         """
-        for instance in instances:
-            instance.delete()
-            instance.ocp.wait_for_delete(
-                instance.name
-            )
+        delete_many(instances)
+        for pool, pod_obj in checked_out:
+            pool.checkin(pod_obj)
 
     request.addfinalizer(finalizer)
     return factory
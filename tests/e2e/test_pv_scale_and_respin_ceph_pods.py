@@ -33,36 +33,15 @@ class BasePvcCreateRespinCephPods(E2ETest):
             size (str): size of each pvc to be created eg: '10Gi'
         """
         log.info(f"Create {number_of_pvc} pvcs and pods")
-        cephfs_pvcs = helpers.create_multiple_pvc_parallel(
-            cephfs_sc_obj, self.namespace, number_of_pvc, size,
-            access_modes=[constants.ACCESS_MODE_RWO, constants.ACCESS_MODE_RWX]
-        )
-        rbd_pvcs = helpers.create_multiple_pvc_parallel(
-            rbd_sc_obj, self.namespace, number_of_pvc, size,
-            access_modes=[constants.ACCESS_MODE_RWO, constants.ACCESS_MODE_RWX]
+        # Every PVC gets its pod as soon as it's Bound, no barrier between
+        # the PVC and pod creation of all of them
+        pvc_objs, temp_pod_objs, rbd_rwx_pods = (
+            helpers.create_scale_pvcs_and_pods(
+                rbd_sc_obj, cephfs_sc_obj, self.namespace, number_of_pvc, size
+            )
         )
         # Appending all the pvc obj to base case param for cleanup and evaluation
-        self.all_pvc_obj.extend(cephfs_pvcs + rbd_pvcs)
-
-        # Create pods with above pvc list
-        cephfs_pods = helpers.create_pods_parallel(
-            cephfs_pvcs, self.namespace, constants.CEPHFS_INTERFACE
-        )
-        rbd_rwo_pvc, rbd_rwx_pvc = ([] for i in range(2))
-        for pvc_obj in rbd_pvcs:
-            if pvc_obj.get_pvc_access_mode == constants.ACCESS_MODE_RWX:
-                rbd_rwx_pvc.append(pvc_obj)
-            else:
-                rbd_rwo_pvc.append(pvc_obj)
-        rbd_rwo_pods = helpers.create_pods_parallel(
-            rbd_rwo_pvc, self.namespace, constants.CEPHBLOCKPOOL
-        )
-        rbd_rwx_pods = helpers.create_pods_parallel(
-            rbd_rwx_pvc, self.namespace, constants.CEPHBLOCKPOOL,
-            raw_block_pv=True
-        )
-        temp_pod_objs = list()
-        temp_pod_objs.extend(cephfs_pods + rbd_rwo_pods)
+        self.all_pvc_obj.extend(pvc_objs)
         # Appending all the pod obj to base class param for cleanup and evaluation
         self.all_pod_obj.extend(temp_pod_objs + rbd_rwx_pods)
 
@@ -6,12 +6,12 @@ import pytest
 import math
 import ocs_ci.ocs.exceptions as ex
 import ocs_ci.ocs.resources.pvc as pvc
-from concurrent.futures import ThreadPoolExecutor
 from ocs_ci.framework.testlib import (
     performance, E2ETest, polarion_id, bugzilla
 )
 from tests import helpers
 from ocs_ci.ocs import defaults, constants
+from ocs_ci.ocs.resources.ocs import wait_for_all
 
 
 log = logging.getLogger(__name__)
@@ -83,14 +83,7 @@ class TestPVCCreationPerformance(E2ETest):
         )
         for pvc_obj in pvc_objs:
             teardown_factory(pvc_obj)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            for pvc_obj in pvc_objs:
-                executor.submit(
-                    helpers.wait_for_resource_state, pvc_obj,
-                    constants.STATUS_BOUND
-                )
-
-                executor.submit(pvc_obj.reload)
+        wait_for_all(pvc_objs, constants.STATUS_BOUND)
         start_time = helpers.get_start_creation_time(
             self.interface, pvc_objs[0].name
         )
@@ -130,14 +123,7 @@ class TestPVCCreationPerformance(E2ETest):
         )
         for pvc_obj in pvc_objs:
             teardown_factory(pvc_obj)
-        with ThreadPoolExecutor() as executor:
-            for pvc_obj in pvc_objs:
-                executor.submit(
-                    helpers.wait_for_resource_state, pvc_obj,
-                    constants.STATUS_BOUND
-                )
-
-                executor.submit(pvc_obj.reload)
+        wait_for_all(pvc_objs, constants.STATUS_BOUND)
         log.info('Deleting 75% of the PVCs - 90 PVCs')
         assert pvc.delete_pvcs(pvc_objs[:number_of_pvcs], True), (
             "Deletion of 75% of PVCs failed"
@@ -9,13 +9,16 @@ import os
 import time
 
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.framework import config
 
 from uuid import uuid4
 from ocs_ci.ocs.exceptions import TimeoutExpiredError, UnexpectedBehaviour
-from concurrent.futures import ThreadPoolExecutor
 from ocs_ci.ocs import constants, defaults, ocp
+from ocs_ci.ocs import ceph_tools
 from ocs_ci.utility import templating
-from ocs_ci.ocs.resources import pod, pvc
+from ocs_ci.utility.executor import Executor
+from ocs_ci.utility.pipeline import Pipeline, Stage
+from ocs_ci.ocs.resources import ocs, pod, pvc
 from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.ocs.exceptions import CommandFailed, ResourceWrongStatusException
 from ocs_ci.utility.retry import retry
@@ -117,6 +120,51 @@ def create_pod(
     Raises:
         AssertionError: In case of any failure
     """
+    pod_data = get_pod_data(
+        interface_type=interface_type, pvc_name=pvc_name,
+        namespace=namespace, node_name=node_name, pod_dict_path=pod_dict_path,
+        sa_name=sa_name, dc_deployment=dc_deployment,
+        raw_block_pv=raw_block_pv, raw_block_device=raw_block_device,
+        replica_count=replica_count
+    )
+    pod_name = pod_data['metadata']['name']
+    if dc_deployment:
+        ocs_obj = create_resource(**pod_data)
+        logger.info(ocs_obj.name)
+        assert (ocp.OCP(kind='pod', namespace=namespace)).wait_for_resource(
+            condition=constants.STATUS_COMPLETED,
+            resource_name=pod_name + '-1-deploy',
+            resource_count=0, timeout=180, sleep=3
+        )
+        dpod_list = pod.get_all_pods(namespace=namespace)
+        for dpod in dpod_list:
+            if '-1-deploy' not in dpod.name:
+                if pod_name in dpod.name:
+                    return dpod
+    else:
+        pod_obj = pod.Pod(**pod_data)
+        logger.info(f'Creating new Pod {pod_name} for test')
+        created_resource = pod_obj.create(do_reload=do_reload)
+        assert created_resource, (
+            f"Failed to create Pod {pod_name}"
+        )
+
+        return pod_obj
+
+
+def get_pod_data(
+    interface_type=None, pvc_name=None,
+    namespace=defaults.ROOK_CLUSTER_NAMESPACE, node_name=None,
+    pod_dict_path=None, sa_name=None, dc_deployment=False,
+    raw_block_pv=False, raw_block_device=constants.RAW_BLOCK_DEVICE,
+    replica_count=1
+):
+    """
+    Build the manifest of the pod with a unique name, see create_pod()
+
+    Returns:
+        dict: The pod (or deploymentconfig) data
+    """
     if interface_type == constants.CEPHBLOCKPOOL:
         pod_dict = pod_dict_path if pod_dict_path else constants.CSI_RBD_POD_YAML
         interface = constants.RBD_INTERFACE
@@ -156,29 +204,7 @@ def create_pod(
             del pod_data['spec']['nodeName']
     if sa_name and dc_deployment:
         pod_data['spec']['template']['spec']['serviceAccountName'] = sa_name
-    if dc_deployment:
-        ocs_obj = create_resource(**pod_data)
-        logger.info(ocs_obj.name)
-        assert (ocp.OCP(kind='pod', namespace=namespace)).wait_for_resource(
-            condition=constants.STATUS_COMPLETED,
-            resource_name=pod_name + '-1-deploy',
-            resource_count=0, timeout=180, sleep=3
-        )
-        dpod_list = pod.get_all_pods(namespace=namespace)
-        for dpod in dpod_list:
-            if '-1-deploy' not in dpod.name:
-                if pod_name in dpod.name:
-                    return dpod
-    else:
-        pod_obj = pod.Pod(**pod_data)
-        pod_name = pod_data.get('metadata').get('name')
-        logger.info(f'Creating new Pod {pod_name} for test')
-        created_resource = pod_obj.create(do_reload=do_reload)
-        assert created_resource, (
-            f"Failed to create Pod {pod_name}"
-        )
-
-        return pod_obj
+    return pod_data
 
 
 def create_project():
@@ -395,6 +421,26 @@ def create_pvc(
     Returns:
         PVC: PVC instance
     """
+    pvc_data = get_pvc_data(
+        sc_name, pvc_name=pvc_name, namespace=namespace, size=size,
+        access_mode=access_mode, volume_mode=volume_mode
+    )
+    ocs_obj = pvc.PVC(**pvc_data)
+    created_pvc = ocs_obj.create(do_reload=do_reload)
+    assert created_pvc, f"Failed to create resource {pvc_name}"
+    return ocs_obj
+
+
+def get_pvc_data(
+    sc_name, pvc_name=None, namespace=defaults.ROOK_CLUSTER_NAMESPACE,
+    size=None, access_mode=constants.ACCESS_MODE_RWO, volume_mode=None
+):
+    """
+    Build the manifest of the PVC, see create_pvc()
+
+    Returns:
+        dict: The PVC data
+    """
     pvc_data = templating.load_yaml(constants.CSI_PVC_YAML)
     pvc_data['metadata']['name'] = (
         pvc_name if pvc_name else create_unique_resource_name(
@@ -408,10 +454,35 @@ def create_pvc(
         pvc_data['spec']['resources']['requests']['storage'] = size
     if volume_mode:
         pvc_data['spec']['volumeMode'] = volume_mode
-    ocs_obj = pvc.PVC(**pvc_data)
-    created_pvc = ocs_obj.create(do_reload=do_reload)
-    assert created_pvc, f"Failed to create resource {pvc_name}"
-    return ocs_obj
+    return pvc_data
+
+
+def bulk_create_resources(kind, namespace, items, generate_name=None):
+    """
+    Create the resources of the same kind in a few round trips by
+    OCP.bulk_create(), the created resources are not reloaded
+
+    Args:
+        kind (str): The kind of the resources
+        namespace (str): The namespace for the resources creation
+        items (list): The resources (dicts) to create
+        generate_name (str): Prefix of the names generated by the API server
+
+    Returns:
+        list: The created resources (dicts), in the order of items
+
+    Raises:
+        AssertionError: In case any of the resources wasn't created
+    """
+    results = ocp.OCP(kind=kind, namespace=namespace).bulk_create(
+        items, generate_name=generate_name
+    )
+    errors = [result.error for result in results if result.error]
+    assert not errors, (
+        f"Failed to create {len(errors)} of {len(items)} {kind} resources:\n"
+        + "\n".join(errors)
+    )
+    return [result.data for result in results]
 
 
 def create_multiple_pvcs(
@@ -437,12 +508,19 @@ def create_multiple_pvcs(
         volume_mode = 'Block'
     else:
         volume_mode = None
-    return [
-        create_pvc(
-            sc_name=sc_name, size=size, namespace=namespace,
-            do_reload=do_reload, access_mode=access_mode, volume_mode=volume_mode
-        ) for _ in range(number_of_pvc)
-    ]
+    pvc_data = get_pvc_data(
+        sc_name, namespace=namespace, size=size, access_mode=access_mode,
+        volume_mode=volume_mode
+    )
+    created = bulk_create_resources(
+        constants.PVC, namespace, [pvc_data] * number_of_pvc,
+        generate_name='test-pvc-'
+    )
+    pvc_objs = [pvc.PVC(**data) for data in created]
+    if do_reload:
+        for pvc_obj in pvc_objs:
+            pvc_obj.reload()
+    return pvc_objs
 
 
 def verify_block_pool_exists(pool_name):
@@ -779,6 +857,9 @@ def get_start_creation_time(interface, pvc_name):
     Returns:
         datetime object: Start time of PVC creation
 
+    Raises:
+        UnexpectedBehaviour: In case the PVC isn't found in the logs
+
     """
     format = '%H:%M:%S.%f'
     # Get the correct provisioner pod based on the interface
@@ -787,14 +868,19 @@ def get_start_creation_time(interface, pvc_name):
     else:
         pod_name = pod.get_cephfs_provisioner_pod().name
 
-    # get the logs from the csi-provisioner container
-    logs = pod.get_pod_logs(pod_name, 'csi-provisioner')
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC provisioning
-    start = [
-        i for i in logs if re.search(f"provision.*{pvc_name}.*started", i)
-    ]
-    start = start[0].split(' ')[1]
+    # Extract the starting time for the PVC provisioning from the
+    # csi-provisioner container logs, the logs are streamed and only read up
+    # to the first match
+    start = next((
+        line for line in pod.iter_pod_logs(pod_name, 'csi-provisioner')
+        if re.search(f"provision.*{pvc_name}.*started", line)
+    ), None)
+    if start is None:
+        raise UnexpectedBehaviour(
+            f"Provisioning of PVC {pvc_name} started not found in the "
+            f"csi-provisioner logs of {pod_name}"
+        )
+    start = start.split(' ')[1]
     return datetime.datetime.strptime(start, format)
 
 
@@ -809,6 +895,9 @@ def get_end_creation_time(interface, pvc_name):
     Returns:
         datetime object: End time of PVC creation
 
+    Raises:
+        UnexpectedBehaviour: In case the PVC isn't found in the logs
+
     """
     format = '%H:%M:%S.%f'
     # Get the correct provisioner pod based on the interface
@@ -817,14 +906,19 @@ def get_end_creation_time(interface, pvc_name):
     else:
         pod_name = pod.get_cephfs_provisioner_pod().name
 
-    # get the logs from the csi-provisioner container
-    logs = pod.get_pod_logs(pod_name, 'csi-provisioner')
-    logs = logs.split("\n")
-    # Extract the starting time for the PVC provisioning
-    end = [
-        i for i in logs if re.search(f"provision.*{pvc_name}.*succeeded", i)
-    ]
-    end = end[0].split(' ')[1]
+    # Extract the ending time for the PVC provisioning from the
+    # csi-provisioner container logs, the logs are streamed and only read up
+    # to the first match
+    end = next((
+        line for line in pod.iter_pod_logs(pod_name, 'csi-provisioner')
+        if re.search(f"provision.*{pvc_name}.*succeeded", line)
+    ), None)
+    if end is None:
+        raise UnexpectedBehaviour(
+            f"Provisioning of PVC {pvc_name} succeeded not found in the "
+            f"csi-provisioner logs of {pod_name}"
+        )
+    end = end.split(' ')[1]
     return datetime.datetime.strptime(end, format)
 
 
@@ -916,7 +1010,6 @@ def verify_volume_deleted_in_backend(interface, image_uuid, pool_name=None):
     Returns:
         bool: True if volume is not present. False if volume is present
     """
-    ct_pod = pod.get_ceph_tools_pod()
     if interface == constants.CEPHBLOCKPOOL:
         valid_error = f"error opening image csi-vol-{image_uuid}"
         cmd = f"rbd info -p {pool_name} csi-vol-{image_uuid}"
@@ -928,7 +1021,7 @@ def verify_volume_deleted_in_backend(interface, image_uuid, pool_name=None):
         )
 
     try:
-        ct_pod.exec_ceph_cmd(ceph_cmd=cmd, format='json')
+        ceph_tools.CephToolsClient().run(cmd)
         return False
     except CommandFailed as ecf:
         assert valid_error in str(ecf), (
@@ -1173,25 +1266,17 @@ def create_multiple_pvc_parallel(
     Returns:
         pvc_objs_list (list): List of pvc objs created in function
     """
-    obj_status_list, result_lists = ([] for i in range(2))
-    with ThreadPoolExecutor() as executor:
+    with Executor(name='PVC creation') as executor:
         for mode in access_modes:
-            result_lists.append(
-                executor.submit(
-                    create_multiple_pvcs, sc_name=sc_obj.name,
-                    namespace=namespace, number_of_pvc=number_of_pvc,
-                    access_mode=mode, size=size)
+            executor.submit(
+                create_multiple_pvcs, sc_name=sc_obj.name,
+                namespace=namespace, number_of_pvc=number_of_pvc,
+                access_mode=mode, size=size
             )
-    result_list = [result.result() for result in result_lists]
+    result_list = executor.results()
     pvc_objs_list = converge_lists(result_list)
     # Check for all the pvcs in Bound state
-    with ThreadPoolExecutor() as executor:
-        for objs in pvc_objs_list:
-            obj_status_list.append(
-                executor.submit(wait_for_resource_state, objs, 'Bound')
-            )
-    if False in [obj.result() for obj in obj_status_list]:
-        raise TimeoutExpiredError
+    ocs.wait_for_all(pvc_objs_list, constants.STATUS_BOUND)
     return pvc_objs_list
 
 
@@ -1208,7 +1293,6 @@ def create_pods_parallel(pvc_list, namespace, interface, raw_block_pv=False):
     Returns:
         pod_objs (list): Returns list of pods created
     """
-    future_pod_objs = []
     # Added 300 sec wait time since in scale test once the setup has more
     # PODs time taken for the pod to be up will be based on resource available
     wait_time = 300
@@ -1216,30 +1300,237 @@ def create_pods_parallel(pvc_list, namespace, interface, raw_block_pv=False):
         pod_dict_path = constants.CSI_RBD_RAW_BLOCK_POD_YAML
     else:
         pod_dict_path = None
-    with ThreadPoolExecutor() as executor:
-        for pvc_obj in pvc_list:
-            future_pod_objs.append(executor.submit(
-                create_pod, interface_type=interface,
-                pvc_name=pvc_obj.name, do_reload=False, namespace=namespace,
-                raw_block_pv=raw_block_pv, pod_dict_path=pod_dict_path)
-            )
-    pod_objs = [pvc_obj.result() for pvc_obj in future_pod_objs]
+    pods_data = [
+        get_pod_data(
+            interface_type=interface, pvc_name=pvc_obj.name,
+            namespace=namespace, raw_block_pv=raw_block_pv,
+            pod_dict_path=pod_dict_path
+        ) for pvc_obj in pvc_list
+    ]
+    pod_objs = [
+        pod.Pod(**data) for data in bulk_create_resources(
+            constants.POD, namespace, pods_data
+        )
+    ]
     # Check for all the pods are in Running state
-    # In above pod creation not waiting for the pod to be created because of threads usage
-    with ThreadPoolExecutor() as executor:
-        for obj in pod_objs:
-            future_pod_objs.append(
-                executor.submit(wait_for_resource_state, obj, 'Running', timeout=wait_time)
-            )
-    # If pods not up raise exception/failure
-    if False in [obj.result() for obj in future_pod_objs]:
-        raise TimeoutExpiredError
+    # The pods are created in bulk without waiting for them to be up
+    ocs.wait_for_all(pod_objs, constants.STATUS_RUNNING, timeout=wait_time)
     return pod_objs
 
 
+def create_pvcs_and_pods_pipelined(
+    pvc_specs, namespace, size, create_concurrency=None,
+    wait_concurrency=None, pvc_timeout=60, pod_timeout=300
+):
+    """
+    Create PVCs and a pod on every PVC by the streaming pipeline
+    PVC created -> PVC Bound -> pod created -> pod Running, every PVC moves
+    to the next stage as soon as it's ready, so the slow PVCs don't hold
+    back the others. RBD RWX PVCs are created with the Block volume mode and
+    raw block pods.
+
+    Args:
+        pvc_specs (list): (storage class object, interface, access mode) of
+            every PVC
+        namespace (str): The namespace for creating the PVCs and pods
+        size (str): size of the pvc eg: '10Gi'
+        create_concurrency (int): Max number of PVCs or pods created at once
+            (default: config.RUN['pipeline_create_concurrency'])
+        wait_concurrency (int): Max number of PVCs or pods waited for at once
+            (default: config.RUN['pipeline_wait_concurrency'])
+        pvc_timeout (int): Time in seconds to wait for a PVC to be Bound
+        pod_timeout (int): Time in seconds to wait for a pod to be Running
+
+    Returns:
+        tuple: The PVC objects and the pod objects, in the order of pvc_specs
+
+    Raises:
+        AssertionError: In case any of the PVCs or pods failed
+    """
+    create_concurrency = create_concurrency or config.RUN.get(
+        'pipeline_create_concurrency', 10
+    )
+    wait_concurrency = wait_concurrency or config.RUN.get(
+        'pipeline_wait_concurrency', 50
+    )
+
+    def is_raw_block(interface, access_mode):
+        return (
+            interface == constants.CEPHBLOCKPOOL
+            and access_mode == constants.ACCESS_MODE_RWX
+        )
+
+    def new_pvc(spec):
+        sc_obj, interface, access_mode = spec
+        pvc_obj = create_pvc(
+            sc_name=sc_obj.name, namespace=namespace, size=size,
+            do_reload=False, access_mode=access_mode,
+            volume_mode=(
+                'Block' if is_raw_block(interface, access_mode) else None
+            )
+        )
+        return spec, pvc_obj
+
+    def pvc_bound(value):
+        wait_for_resource_state(value[1], constants.STATUS_BOUND, pvc_timeout)
+        return value
+
+    def new_pod(value):
+        (_, interface, access_mode), pvc_obj = value
+        raw_block_pv = is_raw_block(interface, access_mode)
+        pod_obj = create_pod(
+            interface_type=interface, pvc_name=pvc_obj.name,
+            namespace=namespace, do_reload=False, raw_block_pv=raw_block_pv,
+            pod_dict_path=(
+                constants.CSI_RBD_RAW_BLOCK_POD_YAML if raw_block_pv else None
+            )
+        )
+        return pvc_obj, pod_obj
+
+    def pod_running(value):
+        wait_for_resource_state(value[1], constants.STATUS_RUNNING, pod_timeout)
+        return value
+
+    lifecycle = Pipeline([
+        Stage('PVC created', new_pvc, create_concurrency),
+        Stage('PVC Bound', pvc_bound, wait_concurrency),
+        Stage('pod created', new_pod, create_concurrency),
+        Stage('pod Running', pod_running, wait_concurrency),
+    ], name='PVC and pod lifecycle')
+    results = lifecycle.run(pvc_specs)
+    failed = [result for result in results if result.error]
+    assert not failed, (
+        f"{len(failed)} of {len(results)} PVCs and pods failed:\n"
+        + '\n'.join(
+            f"{result.failed_stage}: {result.error}" for result in failed
+        )
+    )
+    pvc_objs = [result.value[0] for result in results]
+    pod_objs = [result.value[1] for result in results]
+    return pvc_objs, pod_objs
+
+
+def create_scale_pvcs_and_pods(
+    rbd_sc_obj, cephfs_sc_obj, namespace, number_of_pvc, size
+):
+    """
+    Create RWO and RWX PVCs of both interfaces with a pod on every one of
+    them by create_pvcs_and_pods_pipelined(), as used by the PV scale tests
+
+    Args:
+        rbd_sc_obj (OCS): rbd storageclass object
+        cephfs_sc_obj (OCS): cephfs storageclass object
+        namespace (str): The namespace for creating the PVCs and pods
+        number_of_pvc (int): pvc count to be created for each type
+        size (str): size of each pvc to be created eg: '10Gi'
+
+    Returns:
+        tuple: The PVC objects, the pods with a filesystem volume and the
+            pods with a raw block volume (RBD RWX)
+    """
+    pvc_specs = [
+        (sc_obj, interface, access_mode)
+        for sc_obj, interface in (
+            (cephfs_sc_obj, constants.CEPHFILESYSTEM),
+            (rbd_sc_obj, constants.CEPHBLOCKPOOL),
+        )
+        for access_mode in (
+            constants.ACCESS_MODE_RWO, constants.ACCESS_MODE_RWX
+        )
+        for _ in range(number_of_pvc)
+    ]
+    pvc_objs, pod_objs = create_pvcs_and_pods_pipelined(
+        pvc_specs, namespace, size
+    )
+    fs_pod_objs, block_pod_objs = ([] for i in range(2))
+    for (_, interface, access_mode), pod_obj in zip(pvc_specs, pod_objs):
+        if (
+            interface == constants.CEPHBLOCKPOOL
+            and access_mode == constants.ACCESS_MODE_RWX
+        ):
+            block_pod_objs.append(pod_obj)
+        else:
+            fs_pod_objs.append(pod_obj)
+    return pvc_objs, fs_pod_objs, block_pod_objs
+
+
+def create_warm_pod(sc_obj, namespace, interface):
+    """
+    Create a PVC and a pod on it and wait for them to be Bound and Running,
+    the resource provisioned by the warm pool of pod_factory
+
+    Args:
+        sc_obj (OCS): The storage class object of the PVC
+        namespace (str): The namespace for creating the PVC and pod
+        interface (str): CephBlockPool or CephFileSystem
+
+    Returns:
+        Pod: The Running pod, with the PVC set as its 'pvc' attribute
+    """
+    pvc_obj = create_pvc(
+        sc_name=sc_obj.name, namespace=namespace, do_reload=False
+    )
+    wait_for_resource_state(pvc_obj, constants.STATUS_BOUND)
+    pvc_obj.storageclass = sc_obj
+    pvc_obj.access_mode = constants.ACCESS_MODE_RWO
+    pod_obj = create_pod(
+        interface_type=interface, pvc_name=pvc_obj.name, namespace=namespace,
+        do_reload=False
+    )
+    wait_for_resource_state(pod_obj, constants.STATUS_RUNNING)
+    pod_obj.reload()
+    pod_obj.pvc = pvc_obj
+    return pod_obj
+
+
+def recycle_warm_pod(pod_obj):
+    """
+    Make the pod returned to the warm pool ready for the next test: check
+    it's still Running and wipe its volume. A new Pod and PVC objects are
+    returned, so nothing the test set on them leaks to the next test.
+
+    Args:
+        pod_obj (Pod): The pod created by create_warm_pod()
+
+    Returns:
+        Pod: The new object of the pod, with the PVC set as its 'pvc'
+            attribute
+
+    Raises:
+        ResourceWrongStatusException: In case the pod isn't Running
+        CommandFailed: In case the volume can't be wiped
+    """
+    if pod_obj.is_deleted or pod_obj.pvc.is_deleted:
+        raise ResourceWrongStatusException(pod_obj.name, 'deleted by the test')
+    wait_for_resource_state(pod_obj, constants.STATUS_RUNNING, timeout=10)
+    mount_path = pod_obj.get_storage_path()
+    pod_obj.exec_cmd_on_pod(
+        f"bash -c \"rm -rf {mount_path}/* {mount_path}/.[!.]*\"",
+        out_yaml_format=False
+    )
+    recycled_pvc = pvc.PVC(**pod_obj.pvc.get())
+    recycled_pvc.storageclass = pod_obj.pvc.storageclass
+    recycled_pvc.access_mode = pod_obj.pvc.access_mode
+    recycled_pod = pod.Pod(**pod_obj.get())
+    recycled_pod.pvc = recycled_pvc
+    return recycled_pod
+
+
+def delete_warm_pods(pod_objs):
+    """
+    Delete the pods of the warm pool and their PVCs
+
+    Args:
+        pod_objs (list): The pods created by create_warm_pod()
+    """
+    ocs.delete_many(pod_objs)
+    ocs.delete_many([pod_obj.pvc for pod_obj in pod_objs])
+
+
 def delete_objs_parallel(obj_list):
     """
-    Function to delete objs specified in list
+    Function to delete objs specified in list, the objects of the same kind
+    are deleted at once and waited for together
     Args:
         obj_list(list): List can be obj of pod, pvc, etc
 
@@ -1247,10 +1538,7 @@ def delete_objs_parallel(obj_list):
         bool: True if obj deleted else False
 
     """
-    with ThreadPoolExecutor() as p:
-        for obj in obj_list:
-            p.submit(obj.delete)
-    return True
+    return ocs.delete_many(obj_list)
 
 
 def memory_leak_analysis(median_dict):
@@ -7,6 +7,7 @@ from ocs_ci.ocs.exceptions import CommandFailed
 from ocs_ci.ocs.resources.pod import get_all_pods
 from ocs_ci.framework.testlib import tier4, ignore_leftovers, ManageTest
 from tests.sanity_helpers import Sanity
+from ocs_ci.utility import memoization
 from tests.helpers import wait_for_resource_count_change, get_admin_key
 
 logger = logging.getLogger(__name__)
@@ -89,6 +90,7 @@ class TestDetachAttachWorkerVolume(ManageTest):
                     namespace=config.ENV_DATA['cluster_namespace'], timeout=120,
                     selector='app=rook-ceph-tools'
                 )
+                memoization.invalidate(memoization.TOOLBOX)
             else:
                 raise
         finally:
@@ -85,11 +85,9 @@ class TestRWXMountPoint(ManageTest):
             pod.get_fio_rw_iops(pod_obj)
 
         # Calculate md5sum of each file
-        md5sum_pod_data = []
-        for pod_obj in pod_list:
-            md5sum_pod_data.append(pod.cal_md5sum(
-                pod_obj=pod_obj, file_name=pod_obj.name
-            ))
+        md5sum_pod_data = pod.cal_md5sum_on_pods(
+            pod_objs=pod_list, file_name=lambda pod_obj: pod_obj.name
+        )
 
         # Delete all but the last app pod.
         for index in range(node_count - 1):